@@ -0,0 +1,80 @@
+#############################################################################
+# Copyright (c) 2020 by R. Patrick Xian
+# Distributed under the MIT License
+#############################################################################
+
+"""Benchmark of incremental DynamicTree updates against rebuilding an
+index each frame, for a scene of polygons moving by small steps.
+
+Usage: python bench/dynamic_index.py [polygon_count] [frame_count]
+"""
+
+import sys
+import time
+import random
+import planar2 as planar
+
+
+def make_scene(count, seed=0):
+    rng = random.Random(seed)
+    polygons = []
+    for i in range(count):
+        poly = planar.Polygon.regular(
+            rng.randint(3, 8), radius=rng.uniform(0.5, 2.0),
+            center=(rng.uniform(0, 1000), rng.uniform(0, 1000)))
+        polygons.append(poly)
+    velocities = [(rng.uniform(-0.2, 0.2), rng.uniform(-0.2, 0.2)) 
+        for i in range(count)]
+    return polygons, velocities
+
+
+def step(polygons, velocities):
+    for poly, velocity in zip(polygons, velocities):
+        poly *= planar.Affine.translation(velocity)
+
+
+def bench_incremental(polygons, velocities, frames, margin):
+    tree = planar.DynamicTree(polygons, margin=margin)
+    reinserted = 0
+    start = time.perf_counter()
+    for frame in range(frames):
+        step(polygons, velocities)
+        for handle, poly in enumerate(polygons):
+            reinserted += tree.update(handle, poly)
+    return time.perf_counter() - start, reinserted
+
+
+def bench_rebuild(polygons, velocities, frames, index_type):
+    start = time.perf_counter()
+    for frame in range(frames):
+        step(polygons, velocities)
+        index_type(polygons)
+    return time.perf_counter() - start
+
+
+def main(count=5000, frames=20):
+    polygons, velocities = make_scene(count)
+    start = time.perf_counter()
+    for frame in range(frames):
+        step(polygons, velocities)
+    step_time = time.perf_counter() - start
+    print("%d polygons, %d frames, moving the polygons: %.3fs" 
+        % (count, frames, step_time))
+    for margin in (0.0, 0.5, 2.0):
+        polygons, velocities = make_scene(count)
+        elapsed, reinserted = bench_incremental(
+            polygons, velocities, frames, margin)
+        print("DynamicTree.update, margin %.1f: %.3fs (%d reinsertions)" 
+            % (margin, elapsed - step_time, reinserted))
+    polygons, velocities = make_scene(count)
+    print("DynamicTree rebuild: %.3fs" % (bench_rebuild(
+        polygons, velocities, frames, planar.DynamicTree) - step_time))
+    polygons, velocities = make_scene(count)
+    print("RTree rebuild: %.3fs" % (bench_rebuild(
+        polygons, velocities, frames, planar.RTree) - step_time))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
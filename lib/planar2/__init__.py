@@ -34,8 +34,10 @@
 
 __all__ = ('TransformNotInvertibleError', 'set_epsilon', 
     'Vec2', 'Point', 'Vec2Array', 'Seq2', 
-    'Line', 'Ray', 'LineSegment',
-    'Affine', 'BoundingBox', 'Polygon')
+    'Line', 'LineArray', 'Ray', 'LineSegment', 'LineSegmentArray',
+    'Affine', 'AffineArray', 'BoundingBox', 'BoundingBoxArray', 'Polygon', 
+    'RTree', 'SegmentIndex', 'PolygonIndex', 'KDTree', 'HashGrid', 
+    'DynamicTree', 'SweepAndPrune')
 
 __versioninfo__ = (0, 4, 1)
 __version__ = '.'.join(str(n) for n in __versioninfo__)
@@ -61,6 +63,14 @@ except ImportError: # pragma: no cover
 
     __implementation__ = 'Python'
 
+from planar2.transform import AffineArray
+from planar2.line import LineArray, LineSegmentArray
+from planar2.box import BoundingBoxArray
+from planar2.index import (RTree, SegmentIndex, PolygonIndex, KDTree, 
+    HashGrid, DynamicTree)
+from planar2.broadphase import SweepAndPrune
+from planar2 import overlay
+from planar2 import simplify
 from planar2 import mask
 
 Point = Vec2
@@ -28,6 +28,7 @@
 
 
 import math
+import numpy as np
 import planar2 as planar
 from planar2.util import cached_property
 
@@ -45,6 +46,14 @@ class BoundingBox(object):
         self._init_min_max(points)
     
     def _init_min_max(self, points):
+        if isinstance(points, np.ndarray):
+            # Reduce the coordinate buffer in one pass
+            points = points.reshape((-1, 2))
+            if not len(points):
+                raise ValueError("BoundingBox() requires at least one point")
+            self._min = planar.Vec2(*points.min(axis=0).tolist())
+            self._max = planar.Vec2(*points.max(axis=0).tolist())
+            return
         points = iter(points)
         try:
             min_x, min_y = max_x, max_y = next(points)
@@ -107,6 +116,8 @@ class BoundingBox(object):
     @classmethod
     def from_points(cls, points):
         """Create a bounding box that encloses all of the specified points.
+        The points may also be given as an array of shape ``(N, 2)``, which
+        is reduced in a single vectorized pass.
         """
         box = object.__new__(cls)
         box._init_min_max(points)
@@ -154,12 +165,12 @@ class BoundingBox(object):
         :type height: float
         """
         cx, cy = center
-        half_w = width * 0.5
-        half_h = height * 0.5
-        return cls.from_points([
-            (cx - half_w, cy - half_h),
-            (cx + half_w, cy + half_h),
-            ])
+        half_w = abs(width * 0.5)
+        half_h = abs(height * 0.5)
+        box = object.__new__(cls)
+        box._min = planar.Vec2(cx - half_w, cy - half_h)
+        box._max = planar.Vec2(cx + half_w, cy + half_h)
+        return box
     
     def inflate(self, amount):
         """Return a new box resized from this one. The new
@@ -177,8 +188,16 @@ class BoundingBox(object):
             dx, dy = amount
         except (TypeError, ValueError):
             dx = dy = amount * 1.0
-        dv = planar.Vec2(dx, dy) / 2.0
-        return self.from_points((self._min - dv, self._max + dv))
+        dx *= 0.5
+        dy *= 0.5
+        min_x, min_y = self._min
+        max_x, max_y = self._max
+        min_x, max_x = min_x - dx, max_x + dx
+        min_y, max_y = min_y - dy, max_y + dy
+        box = object.__new__(self.__class__)
+        box._min = planar.Vec2(min(min_x, max_x), min(min_y, max_y))
+        box._max = planar.Vec2(max(min_x, max_x), max(min_y, max_y))
+        return box
     
     def contains_point(self, point):
         """Return True if the box contains the specified point.
@@ -191,6 +210,17 @@ class BoundingBox(object):
         return (self._min.x <= x < self._max.x 
             and self._min.y < y <= self._max.y)
     
+    def intersects(self, other):
+        """Return True if this box overlaps another. Boxes that touch
+        are considered overlapping.
+
+        :param other: A bounding box, or a shape with a bounding box.
+        :rtype: bool
+        """
+        other = other.bounding_box
+        return (self._min.x <= other._max.x and other._min.x <= self._max.x
+            and self._min.y <= other._max.y and other._min.y <= self._max.y)
+
     def fit(self, shape):
         """Create a new shape by translating and scaling shape so that
         it fits in this bounding box. The shape is scaled evenly so that
@@ -250,8 +280,12 @@ class BoundingBox(object):
         except AttributeError:
             return NotImplemented
         if rectilinear:
+            apply = getattr(other, '_point_kernel', None)
+            if apply is None:
+                return self.from_points(
+                    [self._min * other, self._max * other])
             return self.from_points(
-                [self._min * other, self._max * other])
+                [apply(*self._min), apply(*self._max)])
         else:
             p = self.to_polygon()
             p *= other
@@ -260,5 +294,202 @@ class BoundingBox(object):
     __rmul__ = __mul__
 
 
+class BoundingBoxArray(object):
+    """Array of bounding boxes stored as columns for batch operations.
+    The minimum and maximum corners of the boxes are each held in a single
+    array, and the query methods are evaluated for all boxes at once.
+
+    As with :class:`~planar.LineSegmentArray`, the point query methods 
+    accept a single point, which is tested against every box, or an array
+    of points which is broadcast against the boxes. An array of shape 
+    ``(M, 1, 2)`` tests every point against every box, giving results of 
+    shape ``(M, N)``.
+
+    :param boxes: Iterable of :class:`~planar.BoundingBox` objects.
+    """
+
+    def __init__(self, boxes=()):
+        bounds = [tuple(box.min_point) + tuple(box.max_point) 
+            for box in boxes]
+        self._init_columns(np.array(bounds, dtype=float).reshape((-1, 4)))
+
+    def _init_columns(self, bounds):
+        self._bounds = bounds
+        self._min = bounds[:, :2]
+        self._max = bounds[:, 2:]
+
+    @classmethod
+    def _from_bounds(cls, bounds):
+        array = cls.__new__(cls)
+        array._init_columns(bounds)
+        return array
+
+    @classmethod
+    def from_min_max(cls, min_points, max_points):
+        """Create an array of boxes from arrays of their corner points.
+        The corners may be given in any order.
+
+        :param min_points: Minimum corner points, shape ``(N, 2)``.
+        :param max_points: Maximum corner points, shape ``(N, 2)``.
+        :rtype: BoundingBoxArray
+        """
+        min_points = np.asarray(min_points, dtype=float).reshape((-1, 2))
+        max_points = np.asarray(max_points, dtype=float).reshape((-1, 2))
+        if min_points.shape != max_points.shape:
+            raise ValueError(
+                "expected the same number of minimum and maximum points")
+        return cls._from_bounds(np.hstack((np.minimum(min_points, max_points),
+            np.maximum(min_points, max_points))))
+
+    @classmethod
+    def from_shapes(cls, shapes):
+        """Create an array of the bounding boxes of the shapes provided.
+        Arrays of shapes with a ``bounds`` array, such as 
+        :class:`~planar.LineSegmentArray`, are converted directly.
+
+        :param shapes: Iterable of shapes with a bounding box, or an
+            array of shapes.
+        :rtype: BoundingBoxArray
+        """
+        bounds = getattr(shapes, 'bounds', None)
+        if bounds is not None:
+            return cls._from_bounds(
+                np.array(bounds, dtype=float).reshape((-1, 4)))
+        return cls(shape.bounding_box for shape in shapes)
+
+    def to_boxes(self):
+        """Return the boxes as a list of :class:`~planar.BoundingBox`
+        objects.
+        """
+        return [_new_box(min_x, min_y, max_x, max_y) 
+            for min_x, min_y, max_x, max_y in self._bounds.tolist()]
+
+    @property
+    def bounds(self):
+        """The boxes as an array of shape ``(N, 4)``, each row holding
+        ``(min_x, min_y, max_x, max_y)``.
+        """
+        return self._bounds
+
+    @property
+    def min_points(self):
+        """The minimum corner points of the boxes, shape ``(N, 2)``."""
+        return self._min
+
+    @property
+    def max_points(self):
+        """The maximum corner points of the boxes, shape ``(N, 2)``."""
+        return self._max
+
+    @property
+    def widths(self):
+        """The widths of the boxes, shape ``(N,)``."""
+        return self._max[:, 0] - self._min[:, 0]
+
+    @property
+    def heights(self):
+        """The heights of the boxes, shape ``(N,)``."""
+        return self._max[:, 1] - self._min[:, 1]
+
+    @property
+    def centers(self):
+        """The center points of the boxes, shape ``(N, 2)``."""
+        return (self._min + self._max) / 2.0
+
+    def __len__(self):
+        return len(self._bounds)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return _new_box(*self._bounds[index].tolist())
+        return self._from_bounds(self._bounds[index])
+
+    def __iter__(self):
+        return iter(self.to_boxes())
+
+    def __repr__(self):
+        """Precise string representation."""
+        return "%s([%s])" % (self.__class__.__name__, 
+            ', '.join(repr(box) for box in self))
+
+    __str__ = __repr__
+
+    def contains_point(self, points):
+        """Return a boolean array flagging the points contained in the
+        boxes, consistent with :meth:`BoundingBox.contains_point`.
+        """
+        points = np.asarray(points, dtype=float)
+        x = points[..., 0]
+        y = points[..., 1]
+        return ((self._min[:, 0] <= x) & (x < self._max[:, 0])
+            & (self._min[:, 1] < y) & (y <= self._max[:, 1]))
+
+    def intersects(self, other):
+        """Return a boolean array flagging the boxes that overlap another
+        box, consistent with :meth:`BoundingBox.intersects`.
+
+        :param other: A bounding box, or a shape with a bounding box.
+        """
+        other = other.bounding_box
+        min_x, min_y = other.min_point
+        max_x, max_y = other.max_point
+        return ((self._min[:, 0] <= max_x) & (self._max[:, 0] >= min_x)
+            & (self._min[:, 1] <= max_y) & (self._max[:, 1] >= min_y))
+
+    def intersects_pairs(self, other=None):
+        """Find all pairs of overlapping boxes between this array and
+        another, using a packed R-tree over the other array.
+
+        :param other: The boxes to test against, or None to find the
+            overlapping pairs among the boxes of this array, each
+            reported once with the lower index first.
+        :type other: BoundingBoxArray
+        :return: Pair of arrays ``(indices, other_indices)``, where box
+            ``indices[k]`` of this array overlaps box ``other_indices[k]``
+            of the other array, sorted by index.
+        """
+        others = self if other is None else other
+        tree = planar.index._PackedTree(others.bounds)
+        indices, other_indices = tree.query_bounds(self._bounds)
+        if other is None:
+            lower = indices < other_indices
+            indices = indices[lower]
+            other_indices = other_indices[lower]
+        order = np.lexsort((other_indices, indices))
+        return indices[order], other_indices[order]
+
+    def union(self):
+        """Return the :class:`~planar.BoundingBox` enclosing all of the 
+        boxes.
+        """
+        if not len(self):
+            raise ValueError(
+                "BoundingBoxArray.union(): requires at least one box")
+        min_x, min_y = self._min.min(axis=0).tolist()
+        max_x, max_y = self._max.max(axis=0).tolist()
+        return _new_box(min_x, min_y, max_x, max_y)
+
+    def intersection(self):
+        """Return the :class:`~planar.BoundingBox` common to all of the
+        boxes, or None if they do not all overlap.
+        """
+        if not len(self):
+            raise ValueError(
+                "BoundingBoxArray.intersection(): requires at least one box")
+        min_x, min_y = self._min.max(axis=0).tolist()
+        max_x, max_y = self._max.min(axis=0).tolist()
+        if min_x > max_x or min_y > max_y:
+            return None
+        return _new_box(min_x, min_y, max_x, max_y)
+
+
+def _new_box(min_x, min_y, max_x, max_y):
+    """Create a bounding box directly from its corner coordinates."""
+    box = object.__new__(BoundingBox)
+    box._min = planar.Vec2(min_x, min_y)
+    box._max = planar.Vec2(max_x, max_y)
+    return box
+
+
 # vim: ai ts=4 sts=4 et sw=4 tw=78
 
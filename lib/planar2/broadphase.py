@@ -0,0 +1,142 @@
+#############################################################################
+# Copyright (c) 2020 by R. Patrick Xian
+# Distributed under the MIT License
+#############################################################################
+
+
+"""Broad phase detection of overlapping bounding boxes"""
+
+import numpy as np
+import planar2 as planar
+
+
+class SweepAndPrune(object):
+    """Broad phase for finding the overlapping pairs among a collection of
+    bounding boxes, using sort and sweep. The boxes are kept sorted by
+    their minimum x coordinate, so that the boxes overlapping each box
+    along the x axis are the boxes that follow it in order up to its
+    maximum x coordinate. These candidates are then filtered along the y
+    axis.
+
+    The sort order is kept between queries. When the boxes are updated,
+    for example once per frame of a simulation, the order is usually
+    nearly sorted still, and is re-sorted with an adaptive sort which
+    takes close to linear time in that case, rather than from scratch.
+
+    :param shapes: Iterable of :class:`~planar.BoundingBox` objects, or
+        shapes with a bounding box, or a :class:`~planar.BoundingBoxArray`.
+    """
+
+    def __init__(self, shapes=()):
+        self._bounds = _shape_bounds(shapes)
+        self._order = np.argsort(self._bounds[:, 0], kind='stable')
+        self._sorted = True
+
+    @property
+    def bounds(self):
+        """The boxes as an array of shape ``(N, 4)``, each row holding
+        ``(min_x, min_y, max_x, max_y)``. Do not modify it directly, use
+        :meth:`update` or :meth:`update_all` instead.
+        """
+        return self._bounds
+
+    def __len__(self):
+        return len(self._bounds)
+
+    def add(self, shape):
+        """Add a box to the broad phase.
+
+        :param shape: A bounding box, or a shape with a bounding box.
+        :return: The index of the new box.
+        """
+        index = len(self._bounds)
+        self._bounds = np.vstack((self._bounds, _shape_bounds([shape])))
+        self._order = np.append(self._order, index)
+        self._sorted = False
+        return index
+
+    def update(self, index, shape):
+        """Replace a single box.
+
+        :param index: The index of the box to replace.
+        :param shape: A bounding box, or a shape with a bounding box.
+        """
+        self._bounds[index] = _shape_bounds([shape])[0]
+        self._sorted = False
+
+    def update_all(self, shapes):
+        """Replace all of the boxes, keeping their number the same.
+
+        :param shapes: Iterable of bounding boxes, or shapes with a
+            bounding box, or a :class:`~planar.BoundingBoxArray`.
+        """
+        bounds = _shape_bounds(shapes)
+        if bounds.shape != self._bounds.shape:
+            raise ValueError("expected %d boxes, got %d"
+                % (len(self._bounds), len(bounds)))
+        self._bounds = bounds
+        self._sorted = False
+
+    def _sort(self):
+        """Re-sort the boxes by their minimum x coordinate, starting from
+        the previous order.
+        """
+        if not self._sorted:
+            order = self._order
+            self._order = order[np.argsort(
+                self._bounds[order, 0], kind='stable')]
+            self._sorted = True
+
+    def pairs(self):
+        """Find all pairs of overlapping boxes. Boxes that touch are
+        considered overlapping, consistent with
+        :meth:`BoundingBox.intersects`.
+
+        :return: Pair of arrays ``(indices, other_indices)``, where box
+            ``indices[k]`` overlaps box ``other_indices[k]``, and
+            ``indices[k] < other_indices[k]``, sorted by index.
+        """
+        self._sort()
+        order = self._order
+        bounds = self._bounds[order]
+        # Each box overlaps the boxes after it in order along the
+        # x axis, up to the last box starting before it ends
+        ends = np.searchsorted(bounds[:, 0], bounds[:, 2], side='right')
+        positions = np.arange(len(order))
+        counts = np.maximum(ends - positions - 1, 0)
+        # Sweep in chunks of boxes with a bounded number of candidate
+        # pairs, to bound the memory used by the candidate arrays
+        totals = np.cumsum(counts)
+        stops = np.searchsorted(totals, np.arange(
+            _SWEEP_CHUNK_SIZE, totals[-1] if len(totals) else 0, 
+            _SWEEP_CHUNK_SIZE), side='right')
+        all_first = []
+        all_second = []
+        for start, stop in zip(np.append(0, stops + 1), 
+                np.append(stops + 1, len(order))):
+            chunk_counts = counts[start:stop]
+            first = np.repeat(positions[start:stop], chunk_counts)
+            second = np.arange(len(first)) - np.repeat(
+                np.cumsum(chunk_counts) - chunk_counts, chunk_counts
+                ) + first + 1
+            overlap = ((bounds[first, 1] <= bounds[second, 3])
+                & (bounds[second, 1] <= bounds[first, 3]))
+            all_first.append(order[first[overlap]])
+            all_second.append(order[second[overlap]])
+        first = np.concatenate(all_first)
+        second = np.concatenate(all_second)
+        indices = np.minimum(first, second)
+        other_indices = np.maximum(first, second)
+        order = np.lexsort((other_indices, indices))
+        return indices[order], other_indices[order]
+
+
+_SWEEP_CHUNK_SIZE = 1 << 20
+
+
+def _shape_bounds(shapes):
+    """Return the bounds array of the bounding boxes of the shapes."""
+    return planar.BoundingBoxArray.from_shapes(shapes).bounds
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
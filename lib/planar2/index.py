@@ -0,0 +1,1313 @@
+#############################################################################
+# Copyright (c) 2020 by R. Patrick Xian
+# Distributed under the MIT License
+#############################################################################
+
+
+"""Spatial indexes for accelerating queries over collections of shapes"""
+
+import math
+import numpy as np
+import planar2 as planar
+
+
+class _PackedTree(object):
+    """Static R-tree packed with the Sort-Tile-Recursive (STR) algorithm.
+
+    The tree is stored implicitly as one array of bounds per level, the
+    children of node ``i`` being the nodes ``i * node_size`` up to
+    ``(i + 1) * node_size`` of the level below. The leaf level holds the
+    bounds of the indexed items, in the order given by ``self.order``.
+    Queries are evaluated breadth-first for many queries at once, by
+    expanding arrays of (query, node) pairs one level at a time.
+
+    :param bounds: Item bounds as an array of shape ``(N, 4)``, each row
+        holding ``(min_x, min_y, max_x, max_y)``.
+    :param node_size: The maximum number of children per node.
+    :param order: Optional array giving the order of the items in the
+        leaf level, to pack the items in an order computed by the caller
+        instead of with STR.
+    """
+
+    def __init__(self, bounds, node_size=16, order=None):
+        bounds = np.asarray(bounds, dtype=float).reshape((-1, 4))
+        if node_size < 2:
+            raise ValueError("node_size must be >= 2")
+        self.node_size = node_size
+        if order is None:
+            count = len(bounds)
+            centers = (bounds[:, :2] + bounds[:, 2:]) * 0.5
+            leaf_count = -(-count // node_size)
+            slice_size = node_size * max(
+                int(math.ceil(math.sqrt(leaf_count))), 1)
+            slices = np.empty(count, dtype=np.intp)
+            slices[np.argsort(centers[:, 0], kind='stable')] = (
+                np.arange(count) // slice_size)
+            order = np.lexsort((centers[:, 1], slices))
+        self.order = order
+        level = bounds[self.order]
+        self.levels = [level]
+        while len(level) > 1:
+            starts = np.arange(0, len(level), node_size)
+            level = np.hstack((
+                np.minimum.reduceat(level[:, :2], starts, axis=0),
+                np.maximum.reduceat(level[:, 2:], starts, axis=0)))
+            self.levels.append(level)
+
+    def __len__(self):
+        return len(self.order)
+
+    @property
+    def bounds(self):
+        """The bounds enclosing all items, or None if empty."""
+        if not len(self.order):
+            return None
+        return self.levels[-1][0]
+
+    def query(self, query_count, overlaps):
+        """Find the items that satisfy a predicate for many queries at once.
+
+        :param query_count: The number of queries.
+        :param overlaps: Function ``overlaps(query_indices, bounds)``
+            returning a boolean array flagging the bounds which may contain
+            results for the respective queries. It is applied to both node
+            and item bounds, so it must hold for a node whenever it holds
+            for any item below it.
+        :return: Pair of arrays of query indices and item indices.
+        """
+        empty = np.zeros(0, dtype=np.intp)
+        if not len(self.order) or not query_count:
+            return empty, empty
+        node_size = self.node_size
+        queries = np.arange(query_count)
+        nodes = np.zeros(query_count, dtype=np.intp)
+        keep = overlaps(queries, self.levels[-1][nodes])
+        queries = queries[keep]
+        nodes = nodes[keep]
+        for depth in range(len(self.levels) - 1, 0, -1):
+            child_level = self.levels[depth - 1]
+            children = (nodes[:, np.newaxis] * node_size
+                + np.arange(node_size)).ravel()
+            queries = np.repeat(queries, node_size)
+            valid = children < len(child_level)
+            children = children[valid]
+            queries = queries[valid]
+            keep = overlaps(queries, child_level[children])
+            queries = queries[keep]
+            nodes = children[keep]
+        return queries, self.order[nodes]
+
+    def query_bounds(self, query_bounds):
+        """Find the items with bounds overlapping each query bounds.
+        Bounds that touch are considered overlapping.
+
+        :param query_bounds: Array of shape ``(M, 4)``.
+        :return: Pair of arrays of query indices and item indices.
+        """
+        query_bounds = np.asarray(query_bounds, dtype=float).reshape((-1, 4))
+        def overlaps(queries, bounds):
+            q = query_bounds[queries]
+            return ((bounds[:, 0] <= q[:, 2]) & (bounds[:, 2] >= q[:, 0])
+                & (bounds[:, 1] <= q[:, 3]) & (bounds[:, 3] >= q[:, 1]))
+        return self.query(len(query_bounds), overlaps)
+
+    def query_rays(self, anchors, directions, max_distances):
+        """Find the items with bounds crossed by each ray, within the
+        ray's maximum distance. Bounds are padded by ``planar.EPSILON``
+        so that grazing rays are not missed.
+
+        :param anchors: Ray anchor points, shape ``(M, 2)``.
+        :param directions: Ray unit direction vectors, shape ``(M, 2)``.
+        :param max_distances: The maximum distance along each ray, 
+            shape ``(M,)``.
+        :return: Pair of arrays of ray indices and item indices.
+        """
+        def overlaps(rays, bounds):
+            near = np.zeros(len(rays))
+            far = max_distances[rays]
+            for axis in (0, 1):
+                origin = anchors[rays, axis]
+                direction = directions[rays, axis]
+                low = bounds[:, axis] - planar.EPSILON
+                high = bounds[:, axis + 2] + planar.EPSILON
+                parallel = direction == 0.0
+                inside = (origin >= low) & (origin <= high)
+                step = np.where(parallel, 1.0, direction)
+                t1 = (low - origin) / step
+                t2 = (high - origin) / step
+                near = np.maximum(near, np.where(parallel, 
+                    np.where(inside, -np.inf, np.inf), np.minimum(t1, t2)))
+                far = np.minimum(far, np.where(parallel, 
+                    np.where(inside, np.inf, -np.inf), np.maximum(t1, t2)))
+            return near <= far
+        return self.query(len(anchors), overlaps)
+
+    def nearest(self, points, k, distance):
+        """Find the k nearest items to each point.
+
+        The search expands a square window around each point until it
+        contains at least k items within the window's inner radius, so
+        that no item outside of the window can be nearer.
+
+        :param points: Array of shape ``(M, 2)``.
+        :param k: The number of nearest items to find for each point.
+        :param distance: Function ``distance(point_indices, items)``
+            returning the exact distances between the respective points
+            and items. Each item's distance must be no less than the
+            distance from the point to the item's bounds.
+        :return: Pair of arrays of shape ``(M, k)`` containing the item
+            indices and distances, nearest first. If there are fewer than
+            k items, the remaining entries are -1 and infinity respectively.
+            Points with NaN or infinite coordinates have no nearest items.
+        """
+        points = np.asarray(points, dtype=float).reshape((-1, 2))
+        count = len(points)
+        indices = np.full((count, k), -1, dtype=np.intp)
+        distances = np.full((count, k), np.inf)
+        item_count = len(self.order)
+        found = min(k, item_count)
+        if not found or not count:
+            return indices, distances
+        root = self.levels[-1][0]
+        # Start with a window that reaches the items and would
+        # contain about k items for uniformly distributed items
+        outside = np.hypot(
+            np.maximum(np.maximum(root[0] - points[:, 0],
+                points[:, 0] - root[2]), 0.0),
+            np.maximum(np.maximum(root[1] - points[:, 1],
+                points[:, 1] - root[3]), 0.0))
+        extent = max(root[2] - root[0], root[3] - root[1])
+        radius = outside + max(extent * math.sqrt(float(found) / item_count),
+            planar.EPSILON)
+        # Windows around points that are not finite would never close
+        pending = np.nonzero(np.isfinite(points).all(axis=1))[0]
+        while len(pending):
+            p = points[pending]
+            r = radius[pending]
+            queries, items = self.query_bounds(np.column_stack(
+                (p[:, 0] - r, p[:, 1] - r, p[:, 0] + r, p[:, 1] + r)))
+            item_dist = distance(pending[queries], items)
+            order = np.lexsort((item_dist, queries))
+            queries = queries[order]
+            items = items[order]
+            item_dist = item_dist[order]
+            candidates = np.bincount(queries, minlength=len(pending))
+            in_range = np.bincount(queries, weights=item_dist <= r[queries],
+                minlength=len(pending))
+            done = (in_range >= found) | (candidates == item_count)
+            group_start = np.cumsum(candidates) - candidates
+            rank = np.arange(len(queries)) - group_start[queries]
+            result = done[queries] & (rank < found)
+            rows = pending[queries[result]]
+            indices[rows, rank[result]] = items[result]
+            distances[rows, rank[result]] = item_dist[result]
+            radius[pending[~done]] *= 2.0
+            pending = pending[~done]
+        return indices, distances
+
+
+class RTree(object):
+    """Static spatial index over a collection of bounding boxes. The index
+    is an R-tree bulk loaded with the Sort-Tile-Recursive (STR) algorithm,
+    which packs the boxes into full nodes of nearby boxes.
+
+    The query methods return the indices of the boxes in the order that
+    they were given. Boxes that touch the query point or box are included
+    in the results, so that they can be used as candidates for exact tests
+    on the indexed shapes.
+
+    :param shapes: Iterable of :class:`~planar.BoundingBox` objects, or
+        shapes with a bounding box, or a :class:`~planar.BoundingBoxArray`.
+    :param node_size: The maximum number of children per tree node.
+    :type node_size: int
+    """
+
+    def __init__(self, shapes, node_size=16):
+        self._boxes = planar.BoundingBoxArray.from_shapes(shapes)
+        self._tree = _PackedTree(self._boxes.bounds, node_size)
+
+    @property
+    def boxes(self):
+        """The indexed boxes as a :class:`~planar.BoundingBoxArray`."""
+        return self._boxes
+
+    def __len__(self):
+        return len(self._boxes)
+
+    def query_point(self, point):
+        """Find the boxes containing or touching a point.
+
+        :param point: The query point.
+        :type point: :class:`~planar.Vec2`
+        :return: Sorted list of box indices.
+        """
+        queries, indices = self.query_points([point])
+        return indices.tolist()
+
+    def query_points(self, points):
+        """Find the boxes containing or touching each point in an array.
+
+        :param points: The query points, shape ``(M, 2)``.
+        :return: Pair of arrays ``(point_indices, indices)``, where point
+            ``point_indices[k]`` is in box ``indices[k]``, sorted by point
+            index, then box index.
+        """
+        points = np.asarray(points, dtype=float).reshape((-1, 2))
+        return _sorted_pairs(*self._tree.query_bounds(
+            np.hstack((points, points))))
+
+    def query_box(self, box):
+        """Find the boxes overlapping or touching a box.
+
+        :param box: A bounding box, or a shape with a bounding box.
+        :return: Sorted list of box indices.
+        """
+        box = box.bounding_box
+        queries, indices = self._tree.query_bounds(
+            [tuple(box.min_point) + tuple(box.max_point)])
+        return np.sort(indices).tolist()
+
+    def query_boxes(self, boxes):
+        """Find the boxes overlapping or touching each box in an array.
+
+        :param boxes: Iterable of bounding boxes, or shapes with a bounding
+            box, or a :class:`~planar.BoundingBoxArray`.
+        :return: Pair of arrays ``(query_indices, indices)``, where query
+            box ``query_indices[k]`` overlaps box ``indices[k]``, sorted by
+            query index, then box index.
+        """
+        boxes = planar.BoundingBoxArray.from_shapes(boxes)
+        return _sorted_pairs(*self._tree.query_bounds(boxes.bounds))
+
+    def nearest(self, point, k=1):
+        """Find the nearest boxes to a point.
+
+        :param point: The query point.
+        :type point: :class:`~planar.Vec2`
+        :param k: The number of nearest boxes to find.
+        :type k: int
+        :return: List of up to k ``(index, distance)`` tuples, nearest 
+            first. The distance is zero for boxes containing the point.
+        """
+        indices, distances = self.nearest_points([point], k)
+        return [(index, distance) for index, distance 
+            in zip(indices[0].tolist(), distances[0].tolist()) if index >= 0]
+
+    def nearest_points(self, points, k=1):
+        """Find the nearest boxes to each point in an array.
+
+        :param points: The query points, shape ``(M, 2)``.
+        :param k: The number of nearest boxes to find for each point.
+        :type k: int
+        :return: Pair of arrays ``(indices, distances)`` of shape 
+            ``(M, k)``, nearest first. If there are fewer than k boxes,
+            the remaining entries are -1 and infinity respectively, as
+            are all of the entries for points that are not finite.
+        """
+        points = np.asarray(points, dtype=float).reshape((-1, 2))
+        bounds = self._boxes.bounds
+        def distance(point_indices, items):
+            p = points[point_indices]
+            b = bounds[items]
+            return np.hypot(
+                np.maximum(np.maximum(b[:, 0] - p[:, 0], p[:, 0] - b[:, 2]),
+                    0.0),
+                np.maximum(np.maximum(b[:, 1] - p[:, 1], p[:, 1] - b[:, 3]),
+                    0.0))
+        return self._tree.nearest(points, k, distance)
+
+
+class SegmentIndex(object):
+    """Spatial index over a collection of line segments for nearest
+    segment queries and ray casting. The index is a packed R-tree built 
+    from the segment bounding boxes.
+
+    :param segments: A :class:`~planar.LineSegmentArray`, or an iterable
+        of :class:`~planar.LineSegment` objects.
+    :param node_size: The maximum number of children per tree node.
+    :type node_size: int
+    """
+
+    def __init__(self, segments, node_size=16):
+        if not isinstance(segments, planar.LineSegmentArray):
+            segments = planar.LineSegmentArray(segments)
+        self._segments = segments
+        self._tree = _PackedTree(segments.bounds, node_size)
+
+    @property
+    def segments(self):
+        """The indexed segments as a :class:`~planar.LineSegmentArray`."""
+        return self._segments
+
+    def __len__(self):
+        return len(self._segments)
+
+    def nearest(self, point, k=1):
+        """Find the nearest segments to a point.
+
+        :param point: The query point.
+        :type point: :class:`~planar.Vec2`
+        :param k: The number of nearest segments to find.
+        :type k: int
+        :return: List of up to k ``(index, distance, projection)`` tuples,
+            nearest first, where ``projection`` is the closest point on the
+            segment as computed by :meth:`LineSegment.project`.
+        """
+        indices, distances, projections = self.nearest_points([point], k)
+        return [(index, distance, planar.Vec2(*projection))
+            for index, distance, projection in zip(indices[0].tolist(),
+                distances[0].tolist(), projections[0].tolist())
+            if index >= 0]
+
+    def nearest_points(self, points, k=1):
+        """Find the nearest segments to each point in an array.
+
+        :param points: The query points, shape ``(M, 2)``.
+        :param k: The number of nearest segments to find for each point.
+        :type k: int
+        :return: Tuple of arrays ``(indices, distances, projections)`` of
+            shape ``(M, k)``, ``(M, k)`` and ``(M, k, 2)``, nearest first.
+            If there are fewer than k segments, the remaining entries are
+            -1, infinity and NaN respectively, as are all of the entries
+            for points that are not finite.
+        """
+        points = np.asarray(points, dtype=float).reshape((-1, 2))
+        segments = self._segments
+        def distance(point_indices, items):
+            return segments[items].distance_to(points[point_indices])
+        indices, distances = self._tree.nearest(points, k, distance)
+        projections = np.full(indices.shape + (2,), np.nan)
+        found = indices >= 0
+        rows = np.nonzero(found)[0]
+        projections[found] = segments[indices[found]].project(points[rows])
+        return indices, distances, projections
+
+    def cast(self, ray, max_distance=float('inf')):
+        """Cast a ray against the segments and find the first hit.
+
+        :param ray: The ray to cast.
+        :type ray: :class:`~planar.Ray`
+        :param max_distance: The maximum distance along the ray to
+            search for hits.
+        :type max_distance: float
+        :return: Tuple ``(index, distance, point)`` for the nearest segment
+            hit by the ray, or None if the ray does not hit any segment.
+        """
+        indices, distances, points = self.cast_rays(
+            [ray.anchor], [ray.direction], max_distance)
+        if indices[0] < 0:
+            return None
+        return (int(indices[0]), float(distances[0]), 
+            planar.Vec2(*points[0].tolist()))
+
+    def cast_all(self, ray, max_distance=float('inf')):
+        """Cast a ray against the segments and find all hits.
+
+        :param ray: The ray to cast.
+        :type ray: :class:`~planar.Ray`
+        :param max_distance: The maximum distance along the ray to
+            search for hits.
+        :type max_distance: float
+        :return: List of ``(index, distance, point)`` tuples for the
+            segments hit by the ray, nearest first.
+        """
+        rays, indices, distances, points = self.cast_rays_all(
+            [ray.anchor], [ray.direction], max_distance)
+        return [(index, distance, planar.Vec2(*point))
+            for index, distance, point in zip(indices.tolist(), 
+                distances.tolist(), points.tolist())]
+
+    def cast_rays(self, anchors, directions, max_distance=float('inf')):
+        """Cast an array of rays against the segments and find the first
+        hit for each ray.
+
+        :param anchors: The ray anchor points, shape ``(M, 2)``.
+        :param directions: The ray direction vectors, shape ``(M, 2)``.
+            Do not need to be unit-length, but must not be null.
+        :param max_distance: The maximum distance along the rays to
+            search for hits, a single value or one per ray.
+        :return: Tuple of arrays ``(indices, distances, points)`` of shape
+            ``(M,)``, ``(M,)`` and ``(M, 2)``. For rays that do not hit any
+            segment, or that are not finite, the entries are -1, infinity
+            and NaN respectively.
+        """
+        anchors, directions, max_distances = _ray_columns(
+            anchors, directions, max_distance)
+        count = len(anchors)
+        first_indices = np.full(count, -1, dtype=np.intp)
+        first_distances = np.full(count, np.inf)
+        points = np.full((count, 2), np.nan)
+        root = self._tree.bounds
+        if root is None:
+            return first_indices, first_distances, points
+        # Search increasing distances along the rays, until a hit is found
+        # or the ray leaves the bounds of the segments, so that distant
+        # segments are only tested for rays that miss the near ones
+        corners = root[[[0, 1], [0, 3], [2, 1], [2, 3]]]
+        limits = np.minimum(max_distances, np.max(np.hypot(
+            *(corners[:, np.newaxis] - anchors).transpose(2, 0, 1)), axis=0))
+        outside = np.hypot(
+            np.maximum(np.maximum(root[0] - anchors[:, 0],
+                anchors[:, 0] - root[2]), 0.0),
+            np.maximum(np.maximum(root[1] - anchors[:, 1],
+                anchors[:, 1] - root[3]), 0.0))
+        step = max(max(root[2] - root[0], root[3] - root[1]) 
+            / math.sqrt(len(self)), planar.EPSILON)
+        radius = np.minimum(outside + step, limits)
+        # Rays that are not finite would never reach their limit
+        pending = np.nonzero(np.isfinite(anchors).all(axis=1)
+            & np.isfinite(directions).all(axis=1))[0]
+        while len(pending):
+            rays, indices, distances = self._cast(anchors[pending], 
+                directions[pending], radius[pending])
+            # Hits are sorted by ray, then distance
+            first = np.ones(len(rays), dtype=bool)
+            first[1:] = rays[1:] != rays[:-1]
+            hit = pending[rays[first]]
+            first_indices[hit] = indices[first]
+            first_distances[hit] = distances[first]
+            done = first_indices[pending] >= 0
+            done |= radius[pending] >= limits[pending]
+            pending = pending[~done]
+            radius[pending] = np.minimum(radius[pending] * 2.0, 
+                limits[pending])
+        hit = first_indices >= 0
+        points[hit] = anchors[hit] + directions[hit] * first_distances[
+            hit, np.newaxis]
+        return first_indices, first_distances, points
+
+    def cast_rays_all(self, anchors, directions, max_distance=float('inf')):
+        """Cast an array of rays against the segments and find all hits.
+
+        :param anchors: The ray anchor points, shape ``(M, 2)``.
+        :param directions: The ray direction vectors, shape ``(M, 2)``.
+            Do not need to be unit-length, but must not be null.
+        :param max_distance: The maximum distance along the rays to
+            search for hits, a single value or one per ray.
+        :return: Tuple of arrays ``(rays, indices, distances, points)``, 
+            with one entry per hit giving the index of the ray, the index 
+            of the segment hit, the distance along the ray and the hit 
+            point. Hits are sorted by ray, then by distance.
+        """
+        anchors, directions, max_distances = _ray_columns(
+            anchors, directions, max_distance)
+        rays, indices, distances = self._cast(
+            anchors, directions, max_distances)
+        points = anchors[rays] + directions[rays] * distances[:, np.newaxis]
+        return rays, indices, distances, points
+
+    def _cast(self, anchors, directions, max_distances):
+        """Return the ray indices, segment indices and distances of
+        all hits, sorted by ray, then distance.
+        """
+        segments = self._segments
+        all_rays = []
+        all_indices = []
+        all_distances = []
+        # Cast the rays in chunks to bound the memory used by the
+        # candidate pairs of the tree traversal
+        for start in range(0, len(anchors), _RAY_CHUNK_SIZE):
+            chunk = slice(start, start + _RAY_CHUNK_SIZE)
+            rays, indices = self._tree.query_rays(
+                anchors[chunk], directions[chunk], max_distances[chunk])
+            rays += start
+            hit, distances = planar.line._intersect_columns(
+                anchors[rays], directions[rays], max_distances[rays],
+                segments.anchors[indices], segments.directions[indices],
+                segments.lengths[indices])
+            all_rays.append(rays[hit])
+            all_indices.append(indices[hit])
+            all_distances.append(np.maximum(distances[hit], 0.0))
+        if not all_rays:
+            empty = np.zeros(0, dtype=np.intp)
+            return empty, empty, np.zeros(0)
+        rays = np.concatenate(all_rays)
+        indices = np.concatenate(all_indices)
+        distances = np.concatenate(all_distances)
+        order = np.lexsort((indices, distances, rays))
+        return rays[order], indices[order], distances[order]
+
+
+_RAY_CHUNK_SIZE = 4096
+
+
+class PolygonIndex(object):
+    """Spatial index over a collection of polygons for point location.
+    The polygon bounding boxes are indexed in an :class:`RTree`, and the
+    exact :meth:`Polygon.contains_point` test is only run for the
+    polygons whose bounding box contains the point.
+
+    :param polygons: Iterable of :class:`~planar.Polygon` objects. 
+        The polygons should not be mutated while indexed.
+    :param node_size: The maximum number of children per tree node.
+    :type node_size: int
+    """
+
+    def __init__(self, polygons, node_size=16):
+        self._polygons = list(polygons)
+        self._tree = RTree(self._polygons, node_size)
+
+    @property
+    def polygons(self):
+        """The list of indexed polygons."""
+        return self._polygons
+
+    @property
+    def tree(self):
+        """The :class:`RTree` over the polygon bounding boxes."""
+        return self._tree
+
+    def __len__(self):
+        return len(self._polygons)
+
+    def locate_all(self, points):
+        """Find all of the polygons containing each point in an array.
+
+        :param points: The query points, shape ``(M, 2)``.
+        :return: Pair of arrays ``(point_indices, indices)``, where point
+            ``point_indices[k]`` is in polygon ``indices[k]``, sorted by
+            point index, then polygon index.
+        """
+        points = np.asarray(points, dtype=float).reshape((-1, 2))
+        point_indices, indices = self._tree.query_points(points)
+        polygons = self._polygons
+        Vec2 = planar.Vec2
+        inside = np.array([polygons[i].contains_point(Vec2(x, y)) 
+            for i, (x, y) in zip(indices.tolist(), 
+                points[point_indices].tolist())], dtype=bool)
+        return point_indices[inside], indices[inside]
+
+    def locate(self, points):
+        """Find the polygon containing each point in an array. Where
+        polygons overlap, the lowest index is returned.
+
+        :param points: The query points, shape ``(M, 2)``.
+        :return: Array of polygon indices of shape ``(M,)``, with -1 for
+            the points outside of all of the polygons.
+        """
+        points = np.asarray(points, dtype=float).reshape((-1, 2))
+        point_indices, indices = self.locate_all(points)
+        result = np.full(len(points), -1, dtype=np.intp)
+        # Pairs are sorted by point, then polygon index
+        first = np.ones(len(point_indices), dtype=bool)
+        first[1:] = point_indices[1:] != point_indices[:-1]
+        result[point_indices[first]] = indices[first]
+        return result
+
+
+class KDTree(object):
+    """Static spatial index over a collection of points, for nearest
+    neighbor, distance and box queries. The index is a balanced k-d tree,
+    built by recursively partitioning the points at the median coordinate
+    along the axis of their widest extent. The partitioning works in place
+    on a coordinate array, one level of the tree at a time, in O(n log n)
+    time overall.
+
+    The query methods return the indices of the points in the order that
+    they were given.
+
+    :param points: A :class:`~planar.Vec2Array`, or a sequence of points,
+        or an array of shape ``(N, 2)``.
+    """
+
+    def __init__(self, points):
+        if isinstance(points, planar.Seq2):
+            points = points._vectors
+        self._points = np.array(points, dtype=float).reshape((-1, 2))
+        self._points.flags.writeable = False
+        self._tree = _PackedTree(np.hstack((self._points, self._points)), 
+            2, _kd_order(self._points, _KD_LEAF_SIZE))
+
+    @property
+    def points(self):
+        """The indexed points as a read-only array of shape ``(N, 2)``."""
+        return self._points
+
+    def __len__(self):
+        return len(self._points)
+
+    def nearest(self, point, k=1):
+        """Find the nearest points to a point.
+
+        :param point: The query point.
+        :type point: :class:`~planar.Vec2`
+        :param k: The number of nearest points to find.
+        :type k: int
+        :return: List of up to k ``(index, distance)`` tuples, nearest 
+            first.
+        """
+        indices, distances = self.nearest_points([point], k)
+        return [(index, distance) for index, distance 
+            in zip(indices[0].tolist(), distances[0].tolist()) if index >= 0]
+
+    def nearest_points(self, points, k=1):
+        """Find the nearest indexed points to each point in an array.
+
+        :param points: The query points, shape ``(M, 2)``.
+        :param k: The number of nearest points to find for each point.
+        :type k: int
+        :return: Pair of arrays ``(indices, distances)`` of shape 
+            ``(M, k)``, nearest first. If there are fewer than k points,
+            the remaining entries are -1 and infinity respectively, as
+            are all of the entries for points that are not finite.
+        """
+        points = np.asarray(points, dtype=float).reshape((-1, 2))
+        indexed = self._points
+        def distance(point_indices, items):
+            delta = indexed[items] - points[point_indices]
+            return np.hypot(delta[:, 0], delta[:, 1])
+        return self._tree.nearest(points, k, distance)
+
+    def within_distance(self, point, distance):
+        """Find the points within a distance of a point, inclusive.
+
+        :param point: The query point.
+        :type point: :class:`~planar.Vec2`
+        :param distance: The maximum distance.
+        :type distance: float
+        :return: Sorted list of point indices.
+        """
+        queries, indices = self.within_distance_points([point], distance)
+        return indices.tolist()
+
+    def within_distance_points(self, points, distance):
+        """Find the indexed points within a distance of each point in an
+        array, inclusive.
+
+        :param points: The query points, shape ``(M, 2)``.
+        :param distance: The maximum distance, either a single value or
+            an array of shape ``(M,)`` with one distance per point.
+        :return: Pair of arrays ``(point_indices, indices)``, where point
+            ``point_indices[k]`` is within the distance of indexed point
+            ``indices[k]``, sorted by point index, then indexed point
+            index.
+        """
+        points = np.asarray(points, dtype=float).reshape((-1, 2))
+        distance = np.broadcast_to(
+            np.asarray(distance, dtype=float), (len(points),))
+        distance2 = distance * distance
+        def overlaps(queries, bounds):
+            p = points[queries]
+            dx = np.maximum(np.maximum(bounds[:, 0] - p[:, 0], 
+                p[:, 0] - bounds[:, 2]), 0.0)
+            dy = np.maximum(np.maximum(bounds[:, 1] - p[:, 1], 
+                p[:, 1] - bounds[:, 3]), 0.0)
+            return dx * dx + dy * dy <= distance2[queries]
+        return _sorted_pairs(*self._tree.query(len(points), overlaps))
+
+    def query_box(self, box):
+        """Find the points inside or on the edge of a box.
+
+        :param box: A bounding box, or a shape with a bounding box.
+        :return: Sorted list of point indices.
+        """
+        queries, indices = self.query_boxes([box])
+        return indices.tolist()
+
+    def query_boxes(self, boxes):
+        """Find the points inside or on the edge of each box in an array.
+
+        :param boxes: Iterable of bounding boxes, or shapes with a bounding
+            box, or a :class:`~planar.BoundingBoxArray`.
+        :return: Pair of arrays ``(box_indices, indices)``, where box
+            ``box_indices[k]`` contains point ``indices[k]``, sorted by 
+            box index, then point index.
+        """
+        boxes = planar.BoundingBoxArray.from_shapes(boxes)
+        return _sorted_pairs(*self._tree.query_bounds(boxes.bounds))
+
+
+class HashGrid(object):
+    """Uniform grid over a collection of points, for fixed distance
+    neighbor queries. The points are binned by grid cell in a single
+    batch, by sorting them by cell, and the points of each cell are found
+    from the cell offsets into the sorted order. Querying points within a
+    distance only visits the cells within that distance, so queries are
+    fastest when the distance is close to the cell size. 
+
+    The grid is cheap to build, and is intended to be rebuilt with 
+    :meth:`update` whenever the points move, for example on every frame 
+    of a particle simulation.
+
+    The query methods return the indices of the points in the order that
+    they were given. Points outside of the grid domain are binned in the
+    nearest border cell, so the queries are correct for any points, but
+    are slower if many of the points are outside of the domain.
+
+    :param points: A :class:`~planar.Vec2Array`, or a sequence of points,
+        or an array of shape ``(N, 2)``.
+    :param cell_size: The width and height of the grid cells.
+    :type cell_size: float
+    :param domain: The region covered by the grid as a 
+        :class:`~planar.BoundingBox`. If omitted, the bounding box of the 
+        points is used. The number of grid cells, and so the memory used,
+        is proportional to the domain area.
+    """
+
+    def __init__(self, points, cell_size, domain=None):
+        if not cell_size > 0:
+            raise ValueError("cell_size must be positive")
+        self._cell_size = float(cell_size)
+        self._domain = domain
+        self.update(points)
+
+    @property
+    def points(self):
+        """The binned points as a read-only array of shape ``(N, 2)``."""
+        return self._points
+
+    @property
+    def cell_size(self):
+        """The width and height of the grid cells."""
+        return self._cell_size
+
+    @property
+    def domain(self):
+        """The region covered by the grid, as a 
+        :class:`~planar.BoundingBox`.
+        """
+        return planar.BoundingBox([tuple(self._origin), 
+            tuple(self._origin + self._shape * self._cell_size)])
+
+    def __len__(self):
+        return len(self._points)
+
+    def update(self, points):
+        """Rebin the grid for new points. The number of points may
+        change. The grid domain given on construction is kept, otherwise 
+        the grid covers the bounding box of the new points.
+
+        :param points: A :class:`~planar.Vec2Array`, or a sequence of 
+            points, or an array of shape ``(N, 2)``.
+        """
+        if isinstance(points, planar.Seq2):
+            points = points._vectors
+        points = np.array(points, dtype=float).reshape((-1, 2))
+        points.flags.writeable = False
+        if self._domain is not None:
+            domain = self._domain.bounding_box
+            origin = np.array(domain.min_point, dtype=float)
+            extent = np.array(domain.max_point, dtype=float) - origin
+        elif len(points):
+            origin = points.min(axis=0)
+            extent = points.max(axis=0) - origin
+        else:
+            origin = extent = np.zeros(2)
+        shape = np.maximum(np.ceil(extent / self._cell_size), 1)
+        self._points = points
+        self._origin = origin
+        self._shape = shape
+        self._columns = int(shape[0])
+        cells = self._cells(points)
+        keys = cells[:, 1] * self._columns + cells[:, 0]
+        self._order = np.argsort(keys, kind='stable')
+        counts = np.bincount(keys, minlength=self._columns * int(shape[1]))
+        self._counts = counts
+        self._starts = np.cumsum(counts) - counts
+
+    def _cells(self, points):
+        """Return the column and row of the cells of the points, clamped
+        to the grid.
+        """
+        cells = np.floor((points - self._origin) / self._cell_size)
+        return np.clip(cells, 0, self._shape - 1).astype(np.intp)
+
+    def _reach(self, distance):
+        """Return the number of cells that a distance spans."""
+        if distance < 0:
+            raise ValueError("distance must not be negative")
+        return max(int(math.ceil(distance / self._cell_size)), 1)
+
+    def _neighbors(self, cells, dx, dy):
+        """Return the offsets into the sorted order and the number of
+        points of the cells at an offset from each cell, with a count of
+        zero where the offset cell is outside of the grid.
+        """
+        columns, rows = self._shape
+        x = cells[:, 0] + dx
+        y = cells[:, 1] + dy
+        inside = (x >= 0) & (x < columns) & (y >= 0) & (y < rows)
+        keys = np.where(inside, y * self._columns + x, 0)
+        return self._starts[keys], np.where(inside, self._counts[keys], 0)
+
+    def within_distance(self, point, distance):
+        """Find the points within a distance of a point, inclusive.
+
+        :param point: The query point.
+        :type point: :class:`~planar.Vec2`
+        :param distance: The maximum distance.
+        :type distance: float
+        :return: Sorted list of point indices.
+        """
+        queries, indices = self.within_distance_points([point], distance)
+        return indices.tolist()
+
+    def within_distance_points(self, points, distance):
+        """Find the binned points within a distance of each point in an 
+        array, inclusive.
+
+        :param points: The query points, shape ``(M, 2)``.
+        :param distance: The maximum distance.
+        :type distance: float
+        :return: Pair of arrays ``(point_indices, indices)``, where point
+            ``point_indices[k]`` is within the distance of binned point
+            ``indices[k]``, sorted by point index, then binned point index.
+        """
+        points = np.asarray(points, dtype=float).reshape((-1, 2))
+        reach = self._reach(distance)
+        cells = self._cells(points)
+        all_queries = []
+        all_indices = []
+        for dy in range(-reach, reach + 1):
+            for dx in range(-reach, reach + 1):
+                queries, positions = _expand_ranges(
+                    *self._neighbors(cells, dx, dy))
+                indices = self._order[positions]
+                delta = self._points[indices] - points[queries]
+                near = np.hypot(delta[:, 0], delta[:, 1]) <= distance
+                all_queries.append(queries[near])
+                all_indices.append(indices[near])
+        return _sorted_pairs(
+            np.concatenate(all_queries), np.concatenate(all_indices))
+
+    def pairs(self, distance):
+        """Find all pairs of binned points within a distance of each 
+        other, inclusive.
+
+        :param distance: The maximum distance.
+        :type distance: float
+        :return: Pair of arrays ``(indices, other_indices)``, where point
+            ``indices[k]`` is within the distance of point 
+            ``other_indices[k]``, and ``indices[k] < other_indices[k]``, 
+            sorted by index.
+        """
+        reach = self._reach(distance)
+        points = self._points
+        order = self._order
+        # Visit the cells in sorted order, so that the neighbors in each
+        # cell are found from the point's position in the order
+        cells = self._cells(points[order])
+        all_first = []
+        all_second = []
+        for dy in range(0, reach + 1):
+            for dx in range(-reach if dy else 0, reach + 1):
+                starts, counts = self._neighbors(cells, dx, dy)
+                if not dx and not dy:
+                    # Pair the points within a cell only once
+                    positions = np.arange(len(order))
+                    counts = starts + counts - positions - 1
+                    starts = positions + 1
+                first, second = _expand_ranges(starts, counts)
+                first = order[first]
+                second = order[second]
+                delta = points[first] - points[second]
+                near = np.hypot(delta[:, 0], delta[:, 1]) <= distance
+                all_first.append(first[near])
+                all_second.append(second[near])
+        first = np.concatenate(all_first)
+        second = np.concatenate(all_second)
+        return _sorted_pairs(
+            np.minimum(first, second), np.maximum(first, second))
+
+
+class DynamicTree(object):
+    """Dynamic spatial index over a changing collection of bounding boxes.
+    The index is a balanced binary tree of boxes, which supports inserting,
+    removing and moving boxes without rebuilding the whole tree.
+
+    Each box is stored fattened by a margin on each side. Moving a box
+    with :meth:`update` only changes the tree when the new box is no
+    longer inside the stored fat box, so shapes that move by small
+    amounts each frame of a simulation are rarely reinserted. Because of
+    this, the queries test the fat boxes, and return candidates that may
+    not overlap the exact shape boxes.
+
+    Boxes are identified by the integer handle returned when they are
+    inserted. Handles of removed boxes may be reused by later insertions.
+
+    :param shapes: Optional iterable of :class:`~planar.BoundingBox` 
+        objects, or shapes with a bounding box, to insert. They are given 
+        the handles ``0`` up to ``len(shapes) - 1`` in order.
+    :param margin: The distance that the stored boxes are fattened by on
+        each side, in the same units as the shapes.
+    :type margin: float
+    """
+
+    def __init__(self, shapes=(), margin=0.1):
+        if margin < 0:
+            raise ValueError("margin must not be negative")
+        self.margin = float(margin)
+        self._root = -1
+        self._bounds = []
+        self._parent = []
+        self._child1 = []
+        self._child2 = []
+        self._height = []
+        self._handle = []
+        self._free = []
+        self._leaves = {}
+        self._free_handles = []
+        for shape in shapes:
+            self.insert(shape)
+
+    def __len__(self):
+        return len(self._leaves)
+
+    def __contains__(self, handle):
+        return handle in self._leaves
+
+    @property
+    def handles(self):
+        """Sorted list of the handles of the boxes in the index."""
+        return sorted(self._leaves)
+
+    @property
+    def height(self):
+        """The height of the tree, 0 for a single box, or -1 when empty."""
+        if self._root == -1:
+            return -1
+        return self._height[self._root]
+
+    def fat_box(self, handle):
+        """Return the stored fat box for a handle.
+
+        :rtype: :class:`~planar.BoundingBox`
+        """
+        min_x, min_y, max_x, max_y = self._bounds[self._leaves[handle]]
+        return planar.BoundingBox(((min_x, min_y), (max_x, max_y)))
+
+    def insert(self, shape):
+        """Insert a box into the index.
+
+        :param shape: A bounding box, or a shape with a bounding box.
+        :return: The handle of the new box.
+        """
+        leaf = self._allocate(self._fatten(shape))
+        self._insert_leaf(leaf)
+        if self._free_handles:
+            handle = self._free_handles.pop()
+        else:
+            handle = len(self._leaves)
+        self._leaves[handle] = leaf
+        self._handle[leaf] = handle
+        return handle
+
+    def remove(self, handle):
+        """Remove a box from the index.
+
+        :param handle: The handle of the box to remove.
+        """
+        leaf = self._leaves.pop(handle)
+        self._remove_leaf(leaf)
+        self._free.append(leaf)
+        self._free_handles.append(handle)
+
+    def update(self, handle, shape):
+        """Move a box, after the shape that it bounds has changed. The
+        tree is only changed if the new box is not inside the stored fat
+        box.
+
+        :param handle: The handle of the box to move.
+        :param shape: The new bounding box, or a shape with a bounding box.
+        :return: True if the box was reinserted, False if the stored fat
+            box still contains the new box.
+        """
+        leaf = self._leaves[handle]
+        box = shape.bounding_box
+        (min_x, min_y), (max_x, max_y) = box.min_point, box.max_point
+        fat_min_x, fat_min_y, fat_max_x, fat_max_y = self._bounds[leaf]
+        if (fat_min_x <= min_x and fat_min_y <= min_y 
+            and max_x <= fat_max_x and max_y <= fat_max_y):
+            return False
+        self._remove_leaf(leaf)
+        margin = self.margin
+        self._bounds[leaf] = (min_x - margin, min_y - margin, 
+            max_x + margin, max_y + margin)
+        self._insert_leaf(leaf)
+        return True
+
+    def query_point(self, point):
+        """Find the boxes whose fat box contains or touches a point.
+
+        :param point: The query point.
+        :type point: :class:`~planar.Vec2`
+        :return: Sorted list of handles.
+        """
+        x, y = point
+        return self._query((x, y, x, y))
+
+    def query_box(self, box):
+        """Find the boxes whose fat box overlaps or touches a box.
+
+        :param box: A bounding box, or a shape with a bounding box.
+        :return: Sorted list of handles.
+        """
+        box = box.bounding_box
+        return self._query(tuple(box.min_point) + tuple(box.max_point))
+
+    def _query(self, query):
+        min_x, min_y, max_x, max_y = query
+        bounds = self._bounds
+        child1 = self._child1
+        child2 = self._child2
+        handles = self._handle
+        result = []
+        stack = [self._root] if self._root != -1 else []
+        while stack:
+            node = stack.pop()
+            b = bounds[node]
+            if (b[0] <= max_x and min_x <= b[2] 
+                and b[1] <= max_y and min_y <= b[3]):
+                if child1[node] == -1:
+                    result.append(handles[node])
+                else:
+                    stack.append(child1[node])
+                    stack.append(child2[node])
+        result.sort()
+        return result
+
+    def _fatten(self, shape):
+        box = shape.bounding_box
+        (min_x, min_y), (max_x, max_y) = box.min_point, box.max_point
+        margin = self.margin
+        return (min_x - margin, min_y - margin, 
+            max_x + margin, max_y + margin)
+
+    def _allocate(self, bounds):
+        """Return a new leaf node with the given bounds."""
+        if self._free:
+            node = self._free.pop()
+            self._bounds[node] = bounds
+            self._parent[node] = -1
+            self._child1[node] = -1
+            self._child2[node] = -1
+            self._height[node] = 0
+        else:
+            node = len(self._bounds)
+            self._bounds.append(bounds)
+            self._parent.append(-1)
+            self._child1.append(-1)
+            self._child2.append(-1)
+            self._height.append(0)
+            self._handle.append(-1)
+        return node
+
+    def _insert_leaf(self, leaf):
+        if self._root == -1:
+            self._root = leaf
+            self._parent[leaf] = -1
+            return
+        bounds = self._bounds
+        child1 = self._child1
+        child2 = self._child2
+        box = bounds[leaf]
+        # Descend to the sibling with the least increase in the total
+        # perimeter of the tree boxes
+        node = self._root
+        while child1[node] != -1:
+            perimeter = _perimeter(bounds[node])
+            combined = _perimeter(_union(bounds[node], box))
+            cost = 2.0 * combined
+            inheritance = 2.0 * (combined - perimeter)
+            child_costs = []
+            for child in (child1[node], child2[node]):
+                child_cost = (_perimeter(_union(bounds[child], box)) 
+                    + inheritance)
+                if child1[child] != -1:
+                    child_cost -= _perimeter(bounds[child])
+                child_costs.append(child_cost)
+            if cost < child_costs[0] and cost < child_costs[1]:
+                break
+            if child_costs[0] < child_costs[1]:
+                node = child1[node]
+            else:
+                node = child2[node]
+        sibling = node
+        old_parent = self._parent[sibling]
+        new_parent = self._allocate(_union(box, bounds[sibling]))
+        self._parent[new_parent] = old_parent
+        self._height[new_parent] = self._height[sibling] + 1
+        child1[new_parent] = sibling
+        child2[new_parent] = leaf
+        self._parent[sibling] = new_parent
+        self._parent[leaf] = new_parent
+        if old_parent == -1:
+            self._root = new_parent
+        elif child1[old_parent] == sibling:
+            child1[old_parent] = new_parent
+        else:
+            child2[old_parent] = new_parent
+        self._refit(self._parent[leaf])
+
+    def _remove_leaf(self, leaf):
+        if leaf == self._root:
+            self._root = -1
+            return
+        parent = self._parent[leaf]
+        grand_parent = self._parent[parent]
+        if self._child1[parent] == leaf:
+            sibling = self._child2[parent]
+        else:
+            sibling = self._child1[parent]
+        self._free.append(parent)
+        if grand_parent == -1:
+            self._root = sibling
+            self._parent[sibling] = -1
+        else:
+            if self._child1[grand_parent] == parent:
+                self._child1[grand_parent] = sibling
+            else:
+                self._child2[grand_parent] = sibling
+            self._parent[sibling] = grand_parent
+            self._refit(grand_parent)
+
+    def _refit(self, node):
+        """Rebalance and recompute the boxes and heights of the nodes from
+        a node up to the root.
+        """
+        bounds = self._bounds
+        height = self._height
+        child1 = self._child1
+        child2 = self._child2
+        while node != -1:
+            node = self._balance(node)
+            a, b = child1[node], child2[node]
+            height[node] = 1 + max(height[a], height[b])
+            bounds[node] = _union(bounds[a], bounds[b])
+            node = self._parent[node]
+
+    def _balance(self, a):
+        """Rotate node ``a`` if its subtrees differ in height by more than
+        one, and return the node now at its position.
+        """
+        child1 = self._child1
+        child2 = self._child2
+        height = self._height
+        if child1[a] == -1 or height[a] < 2:
+            return a
+        b, c = child1[a], child2[a]
+        balance = height[c] - height[b]
+        if balance > 1:
+            return self._rotate(a, c, b, child2)
+        if balance < -1:
+            return self._rotate(a, b, c, child1)
+        return a
+
+    def _rotate(self, a, up, other, up_slot):
+        """Promote the taller child ``up`` of node ``a`` in place of ``a``,
+        where ``up_slot`` is the child list holding ``up`` in ``a``.
+        """
+        parent = self._parent
+        bounds = self._bounds
+        height = self._height
+        child1 = self._child1
+        child2 = self._child2
+        f, g = child1[up], child2[up]
+        # Swap a and up
+        child1[up] = a
+        parent[up] = parent[a]
+        parent[a] = up
+        if parent[up] == -1:
+            self._root = up
+        elif child1[parent[up]] == a:
+            child1[parent[up]] = up
+        else:
+            child2[parent[up]] = up
+        # Keep the taller grandchild under up, and move the other to a
+        if height[f] > height[g]:
+            keep, move = f, g
+        else:
+            keep, move = g, f
+        child2[up] = keep
+        up_slot[a] = move
+        parent[move] = a
+        bounds[a] = _union(bounds[other], bounds[move])
+        bounds[up] = _union(bounds[a], bounds[keep])
+        height[a] = 1 + max(height[other], height[move])
+        height[up] = 1 + max(height[a], height[keep])
+        return up
+
+
+def _union(a, b):
+    """Return the bounds enclosing two bounds tuples."""
+    return (min(a[0], b[0]), min(a[1], b[1]), 
+        max(a[2], b[2]), max(a[3], b[3]))
+
+
+def _perimeter(b):
+    return 2.0 * ((b[2] - b[0]) + (b[3] - b[1]))
+
+
+_KD_LEAF_SIZE = 8
+
+
+def _kd_order(points, leaf_size):
+    """Return the order of the points in a k-d tree with leaves of
+    ``leaf_size`` points. The points are split at the median of their
+    widest axis into aligned cells of ``leaf_size`` times a power of two
+    points, which the cells of a packed tree with two children per node
+    follow exactly. All of the full cells of a level are partitioned in
+    one batch, and the final partial cell, if any, on its own.
+    """
+    count = len(points)
+    order = np.arange(count)
+    xs = np.ascontiguousarray(points[:, 0])
+    ys = np.ascontiguousarray(points[:, 1])
+    capacity = leaf_size
+    while capacity < count:
+        capacity *= 2
+    while capacity > leaf_size:
+        half = capacity // 2
+        full = count // capacity * capacity
+        for start, stop, cells in ((0, full, full // capacity), 
+                (full, count, 1)):
+            if stop - start <= half:
+                continue
+            cell_order = order[start:stop].reshape((cells, -1))
+            x = xs[cell_order]
+            y = ys[cell_order]
+            wide = (x.max(axis=1) - x.min(axis=1) 
+                >= y.max(axis=1) - y.min(axis=1))
+            coords = np.where(wide[:, np.newaxis], x, y)
+            partition = np.argpartition(coords, half, axis=1)
+            order[start:stop] = np.take_along_axis(
+                cell_order, partition, 1).ravel()
+        capacity = half
+    return order
+
+
+def _sorted_pairs(queries, items):
+    """Sort pairs of query and item indices by query, then item."""
+    order = np.lexsort((items, queries))
+    return queries[order], items[order]
+
+
+def _expand_ranges(starts, counts):
+    """Expand ranges of positions, given by their starts and counts, into
+    arrays of range indices and positions.
+    """
+    ranges = np.repeat(np.arange(len(counts)), counts)
+    positions = (np.arange(len(ranges)) 
+        - np.repeat(np.cumsum(counts) - counts, counts)
+        + np.repeat(starts, counts))
+    return ranges, positions
+
+
+def _ray_columns(anchors, directions, max_distance):
+    """Return the ray anchors, unit directions and maximum distances
+    as arrays.
+    """
+    anchors = np.asarray(anchors, dtype=float).reshape((-1, 2))
+    directions = np.asarray(directions, dtype=float).reshape((-1, 2))
+    if anchors.shape != directions.shape:
+        raise ValueError("expected the same number of anchors and directions")
+    lengths = np.hypot(directions[:, 0], directions[:, 1])
+    if np.any(lengths == 0.0):
+        raise ValueError("Ray direction vector must not be null")
+    directions = directions / lengths[:, np.newaxis]
+    max_distances = np.broadcast_to(
+        np.asarray(max_distance, dtype=float), lengths.shape)
+    return anchors, directions, max_distances
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
@@ -29,11 +29,14 @@
 
 import planar2 as planar
 import math
+import numpy as np
 
 
 class _LinearGeometry(object):
     """Abstract base class for linear shapes"""
 
+    __slots__ = ('_direction', '_normal')
+
     @property
     def direction(self):
         """Direction of the line as a unit vector. You may set this
@@ -67,6 +70,73 @@ class _LinearGeometry(object):
         self._normal = normal
         self._direction = normal.perpendicular()
 
+    def _set_vector(self, vector):
+        """Set the direction from a vector, reusing its length to normalize
+        it, and return the length.
+        """
+        vector = planar.Vec2(*vector)
+        length = vector.length
+        if length > planar.EPSILON:
+            x = vector[0] / length
+            y = vector[1] / length
+            self._direction = tuple.__new__(planar.Vec2, (x, y))
+            self._normal = tuple.__new__(planar.Vec2, (y, -x))
+        elif length:
+            raise ValueError("Line direction vector must not be null")
+        else:
+            self._direction = tuple.__new__(planar.Vec2, (1.0, 0.0))
+            self._normal = tuple.__new__(planar.Vec2, (0.0, -1.0))
+        return length
+
+    def intersect(self, other):
+        """Compute the intersection with a line, ray or line segment.
+
+        :param other: The linear shape to intersect with.
+        :type other: Line, Ray or LineSegment
+        :return: The intersection point as a :class:`~planar.Vec2`, or
+            None if the shapes do not intersect. If the shapes are collinear
+            and overlap along more than a point, the overlapping part is
+            returned as a :class:`Line`, :class:`Ray` or
+            :class:`LineSegment`. An overlapping line or segment has the
+            same direction as this shape.
+        """
+        anchor, start, stop = self._parameter_range()
+        other_anchor, other_start, other_stop = other._parameter_range()
+        direction = self._direction
+        other_direction = other._direction
+        to_other = other_anchor - anchor
+        denom = direction.cross(other_direction)
+        if abs(denom) > planar.EPSILON2:
+            along = to_other.cross(other_direction) / denom
+            other_along = to_other.cross(direction) / denom
+            if (start - planar.EPSILON <= along <= stop + planar.EPSILON
+                and other_start - planar.EPSILON <= other_along 
+                    <= other_stop + planar.EPSILON):
+                return anchor + direction * along
+            return None
+        if abs(to_other.cross(direction)) >= planar.EPSILON:
+            # Parallel
+            return None
+        # Collinear, intersect the parameter ranges along this shape
+        along = to_other.dot(direction)
+        sign = 1.0 if other_direction.dot(direction) > 0.0 else -1.0
+        lo, hi = sorted(
+            (along + sign * other_start, along + sign * other_stop))
+        lo = max(lo, start)
+        hi = min(hi, stop)
+        if lo > hi + planar.EPSILON:
+            return None
+        elif hi - lo < planar.EPSILON:
+            return anchor + direction * lo
+        elif lo == -float('inf') and hi == float('inf'):
+            return Line(anchor, direction)
+        elif hi == float('inf'):
+            return Ray(anchor + direction * lo, direction)
+        elif lo == -float('inf'):
+            return Ray(anchor + direction * hi, -direction)
+        else:
+            return LineSegment(anchor + direction * lo, direction * (hi - lo))
+
 
 class Line(_LinearGeometry):
     """Infinite directed line.
@@ -77,6 +147,10 @@ class Line(_LinearGeometry):
         be null. Does not need to be unit-length.
     :type direction: Vec2
     """
+
+    __slots__ = {'offset': 
+        """The signed distance from the origin to the line."""}
+
     def __init__(self, point, direction):
         self.direction = direction
         self.offset = planar.Vec2(*point).dot(self.normal)
@@ -104,6 +178,38 @@ class Line(_LinearGeometry):
                 raise ValueError("All points provided must be collinear")
         return line
     
+    @classmethod
+    def fit(cls, points):
+        """Create the line that best fits a set of points, minimizing the
+        sum of squared perpendicular distances from the points to the line
+        (total least squares). Unlike :meth:`from_points`, the points do 
+        not need to be collinear. The line passes through the centroid of
+        the points, and is directed from the first point toward the last.
+
+        :param points: Iterable of at least 2 distinct points.
+        """
+        points = [planar.Vec2(*p) for p in points]
+        count = len(points)
+        if count < 2:
+            raise ValueError("Expected iterable of 2 or more distinct points")
+        cx = sum(x for x, y in points) / count
+        cy = sum(y for x, y in points) / count
+        sxx = sxy = syy = 0.0
+        for x, y in points:
+            dx = x - cx
+            dy = y - cy
+            sxx += dx * dx
+            sxy += dx * dy
+            syy += dy * dy
+        if sxx + syy <= planar.EPSILON2 * count:
+            raise ValueError("Expected iterable of 2 or more distinct points")
+        # Direction of the major axis of the 2x2 covariance matrix
+        angle = 0.5 * math.atan2(2.0 * sxy, sxx - syy)
+        direction = planar.Vec2(math.cos(angle), math.sin(angle))
+        if direction.dot(points[-1] - points[0]) < 0.0:
+            direction = -direction
+        return cls((cx, cy), direction)
+
     @classmethod
     def from_normal(cls, normal, offset):
         """Create a line given a normal vector perpendicular to it, at the
@@ -119,9 +225,6 @@ class Line(_LinearGeometry):
         line.normal = normal
         line.offset = offset * 1.0
         return line
-    
-    offset = 0.0
-    """The signed distance from the origin to the line."""
 
     @property
     def points(self):
@@ -130,6 +233,12 @@ class Line(_LinearGeometry):
         """
         point = self._normal * self.offset
         return (point, point + self._direction)
+
+    def _parameter_range(self):
+        """Return a point on the line, and the range of distances along
+        the direction from that point covered by the line.
+        """
+        return self._normal * self.offset, -float('inf'), float('inf')
     
     def distance_to(self, point):
         """Return the signed distance from the line to the specified point.
@@ -160,6 +269,27 @@ class Line(_LinearGeometry):
         """Return True if the specified point is on the line."""
         return abs(self.distance_to(point)) < planar.EPSILON
     
+    def distances_to(self, points):
+        """Return the signed distances from the line to an array of points,
+        with the same sign convention as :meth:`distance_to`.
+
+        :param points: Array of points with a trailing dimension of size 2.
+        :return: Array of distances.
+        """
+        return np.dot(np.asarray(points, dtype=float), self._normal
+            ) - self.offset
+
+    def classify_points(self, points):
+        """Classify an array of points by the half plane containing them.
+
+        :param points: Array of points with a trailing dimension of size 2.
+        :return: Integer array, with -1 for points to the left of the line,
+            1 for points to the right, and 0 for points on the line,
+            consistent with :meth:`point_left`, :meth:`point_right` and
+            :meth:`contains_point`.
+        """
+        return _classify(self.distances_to(points))
+
     def parallel(self, point):
         """Return a line parallel to this one that passes through the 
         given point.
@@ -200,9 +330,14 @@ class Line(_LinearGeometry):
         return point - 2.0 * self._normal * offset_distance
 
     def __imul__(self, other):
-        p1, p2 = self.points
-        p1 = other.__mul__(p1)
-        p2 = other.__mul__(p2)
+        kind = getattr(other, '_kind', None)
+        if kind == 'identity':
+            return self
+        elif kind == 'translation':
+            # Direction is unchanged, only the offset moves
+            self.offset += self._normal.dot((other[2], other[5]))
+            return self
+        p1, p2 = _transform_points(self.points, other)
         if p1 is NotImplemented or p2 is NotImplemented:
             return NotImplemented
         self.direction = p2 - p1
@@ -245,6 +380,9 @@ class Ray(_LinearGeometry):
         be null. Does not need to be unit-length.
     :type direction: Vec2
     """
+
+    __slots__ = ('_anchor',)
+
     def __init__(self, anchor, direction):
         self.anchor = planar.Vec2(*anchor)
         self.direction = direction
@@ -281,6 +419,12 @@ class Ray(_LinearGeometry):
         """
         return (self._anchor, self._anchor + self._direction)
 
+    def _parameter_range(self):
+        """Return the anchor point, and the range of distances along
+        the direction from the anchor covered by the ray.
+        """
+        return self._anchor, 0.0, float('inf')
+
     @property
     def anchor(self):
         """The anchor, or starting point of the ray."""
@@ -354,9 +498,14 @@ class Ray(_LinearGeometry):
             return self._anchor
 
     def __imul__(self, other):
-        p1, p2 = self.points
-        p1 = other.__mul__(p1)
-        p2 = other.__mul__(p2)
+        kind = getattr(other, '_kind', None)
+        if kind == 'identity':
+            return self
+        elif kind == 'translation':
+            # Direction is unchanged, only the anchor moves
+            self._anchor += (other[2], other[5])
+            return self
+        p1, p2 = _transform_points(self.points, other)
         if p1 is NotImplemented or p2 is NotImplemented:
             return NotImplemented
         self.direction = p2 - p1
@@ -399,9 +548,14 @@ class LineSegment(_LinearGeometry):
         must not be null.
     :type vector: Vec2
     """
+
+    # The end point, midpoint and squared length are cached, and the
+    # cached points are cleared whenever the segment is mutated
+    __slots__ = ('_anchor', '_length', '_length2', '_end', '_mid')
+
     def __init__(self, anchor, vector):
-        self.vector = vector
         self._anchor = planar.Vec2(*anchor)
+        self.vector = vector
 
     @classmethod
     def from_points(cls, points):
@@ -468,13 +622,42 @@ class LineSegment(_LinearGeometry):
         segment.length = end_distance - start_distance
         return segment
 
-    length = 0.0
-    """The distance between the line segments endpoints."""
+    @property
+    def length(self):
+        """The distance between the line segments endpoints."""
+        return self._length
+
+    @length.setter
+    def length(self, value):
+        self._length = value
+        self._length2 = value * value
+        self._end = self._mid = None
+
+    @property
+    def length2(self):
+        """The square of the length of the line segment (read-only)."""
+        return self._length2
+
+    @_LinearGeometry.direction.setter
+    def direction(self, value):
+        _LinearGeometry.direction.fset(self, value)
+        self._end = self._mid = None
+
+    @_LinearGeometry.normal.setter
+    def normal(self, value):
+        _LinearGeometry.normal.fset(self, value)
+        self._end = self._mid = None
 
     @property
     def points(self):
         """Return the two endpoints of the line segment as a sequence."""
-        return (self._anchor, self._anchor + self.direction * self.length)
+        return (self._anchor, self.end)
+
+    def _parameter_range(self):
+        """Return the anchor point, and the range of distances along
+        the direction from the anchor covered by the line segment.
+        """
+        return self._anchor, 0.0, self._length
 
     @property
     def anchor(self):
@@ -484,6 +667,7 @@ class LineSegment(_LinearGeometry):
     @anchor.setter
     def anchor(self, value):
         self._anchor = planar.Vec2(*value)
+        self._end = self._mid = None
 
     start = anchor
     """The starting point of the line segment. Alias for ``anchor``"""
@@ -493,22 +677,19 @@ class LineSegment(_LinearGeometry):
         """The vector that comprises the length and direction of the 
         line segment from its anchor point.
         """
-        return self.direction * self.length
+        return self._direction * self._length
  
     @vector.setter
     def vector(self, value):
-        vector = planar.Vec2(*value)
-        length = vector.length
-        if length:
-            self.direction = vector
-        else:
-            self.direction = (1, 0)
-        self.length = vector.length
+        self.length = self._set_vector(value)
 
     @property
     def end(self):
         """The end point of the line sequence."""
-        return self._anchor + self.direction * self.length
+        end = self._end
+        if end is None:
+            end = self._end = self._anchor + self._direction * self._length
+        return end
 
     @end.setter
     def end(self, value):
@@ -518,13 +699,60 @@ class LineSegment(_LinearGeometry):
     @property
     def mid(self):
         """The midpoint of the line segment (read-only)."""
-        return self._anchor + self.direction * (self.length * 0.5)
+        mid = self._mid
+        if mid is None:
+            mid = self._mid = (
+                self._anchor + self._direction * (self._length * 0.5))
+        return mid
 
     @property
     def line(self):
         """Return a containing line collinear with this line segment."""
         return Line(self._anchor, self.direction)
 
+    @property
+    def bounding_box(self):
+        """The bounding box of the line segment."""
+        return planar.BoundingBox((self._anchor, self.end))
+
+    def clip_to_box(self, box):
+        """Clip the line segment to a box, using the Liang-Barsky 
+        algorithm. The box is closed, so a segment touching the box
+        is clipped to the touching point.
+
+        :param box: The box to clip to, or a shape with a bounding box.
+        :type box: :class:`~planar.BoundingBox`
+        :return: A new line segment with the same direction, or None if
+            the segment is outside of the box.
+        :rtype: LineSegment
+        """
+        box = box.bounding_box
+        min_x, min_y = box.min_point
+        max_x, max_y = box.max_point
+        anchor = self._anchor
+        direction = self._direction
+        start = 0.0
+        stop = self._length
+        for origin, step, low, high in (
+            (anchor.x, direction.x, min_x, max_x), 
+            (anchor.y, direction.y, min_y, max_y)):
+            if step == 0.0:
+                if origin < low or origin > high:
+                    return None
+            else:
+                t1 = (low - origin) / step
+                t2 = (high - origin) / step
+                if t1 > t2:
+                    t1, t2 = t2, t1
+                if t1 > start:
+                    start = t1
+                if t2 < stop:
+                    stop = t2
+                if start > stop:
+                    return None
+        return _new_segment(anchor + direction * start if start else anchor, 
+            direction, stop - start)
+
     def distance_to(self, point):
         """Return the distance between the given point and the line segment."""
         point = planar.Vec2(*point)
@@ -597,13 +825,19 @@ class LineSegment(_LinearGeometry):
             return parallel + self._anchor
 
     def __imul__(self, other):
-        p1, p2 = self.points
-        p1 = other.__mul__(p1)
-        p2 = other.__mul__(p2)
+        kind = getattr(other, '_kind', None)
+        if kind == 'identity':
+            return self
+        elif kind == 'translation':
+            # Direction and length are unchanged, only the anchor moves
+            self._anchor += (other[2], other[5])
+            self._end = self._mid = None
+            return self
+        p1, p2 = _transform_points(self.points, other)
         if p1 is NotImplemented or p2 is NotImplemented:
             return NotImplemented
-        self.vector = p2 - p1
         self._anchor = p1
+        self.vector = p2 - p1
         return self
 
     def __eq__(self, other):
@@ -633,5 +867,553 @@ class LineSegment(_LinearGeometry):
             tuple(self.anchor), tuple(self.vector))
 
 
+class LineArray(object):
+    """Array of lines stored as columns for batch operations. The unit
+    normal vectors and offsets of the lines are each held in a single 
+    array, and the query methods are evaluated for all lines at once.
+
+    As with :class:`LineSegmentArray`, the query methods accept a single
+    point, which is tested against every line, or an array of points which
+    is broadcast against the lines. An array of shape ``(M, 1, 2)`` tests
+    every point against every line, giving results of shape ``(M, N)``.
+
+    :param lines: Iterable of :class:`~planar.Line` objects.
+    """
+
+    def __init__(self, lines=()):
+        normals = []
+        offsets = []
+        for line in lines:
+            normals.append(line.normal)
+            offsets.append(line.offset)
+        self._normals = np.array(normals, dtype=float).reshape((-1, 2))
+        self._offsets = np.array(offsets, dtype=float)
+
+    @classmethod
+    def from_normals(cls, normals, offsets):
+        """Create an array of lines from their normal vectors and offsets,
+        as with :meth:`Line.from_normal`.
+
+        :param normals: Non-null vectors perpendicular to the lines, 
+            shape ``(N, 2)``. Do not need to be unit-length.
+        :param offsets: The signed distances from the lines to the
+            origin, shape ``(N,)``.
+        :rtype: LineArray
+        """
+        normals = np.asarray(normals, dtype=float).reshape((-1, 2))
+        offsets = np.array(offsets, dtype=float).reshape(-1)
+        if len(normals) != len(offsets):
+            raise ValueError(
+                "expected the same number of normals and offsets")
+        lengths = np.hypot(normals[:, 0], normals[:, 1])
+        if np.any(lengths == 0.0):
+            raise ValueError("Line normal vector must not be null")
+        array = cls.__new__(cls)
+        array._normals = normals / lengths[:, np.newaxis]
+        array._offsets = offsets
+        return array
+
+    @classmethod
+    def fit(cls, points, starts):
+        """Fit lines to many groups of points at once, as with
+        :meth:`Line.fit`. The groups are stored contiguously in a single
+        array of points, and identified by the index of their first point.
+
+        :param points: The points of all groups, shape ``(P, 2)``.
+        :param starts: The increasing indices of the first point of each 
+            group in ``points``, shape ``(N,)``. Each group extends to the
+            start of the next, and must contain at least 2 distinct points.
+        :rtype: LineArray
+        """
+        points = np.asarray(points, dtype=float).reshape((-1, 2))
+        starts = np.asarray(starts, dtype=np.intp).reshape(-1)
+        counts = np.diff(np.append(starts, len(points)))
+        if len(starts) and (starts[0] < 0 or np.any(counts < 2)):
+            raise ValueError("Expected 2 or more distinct points per group")
+        if not len(starts):
+            return cls()
+        centers = np.add.reduceat(points, starts, axis=0) / counts[
+            :, np.newaxis]
+        dx, dy = (points - np.repeat(centers, counts, axis=0)).T
+        sxx = np.add.reduceat(dx * dx, starts)
+        sxy = np.add.reduceat(dx * dy, starts)
+        syy = np.add.reduceat(dy * dy, starts)
+        if np.any(sxx + syy <= planar.EPSILON2 * counts):
+            raise ValueError("Expected 2 or more distinct points per group")
+        # Directions of the major axes of the 2x2 covariance matrices
+        angles = 0.5 * np.arctan2(2.0 * sxy, sxx - syy)
+        directions = np.stack((np.cos(angles), np.sin(angles)), axis=-1)
+        spans = points[starts + counts - 1] - points[starts]
+        directions[np.einsum('ij,ij->i', directions, spans) < 0.0] *= -1.0
+        array = cls.__new__(cls)
+        array._normals = np.stack((directions[:, 1], -directions[:, 0]), 
+            axis=-1)
+        array._offsets = np.einsum('ij,ij->i', centers, array._normals)
+        return array
+
+    def to_lines(self):
+        """Return the lines as a list of :class:`~planar.Line` objects."""
+        return [Line.from_normal(normal, offset) for normal, offset 
+            in zip(self._normals.tolist(), self._offsets.tolist())]
+
+    @property
+    def normals(self):
+        """The unit normal vectors of the lines, shape ``(N, 2)``."""
+        return self._normals
+
+    @property
+    def directions(self):
+        """The unit direction vectors of the lines, shape ``(N, 2)``."""
+        return np.stack((-self._normals[:, 1], self._normals[:, 0]), 
+            axis=-1)
+
+    @property
+    def offsets(self):
+        """The signed distances from the lines to the origin, 
+        shape ``(N,)``.
+        """
+        return self._offsets
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Line.from_normal(tuple(self._normals[index]), 
+                float(self._offsets[index]))
+        array = self.__class__.__new__(self.__class__)
+        array._normals = self._normals[index]
+        array._offsets = self._offsets[index]
+        return array
+
+    def __iter__(self):
+        return iter(self.to_lines())
+
+    def __repr__(self):
+        """Precise string representation."""
+        return "%s([%s])" % (self.__class__.__name__, 
+            ', '.join(repr(line) for line in self))
+
+    __str__ = __repr__
+
+    def distance_to(self, points):
+        """Return the signed distances from the lines to the given points,
+        with the same sign convention as :meth:`Line.distance_to`.
+        """
+        return np.einsum('...i,...i->...', np.asarray(points, dtype=float),
+            self._normals) - self._offsets
+
+    def point_left(self, points):
+        """Return a boolean array flagging the points that are in the
+        half planes to the left of the lines.
+        """
+        return self.distance_to(points) <= -planar.EPSILON
+
+    def point_right(self, points):
+        """Return a boolean array flagging the points that are in the
+        half planes to the right of the lines.
+        """
+        return self.distance_to(points) >= planar.EPSILON
+
+    def contains_point(self, points):
+        """Return a boolean array flagging the points that are on the
+        lines.
+        """
+        return np.abs(self.distance_to(points)) < planar.EPSILON
+
+    def classify_points(self, points):
+        """Classify points by the half planes of the lines containing them.
+
+        :return: Integer array, with -1 for points to the left of the 
+            respective line, 1 for points to the right, and 0 for points 
+            on the line.
+        """
+        return _classify(self.distance_to(points))
+
+
+class LineSegmentArray(object):
+    """Array of directed line segments stored as columns for batch
+    operations. The anchor points, unit direction and normal vectors, and
+    lengths of the segments are each held in a single array, and the
+    query methods are evaluated for all segments at once.
+
+    The query methods accept a single point, which is tested against every
+    segment, or an array of points which is broadcast against the segments
+    following the usual numpy rules. Thus an array of shape ``(N, 2)`` pairs
+    each point with the respective segment, and an array of shape
+    ``(M, 1, 2)`` tests every point against every segment, giving results
+    of shape ``(M, N)``.
+
+    :param segments: Iterable of :class:`~planar.LineSegment` objects.
+    """
+
+    def __init__(self, segments=()):
+        anchors = []
+        directions = []
+        lengths = []
+        for segment in segments:
+            anchors.append(segment.anchor)
+            directions.append(segment.direction)
+            lengths.append(segment.length)
+        self._init_columns(
+            np.array(anchors, dtype=float).reshape((-1, 2)),
+            np.array(directions, dtype=float).reshape((-1, 2)),
+            np.array(lengths, dtype=float))
+
+    def _init_columns(self, anchors, directions, lengths):
+        self._anchors = anchors
+        self._directions = directions
+        self._normals = np.stack((directions[:, 1], -directions[:, 0]), 
+            axis=-1)
+        self._lengths = lengths
+
+    @classmethod
+    def _from_columns(cls, anchors, directions, lengths):
+        array = cls.__new__(cls)
+        array._init_columns(anchors, directions, lengths)
+        return array
+
+    @classmethod
+    def from_points(cls, starts, ends):
+        """Create an array of line segments from arrays of their start
+        (anchor) and end points. Segments with coincident start and end
+        points have zero length and the direction ``(1, 0)``.
+
+        :param starts: Start points, shape ``(N, 2)``.
+        :param ends: End points, shape ``(N, 2)``.
+        :rtype: LineSegmentArray
+        """
+        starts = np.array(starts, dtype=float).reshape((-1, 2))
+        ends = np.asarray(ends, dtype=float).reshape((-1, 2))
+        if starts.shape != ends.shape:
+            raise ValueError(
+                "expected the same number of start and end points")
+        vectors = ends - starts
+        lengths = np.hypot(vectors[:, 0], vectors[:, 1])
+        null = lengths <= planar.EPSILON
+        directions = vectors / np.where(null, 1.0, lengths)[:, np.newaxis]
+        directions[null] = (1.0, 0.0)
+        return cls._from_columns(starts, directions, lengths)
+
+    @classmethod
+    def from_polygon(cls, polygon):
+        """Create an array of the edges of a polygon. As with the polygon's
+        own edge iteration, edge ``i`` runs from vertex ``i - 1`` to vertex
+        ``i``.
+
+        :param polygon: A polygon, or other closed sequence of points.
+        :rtype: LineSegmentArray
+        """
+        verts = np.array(list(polygon), dtype=float).reshape((-1, 2))
+        return cls.from_points(np.roll(verts, 1, axis=0), verts)
+
+    def to_segments(self):
+        """Return the segments as a list of :class:`~planar.LineSegment`
+        objects.
+        """
+        return [_new_segment(anchor, direction, length) 
+            for anchor, direction, length in zip(self._anchors.tolist(),
+                self._directions.tolist(), self._lengths.tolist())]
+
+    def to_polygon(self):
+        """Return a :class:`~planar.Polygon` with the segment anchors as
+        vertices. This is the inverse of :meth:`from_polygon` for polygon
+        edge arrays.
+        """
+        verts = np.roll(self._anchors, -1, axis=0)
+        return planar.Polygon(verts.tolist())
+
+    @property
+    def anchors(self):
+        """The anchor, or starting points of the segments, 
+        shape ``(N, 2)``.
+        """
+        return self._anchors
+
+    starts = anchors
+
+    @property
+    def directions(self):
+        """The unit direction vectors of the segments, shape ``(N, 2)``."""
+        return self._directions
+
+    @property
+    def normals(self):
+        """The unit normal vectors of the segments, shape ``(N, 2)``."""
+        return self._normals
+
+    @property
+    def lengths(self):
+        """The lengths of the segments, shape ``(N,)``."""
+        return self._lengths
+
+    @property
+    def vectors(self):
+        """The direction and magnitude vectors of the segments,
+        shape ``(N, 2)``.
+        """
+        return self._directions * self._lengths[:, np.newaxis]
+
+    @property
+    def ends(self):
+        """The end points of the segments, shape ``(N, 2)``."""
+        return self._anchors + self.vectors
+
+    @property
+    def mids(self):
+        """The midpoints of the segments, shape ``(N, 2)``."""
+        return self._anchors + self.vectors * 0.5
+
+    @property
+    def bounds(self):
+        """The bounding boxes of the segments as an array of shape
+        ``(N, 4)``, each row holding ``(min_x, min_y, max_x, max_y)``.
+        """
+        ends = self.ends
+        return np.hstack((np.minimum(self._anchors, ends), 
+            np.maximum(self._anchors, ends)))
+
+    def __len__(self):
+        return len(self._lengths)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return _new_segment(tuple(self._anchors[index]), 
+                tuple(self._directions[index]), float(self._lengths[index]))
+        return self._from_columns(self._anchors[index], 
+            self._directions[index], self._lengths[index])
+
+    def __iter__(self):
+        return iter(self.to_segments())
+
+    def almost_equals(self, other):
+        """Return True if this array is approximately equal to
+        another, within precision limits.
+        """
+        return (self.__class__ is other.__class__ 
+            and len(self) == len(other)
+            and bool(np.all(np.hypot(*(self._anchors 
+                - other._anchors).T) < planar.EPSILON))
+            and bool(np.all(np.hypot(*(self.vectors 
+                - other.vectors).T) < planar.EPSILON)))
+
+    def __repr__(self):
+        """Precise string representation."""
+        return "%s([%s])" % (self.__class__.__name__, 
+            ', '.join(repr(s) for s in self))
+
+    __str__ = __repr__
+
+    def _along_perp(self, points):
+        """Return the distance along and perpendicular to each segment
+        for the given points.
+        """
+        to_points = np.asarray(points, dtype=float) - self._anchors
+        along = np.einsum('...i,...i->...', to_points, self._directions)
+        perp = np.einsum('...i,...i->...', to_points, self._normals)
+        return along, perp
+
+    def distance_to(self, points):
+        """Return the distance between the given points and the 
+        line segments.
+        """
+        along, perp = self._along_perp(points)
+        lengths = self._lengths
+        return np.where(along < 0.0, np.hypot(along, perp),
+            np.where(along > lengths, np.hypot(along - lengths, perp),
+                np.abs(perp)))
+
+    def contains_point(self, points):
+        """Return a boolean array flagging the points that are on 
+        the line segments.
+        """
+        return self.distance_to(points) < planar.EPSILON
+
+    def point_ahead(self, points):
+        """Return a boolean array flagging the points that are ahead of
+        the endpoint of the line segments with respect to their directions.
+        """
+        along, perp = self._along_perp(points)
+        return along >= self._lengths + planar.EPSILON
+
+    def point_behind(self, points):
+        """Return a boolean array flagging the points that are behind 
+        the anchor point with respect to the directions of the segments.
+        """
+        along, perp = self._along_perp(points)
+        return along <= -planar.EPSILON
+
+    def point_left(self, points):
+        """Return a boolean array flagging the points that are in the space
+        to the left of, but not behind the line segments.
+        """
+        along, perp = self._along_perp(points)
+        return ((self._lengths + planar.EPSILON > along) 
+            & (along > -planar.EPSILON) & (perp <= -planar.EPSILON))
+
+    def point_right(self, points):
+        """Return a boolean array flagging the points that are in the space
+        to the right of, but not behind the line segments.
+        """
+        along, perp = self._along_perp(points)
+        return ((self._lengths + planar.EPSILON > along) 
+            & (along > -planar.EPSILON) & (perp >= planar.EPSILON))
+
+    def project(self, points):
+        """Compute the projection of points onto the line segments. This
+        is the closest point on each segment to the respective point.
+
+        :return: Array of projected points, with a trailing dimension 
+            of size 2.
+        """
+        along, perp = self._along_perp(points)
+        along = np.where(along <= -planar.EPSILON, 0.0, 
+            np.where(along >= self._lengths + planar.EPSILON, 
+                self._lengths, along))
+        return self._anchors + self._directions * along[..., np.newaxis]
+
+    def clip_to_box(self, box):
+        """Clip all of the line segments to a box at once, using the 
+        Liang-Barsky algorithm. The box is closed, so segments touching 
+        the box are clipped to the touching point.
+
+        :param box: The box to clip to, or a shape with a bounding box.
+        :type box: :class:`~planar.BoundingBox`
+        :return: Pair ``(segments, indices)`` of a new 
+            :class:`LineSegmentArray` of the clipped segments, and the
+            array of indices of the segments that they were clipped from.
+            Segments outside of the box are omitted.
+        """
+        box = box.bounding_box
+        low = np.array(box.min_point, dtype=float)
+        high = np.array(box.max_point, dtype=float)
+        anchors = self._anchors
+        directions = self._directions
+        start = np.zeros(len(self))
+        stop = self._lengths.copy()
+        keep = np.ones(len(self), dtype=bool)
+        for axis in (0, 1):
+            origin = anchors[:, axis]
+            step = directions[:, axis]
+            parallel = step == 0.0
+            keep &= ~parallel | (
+                (origin >= low[axis]) & (origin <= high[axis]))
+            step = np.where(parallel, 1.0, step)
+            t1 = (low[axis] - origin) / step
+            t2 = (high[axis] - origin) / step
+            start = np.where(parallel, start, 
+                np.maximum(start, np.minimum(t1, t2)))
+            stop = np.where(parallel, stop, 
+                np.minimum(stop, np.maximum(t1, t2)))
+        indices = np.nonzero(keep & (start <= stop))[0]
+        start = start[indices]
+        directions = directions[indices]
+        return self._from_columns(
+            anchors[indices] + directions * start[:, np.newaxis],
+            directions, stop[indices] - start), indices
+
+    def intersections(self, other=None):
+        """Find all pairs of intersecting segments between this array
+        and another. Candidate pairs are found from overlapping bounding
+        boxes using a packed R-tree, and only those are tested exactly,
+        all at once.
+
+        :param other: The segments to intersect with, or None to find the
+            intersecting pairs among the segments of this array, each
+            reported once with the lower index first.
+        :type other: LineSegmentArray
+        :return: Tuple of arrays ``(indices, other_indices, points)``,
+            where segment ``indices[k]`` of this array intersects segment
+            ``other_indices[k]`` of the other array at ``points[k]``, 
+            sorted by index. For collinear overlapping segments, the
+            point is the start of the overlap along this array's segment.
+        """
+        if other is None:
+            others = self
+        else:
+            others = other
+        tree = planar.index._PackedTree(others.bounds)
+        indices, other_indices = tree.query_bounds(self.bounds)
+        if other is None:
+            lower = indices < other_indices
+            indices = indices[lower]
+            other_indices = other_indices[lower]
+        order = np.lexsort((other_indices, indices))
+        indices = indices[order]
+        other_indices = other_indices[order]
+        anchors = self._anchors[indices]
+        directions = self._directions[indices]
+        hit, along = _intersect_columns(anchors, directions, 
+            self._lengths[indices], others._anchors[other_indices],
+            others._directions[other_indices], others._lengths[other_indices])
+        points = anchors[hit] + directions[hit] * along[hit, np.newaxis]
+        return indices[hit], other_indices[hit], points
+
+
+def _intersect_columns(anchors, directions, lengths, 
+    other_anchors, other_directions, other_lengths):
+    """Intersect pairs of linear shapes given as columns. Each shape covers
+    the distances from 0 to its length, which may be infinite, along its
+    unit direction from its anchor.
+
+    :return: Pair of arrays flagging the intersecting pairs, and giving the
+        distance along the first shape to the intersection point. For
+        collinear overlapping shapes, this is the start of the overlap.
+    """
+    def cross(a, b):
+        return a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]
+    to_other = other_anchors - anchors
+    denom = cross(directions, other_directions)
+    crossing = np.abs(denom) > planar.EPSILON2
+    safe_denom = np.where(crossing, denom, 1.0)
+    offsets = cross(to_other, directions)
+    along = cross(to_other, other_directions) / safe_denom
+    other_along = offsets / safe_denom
+    hit = crossing & (along >= -planar.EPSILON) & (
+        along <= lengths + planar.EPSILON) & (
+        other_along >= -planar.EPSILON) & (
+        other_along <= other_lengths + planar.EPSILON)
+    # Collinear pairs, intersect the ranges along the first shape
+    collinear = ~crossing & (np.abs(offsets) < planar.EPSILON)
+    start = np.einsum('ij,ij->i', to_other, directions)
+    stop = start + np.where(np.einsum('ij,ij->i', 
+        other_directions, directions) > 0.0, 1.0, -1.0) * other_lengths
+    lo = np.maximum(np.minimum(start, stop), 0.0)
+    hi = np.minimum(np.maximum(start, stop), lengths)
+    hit |= collinear & (lo <= hi + planar.EPSILON)
+    return hit, np.where(crossing, along, lo)
+
+
+def _classify(distances):
+    """Classify signed distances from lines as -1 (left), 0 (on the line)
+    or 1 (right).
+    """
+    return ((distances >= planar.EPSILON).astype(int)
+        - (distances <= -planar.EPSILON))
+
+
+def _new_segment(anchor, direction, length):
+    """Create a line segment from its anchor, unit direction and length
+    without renormalizing the direction.
+    """
+    segment = _LinearGeometry.__new__(LineSegment)
+    segment._anchor = planar.Vec2(*anchor)
+    direction = planar.Vec2(*direction)
+    segment._direction = direction
+    segment._normal = -direction.perpendicular()
+    segment.length = length
+    return segment
+
+
+def _transform_points(points, transform):
+    """Apply the transform to a pair of points, using the transform's
+    specialized point kernel if it has one.
+    """
+    apply = getattr(transform, '_point_kernel', None)
+    if apply is None:
+        return [transform.__mul__(p) for p in points]
+    return [planar.Vec2(*apply(*p)) for p in points]
+
+
 # vim: ai ts=4 sts=4 et sw=4 tw=78
 
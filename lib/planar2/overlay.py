@@ -0,0 +1,608 @@
+#############################################################################
+# Copyright (c) 2020 by R. Patrick Xian
+# Distributed under the MIT License
+#############################################################################
+
+
+"""Boolean operations on polygons"""
+
+import math
+import heapq
+import collections
+import numpy as np
+import planar2 as planar
+
+
+OPERATIONS = ('union', 'intersection', 'difference', 'symmetric_difference')
+
+# Classification of the boundary fragments of one polygon against the other
+_OUTSIDE = 0
+_INSIDE = 1
+_SAME = 2
+_OPPOSITE = 3
+
+
+def overlay(polygon, other, operation):
+    """Compute a boolean operation on two simple polygons.
+
+    The boundaries of the polygons are split at their intersection points
+    into fragments, and each fragment is classified as inside or outside
+    of the other polygon, or shared with it. The fragments bounding the
+    result are selected by the operation, and linked into rings. At
+    vertices where the result touches itself, the rings are separated, so
+    that every ring is simple.
+
+    If the bounding boxes of the polygons are disjoint, the result is
+    found without splitting. The intersection of two convex polygons is
+    computed in O(n + m) time by :func:`convex_intersection`.
+
+    :param polygon: The first polygon.
+    :param other: The second polygon.
+    :param operation: One of ``'union'``, ``'intersection'``,
+        ``'difference'`` (the first polygon minus the second) or
+        ``'symmetric_difference'``.
+    :return: List of ``(shell, holes)`` pairs, each a polygon with
+        counter-clockwise winding, and a list of the polygons that are
+        holes in it, with clockwise winding. The order of the pairs is
+        unspecified.
+    """
+    if operation not in OPERATIONS:
+        raise ValueError("unknown operation %r" % (operation,))
+    if not polygon.bounding_box.intersects(other.bounding_box):
+        result = []
+        if operation != 'intersection':
+            result.append((_ccw_polygon(polygon), []))
+        if operation in ('union', 'symmetric_difference'):
+            result.append((_ccw_polygon(other), []))
+        return result
+    if (operation == 'intersection'
+        and polygon.is_convex and other.is_convex):
+        return convex_intersection(polygon, other)
+    ring, other_ring = _split_rings(_ccw_ring(polygon), _ccw_ring(other))
+    # Select the fragments of each polygon bounding the result, by their
+    # classification against the other polygon, as pairs of the states
+    # kept, and the states kept with their direction reversed
+    keep = {
+        'union': ((_OUTSIDE, _SAME), ()),
+        'intersection': ((_INSIDE, _SAME), ()),
+        'difference': ((_OUTSIDE, _OPPOSITE), ()),
+        'symmetric_difference': ((_OUTSIDE, _OPPOSITE), (_INSIDE,)),
+        }[operation]
+    other_keep = {
+        'union': ((_OUTSIDE,), ()),
+        'intersection': ((_INSIDE,), ()),
+        'difference': ((), (_INSIDE,)),
+        'symmetric_difference': ((_OUTSIDE, _OPPOSITE), (_INSIDE,)),
+        }[operation]
+    fragment_starts = []
+    fragment_ends = []
+    for starts, against, (forward, backward) in (
+        (ring, other_ring, keep), (other_ring, ring, other_keep)):
+        ends = np.roll(starts, -1, axis=0)
+        state = _classify_fragments(starts, ends, against)
+        selected = np.isin(state, forward)
+        fragment_starts.append(starts[selected])
+        fragment_ends.append(ends[selected])
+        selected = np.isin(state, backward)
+        fragment_starts.append(ends[selected])
+        fragment_ends.append(starts[selected])
+    rings = _link(np.concatenate(fragment_starts).tolist(),
+        np.concatenate(fragment_ends).tolist())
+    return _assemble(rings)
+
+
+def convex_intersection(polygon, other):
+    """Compute the intersection of two convex polygons in O(n + m) time,
+    as the intersection of the half-planes to the left of their edges.
+    The edges of each polygon are already sorted by angle, so they are
+    merged in linear time, then the half-planes are intersected with
+    a double-ended queue of the edges bounding the result.
+
+    :param polygon: A convex polygon.
+    :param other: Another convex polygon.
+    :return: List with a single ``(shell, [])`` pair, with a
+        counter-clockwise convex shell polygon, or an empty list if the
+        intersection has no area.
+    """
+    box = polygon.bounding_box
+    other_box = other.bounding_box
+    min_x = max(box.min_point.x, other_box.min_point.x)
+    min_y = max(box.min_point.y, other_box.min_point.y)
+    max_x = min(box.max_point.x, other_box.max_point.x)
+    max_y = min(box.max_point.y, other_box.max_point.y)
+    if min_x >= max_x or min_y >= max_y:
+        return []
+    # Including the sides of the box overlapping both polygons keeps
+    # the intersection of the half-planes bounded at every step
+    box_lines = [(-math.pi / 2, min_x, max_y, 0.0, -1.0),
+        (0.0, min_x, min_y, 1.0, 0.0),
+        (math.pi / 2, max_x, min_y, 0.0, 1.0),
+        (math.pi, max_x, max_y, -1.0, 0.0)]
+    lines = heapq.merge(_sorted_edge_lines(_ccw_ring(polygon)),
+        _sorted_edge_lines(_ccw_ring(other)), box_lines)
+    epsilon = planar.EPSILON
+    queue = collections.deque()
+    for line in lines:
+        while len(queue) > 1 and _outside(line,
+            _line_intersection(queue[-1], queue[-2])):
+            queue.pop()
+        while len(queue) > 1 and _outside(line,
+            _line_intersection(queue[0], queue[1])):
+            queue.popleft()
+        if queue:
+            last = queue[-1]
+            if abs(last[3] * line[4] - last[4] * line[3]) < epsilon:
+                if last[3] * line[3] + last[4] * line[4] < 0.0:
+                    return []
+                if _outside(line, last[1:3]):
+                    queue.pop()
+                else:
+                    continue
+        queue.append(line)
+    while len(queue) > 2 and _outside(queue[0],
+        _line_intersection(queue[-1], queue[-2])):
+        queue.pop()
+    while len(queue) > 2 and _outside(queue[-1],
+        _line_intersection(queue[0], queue[1])):
+        queue.popleft()
+    if len(queue) < 3:
+        return []
+    vertices = []
+    last = _line_intersection(queue[-1], queue[0])
+    for i in range(len(queue)):
+        vertex = _line_intersection(queue[i], queue[(i + 1) % len(queue)])
+        if (abs(vertex[0] - last[0]) > epsilon
+            or abs(vertex[1] - last[1]) > epsilon):
+            vertices.append(vertex)
+            last = vertex
+    if len(vertices) < 3 or _signed_area(np.array(vertices)) <= epsilon:
+        return []
+    return [(planar.Polygon(vertices, is_convex=True), [])]
+
+
+def intersects(polygon, other):
+    """Test whether two polygons intersect, that is whether they share any
+    point, including points on their boundaries. Polygons with disjoint
+    bounding boxes are rejected first. If both polygons are convex, they
+    are tested with :func:`convex_intersects` in O((n + m) log(n + m))
+    time. Otherwise
+    the polygons intersect if their edges intersect, or if either polygon
+    contains a vertex of the other.
+
+    :param polygon: A simple polygon.
+    :param other: Another simple polygon.
+    :rtype: bool
+    """
+    if not polygon.bounding_box.intersects(other.bounding_box):
+        return False
+    if polygon.is_convex and other.is_convex:
+        return bool(convex_intersects([polygon], [other])[0])
+    ring = _ccw_ring(polygon)
+    other_ring = _ccw_ring(other)
+    return bool(_points_in_ring(ring[:1], other_ring)[0]
+        or _points_in_ring(other_ring[:1], ring)[0]
+        or _edges_intersect(ring, other_ring))
+
+
+def convex_intersects(polygons, others):
+    """Test whether many pairs of convex polygons intersect, using the
+    separating axis theorem. Two convex polygons are disjoint if and only
+    if all of the vertices of one of them are strictly outside of the
+    line through an edge of the other. The vertex of the other polygon
+    furthest inside of an edge is the vertex where the direction of its
+    edges turns past the reverse of the edge direction, so it is found by
+    a binary search of the other polygon's edges sorted by angle, for the
+    edges of all of the pairs at once, in O((n + m) log(n + m)) time for
+    each pair.
+
+    Polygons that only touch are considered intersecting, consistent with
+    :meth:`~planar.BoundingBox.intersects`.
+
+    :param polygons: Sequence of convex polygons.
+    :param others: Sequence of convex polygons of the same length, to
+        test against the polygons in the same position.
+    :return: Boolean array, flagging the pairs that intersect.
+    """
+    polygons = list(polygons)
+    others = list(others)
+    if len(polygons) != len(others):
+        raise ValueError("expected %d polygons, got %d"
+            % (len(polygons), len(others)))
+    bounds = planar.BoundingBoxArray.from_shapes(polygons).bounds
+    other_bounds = planar.BoundingBoxArray.from_shapes(others).bounds
+    result = np.all((bounds[:, :2] <= other_bounds[:, 2:])
+        & (other_bounds[:, :2] <= bounds[:, 2:]), axis=1)
+    pairs = np.nonzero(result)[0].tolist()
+    if not pairs:
+        return result
+    edges = _angle_sorted_edges([polygons[i] for i in pairs])
+    other_edges = _angle_sorted_edges([others[i] for i in pairs])
+    separated = (_separating_edges(edges, other_edges, len(pairs))
+        | _separating_edges(other_edges, edges, len(pairs)))
+    result[np.array(pairs)[separated]] = False
+    return result
+
+
+def _sorted_edge_lines(ring):
+    """Return the edges of a counter-clockwise convex ring as lines
+    ``(angle, x, y, dx, dy)`` with unit directions, sorted by angle.
+    """
+    vectors = np.roll(ring, -1, axis=0) - ring
+    lengths = np.hypot(vectors[:, 0], vectors[:, 1])
+    nonzero = lengths > planar.EPSILON
+    points = ring[nonzero]
+    directions = vectors[nonzero] / lengths[nonzero, np.newaxis]
+    angles = np.arctan2(directions[:, 1], directions[:, 0])
+    start = int(np.argmin(angles)) if len(angles) else 0
+    lines = list(zip(angles.tolist(), points[:, 0].tolist(),
+        points[:, 1].tolist(), directions[:, 0].tolist(),
+        directions[:, 1].tolist()))
+    return lines[start:] + lines[:start]
+
+
+def _outside(line, point):
+    """Return True if a point is strictly to the right of a line."""
+    angle, x, y, dx, dy = line
+    return dx * (point[1] - y) - dy * (point[0] - x) < -planar.EPSILON
+
+
+def _line_intersection(line, other):
+    """Return the intersection point of two non-parallel lines."""
+    angle, x, y, dx, dy = line
+    other_angle, ox, oy, odx, ody = other
+    t = ((ox - x) * ody - (oy - y) * odx) / (dx * ody - dy * odx)
+    return (x + dx * t, y + dy * t)
+
+
+def _signed_area(ring):
+    """Return the signed area of a ring, positive if counter-clockwise."""
+    x = ring[:, 0]
+    y = ring[:, 1]
+    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))
+
+
+def _ccw_ring(polygon):
+    """Return the vertices of a polygon as an array, with counter-clockwise
+    winding and without repeated consecutive vertices.
+    """
+    ring = np.array([tuple(v) for v in polygon], dtype=float)
+    ring = ring[np.any(ring != np.roll(ring, 1, axis=0), axis=1)]
+    if _signed_area(ring) < 0.0:
+        ring = ring[::-1]
+    return ring
+
+
+def _ccw_polygon(polygon):
+    """Return a copy of a polygon with counter-clockwise winding."""
+    if _signed_area(np.array([tuple(v) for v in polygon])) < 0.0:
+        return type(polygon)(list(polygon)[::-1])
+    return polygon.__copy__()
+
+
+def _angle_sorted_edges(polygons):
+    """Return the edges of convex polygons, as a tuple of arrays of the
+    polygon of each edge, the edge start points, the unit edge directions,
+    and the edge angles in ``[0, 2 * pi)``. The edges are ordered by
+    polygon, then by angle counter-clockwise. Zero length edges are
+    dropped, and runs of collinear edges are merged into their first edge
+    along the boundary, so that the start of each edge is a corner.
+    """
+    counts = np.array([len(polygon) for polygon in polygons], dtype=np.intp)
+    ends = np.array([v for polygon in polygons for v in polygon._vectors],
+        dtype=float).reshape((-1, 2))
+    owners = np.repeat(np.arange(len(polygons)), counts)
+    starts = ends[planar.polygon._previous_vertices(counts)]
+    vectors = ends - starts
+    # Reverse the edges of clockwise polygons
+    areas = np.bincount(owners, weights=starts[:, 0] * ends[:, 1]
+        - ends[:, 0] * starts[:, 1], minlength=len(polygons))
+    clockwise = (areas < 0.0)[owners]
+    starts[clockwise] = ends[clockwise]
+    vectors[clockwise] *= -1.0
+    lengths = np.hypot(vectors[:, 0], vectors[:, 1])
+    nonzero = lengths > planar.EPSILON
+    owners = owners[nonzero]
+    starts = starts[nonzero]
+    clockwise = clockwise[nonzero]
+    directions = vectors[nonzero] / lengths[nonzero, np.newaxis]
+    # Drop the edges continuing straight on from the edge before them
+    # along the boundary, which is the next edge for clockwise polygons
+    previous = planar.polygon._previous_vertices(
+        np.bincount(owners, minlength=len(polygons)))
+    following = np.empty_like(previous)
+    following[previous] = np.arange(len(previous))
+    before = directions[np.where(clockwise, following, previous)]
+    straight = (np.abs(before[:, 0] * directions[:, 1]
+        - before[:, 1] * directions[:, 0]) <= planar.EPSILON) & (
+        np.einsum('ij,ij->i', before, directions) > 0.0)
+    owners = owners[~straight]
+    starts = starts[~straight]
+    directions = directions[~straight]
+    angles = np.arctan2(directions[:, 1], directions[:, 0]) % (2.0 * math.pi)
+    order = np.lexsort((angles, owners))
+    return owners[order], starts[order], directions[order], angles[order]
+
+
+def _separating_edges(edges, other_edges, count):
+    """Return a boolean array flagging which of ``count`` polygons have
+    an edge separating them from the other polygon with the same index,
+    given their edges as returned by :func:`_angle_sorted_edges`.
+    """
+    owners, starts, directions, angles = edges
+    other_owners, other_starts, _, other_angles = other_edges
+    # An edge cannot separate the polygon from an other polygon that is
+    # a single point, which is already tested by the bounding boxes
+    tested = np.bincount(other_owners, minlength=count)[owners] > 0
+    owners = owners[tested]
+    starts = starts[tested]
+    directions = directions[tested]
+    targets = (angles[tested] + math.pi) % (2.0 * math.pi)
+    # Keys that order the edges of all of the polygons at once, by polygon
+    # and then by angle, with the angles of each polygon within a span of 8
+    period = 8.0
+    other_keys = other_owners * period + other_angles
+    found = np.searchsorted(other_keys, owners * period + targets)
+    # Past the last edge of the other polygon, wrap around to its first
+    first = np.searchsorted(other_keys, owners * period)
+    wrap = found >= len(other_keys)
+    wrap[~wrap] = other_owners[found[~wrap]] != owners[~wrap]
+    found[wrap] = first[wrap]
+    offsets = other_starts[found] - starts
+    inside = (directions[:, 0] * offsets[:, 1]
+        - directions[:, 1] * offsets[:, 0])
+    return np.bincount(owners[inside < -planar.EPSILON], minlength=count) > 0
+
+
+def _edges_intersect(ring, other_ring):
+    """Return True if any edge of a ring intersects an edge of another
+    ring, including edges that touch or overlap.
+    """
+    epsilon = planar.EPSILON
+    ends = np.roll(ring, -1, axis=0)
+    other_ends = np.roll(other_ring, -1, axis=0)
+    tree = planar.index._PackedTree(np.hstack((
+        np.minimum(other_ring, other_ends) - epsilon,
+        np.maximum(other_ring, other_ends) + epsilon)))
+    edges, other_edges = tree.query_bounds(np.hstack((
+        np.minimum(ring, ends), np.maximum(ring, ends))))
+    a = ring[edges]
+    b = ends[edges]
+    c = other_ring[other_edges]
+    d = other_ends[other_edges]
+    def side(start, end, point):
+        vector = end - start
+        offset = point - start
+        cross = vector[:, 0] * offset[:, 1] - vector[:, 1] * offset[:, 0]
+        length = np.hypot(vector[:, 0], vector[:, 1])
+        return np.where(np.abs(cross) <= epsilon * length, 0.0,
+            np.sign(cross))
+    # Edges with overlapping boxes intersect unless the ends of either
+    # edge are strictly on the same side of the other edge
+    return bool(np.any((side(a, b, c) * side(a, b, d) <= 0.0)
+        & (side(c, d, a) * side(c, d, b) <= 0.0)))
+
+
+def _split_rings(ring, other_ring):
+    """Split the edges of two rings at their intersection points, and at
+    the vertices of each ring on the edges of the other. The same
+    coordinates are inserted into both rings, so that the fragments of
+    their edges meet exactly. Vertices of the other ring within
+    ``planar.EPSILON`` of a vertex of the ring are first snapped to it.
+    """
+    epsilon = planar.EPSILON
+    nearest, distances = planar.KDTree(ring).nearest_points(other_ring)
+    snap = distances[:, 0] <= epsilon
+    other_ring = other_ring.copy()
+    other_ring[snap] = ring[nearest[snap, 0]]
+    other_ring = other_ring[
+        np.any(other_ring != np.roll(other_ring, 1, axis=0), axis=1)]
+    ends = np.roll(ring, -1, axis=0)
+    other_ends = np.roll(other_ring, -1, axis=0)
+    tree = planar.index._PackedTree(np.hstack((
+        np.minimum(other_ring, other_ends) - epsilon,
+        np.maximum(other_ring, other_ends) + epsilon)))
+    edges, other_edges = tree.query_bounds(np.hstack((
+        np.minimum(ring, ends), np.maximum(ring, ends))))
+    starts = ring[edges]
+    vectors = ends[edges] - starts
+    other_starts = other_ring[other_edges]
+    other_vectors = other_ends[other_edges] - other_starts
+    lengths = np.hypot(vectors[:, 0], vectors[:, 1])
+    other_lengths = np.hypot(other_vectors[:, 0], other_vectors[:, 1])
+    def cross(a, b):
+        return a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]
+    def interior(along, length):
+        return (along > epsilon) & (along < length - epsilon)
+    # Edges crossing at points interior to both edges
+    to_other = other_starts - starts
+    denom = cross(vectors, other_vectors)
+    crossing = np.abs(denom) > epsilon * lengths * other_lengths
+    denom = np.where(crossing, denom, 1.0)
+    t = cross(to_other, other_vectors) / denom
+    u = cross(to_other, vectors) / denom
+    crossing &= interior(t * lengths, lengths) & interior(
+        u * other_lengths, other_lengths)
+    points = starts[crossing] + vectors[crossing] * t[crossing, np.newaxis]
+    # Vertices of each ring on the interior of the edges of the other
+    on_edge = (np.abs(cross(vectors, to_other)) < epsilon * lengths) & (
+        interior(np.einsum('ij,ij->i', vectors, to_other) / lengths,
+            lengths))
+    other_on_edge = (np.abs(cross(other_vectors, -to_other))
+        < epsilon * other_lengths) & (interior(np.einsum('ij,ij->i',
+            other_vectors, -to_other) / other_lengths, other_lengths))
+    ring = _insert_points(ring,
+        np.concatenate((edges[crossing], edges[on_edge])),
+        np.concatenate((points, other_starts[on_edge])))
+    other_ring = _insert_points(other_ring,
+        np.concatenate((other_edges[crossing], other_edges[other_on_edge])),
+        np.concatenate((points, starts[other_on_edge])))
+    return ring, other_ring
+
+
+def _insert_points(ring, edges, points):
+    """Insert points into the edges of a ring, in order along each edge."""
+    if not len(edges):
+        return ring
+    vectors = np.roll(ring, -1, axis=0) - ring
+    along = np.einsum('ij,ij->i', points - ring[edges], vectors[edges])
+    all_edges = np.concatenate((np.arange(len(ring)), edges))
+    all_along = np.concatenate((np.full(len(ring), -np.inf), along))
+    ring = np.concatenate((ring, points))[np.lexsort((all_along, all_edges))]
+    return ring[np.any(ring != np.roll(ring, 1, axis=0), axis=1)]
+
+
+def _classify_fragments(starts, ends, other_ring):
+    """Classify the fragments of a ring against the fragments of the
+    other ring. Fragments coinciding with a fragment of the other ring
+    are shared, with the same or the opposite direction. Other fragments
+    are inside or outside of the other ring, tested at their midpoints.
+    """
+    other_starts = other_ring
+    other_ends = np.roll(other_ring, -1, axis=0)
+    other_keys = set(zip(map(tuple, other_starts.tolist()),
+        map(tuple, other_ends.tolist())))
+    start_keys = list(map(tuple, starts.tolist()))
+    end_keys = list(map(tuple, ends.tolist()))
+    same = np.array([key in other_keys
+        for key in zip(start_keys, end_keys)], dtype=bool)
+    opposite = np.array([key in other_keys
+        for key in zip(end_keys, start_keys)], dtype=bool)
+    inside = _points_in_ring((starts + ends) * 0.5, other_ring)
+    return np.where(same, _SAME,
+        np.where(opposite, _OPPOSITE, np.where(inside, _INSIDE, _OUTSIDE)))
+
+
+def _points_in_ring(points, ring):
+    """Test which points are inside of a ring, using the crossing number.
+    The edges are tested against all of the points at once, in chunks to
+    bound the memory used.
+    """
+    points = np.asarray(points, dtype=float).reshape((-1, 2))
+    ends = np.roll(ring, -1, axis=0)
+    crossings = np.zeros(len(points), dtype=np.intp)
+    chunk = max(_POINT_CHUNK_SIZE // max(len(points), 1), 1)
+    px = points[:, 0, np.newaxis]
+    py = points[:, 1, np.newaxis]
+    for i in range(0, len(ring), chunk):
+        ax, ay = ring[i:i + chunk].T
+        bx, by = ends[i:i + chunk].T
+        spans = (ay > py) != (by > py)
+        dy = np.where(ay == by, 1.0, by - ay)
+        cross_x = ax + (py - ay) * (bx - ax) / dy
+        crossings += np.count_nonzero(spans & (px < cross_x), axis=1)
+    return crossings % 2 == 1
+
+
+_POINT_CHUNK_SIZE = 1 << 20
+
+
+def _link(starts, ends):
+    """Link fragments, given as lists of start and end points, into
+    closed rings. Where several fragments leave a vertex, the fragment
+    turning furthest to the left from the incoming fragment is taken,
+    so that rings touching at a vertex are kept apart. Rings that still
+    return to one of their vertices, enclosing a hole touching the
+    outside, are split into separate loops there.
+    """
+    outgoing = collections.defaultdict(list)
+    for i, start in enumerate(starts):
+        outgoing[tuple(start)].append(i)
+    used = [False] * len(starts)
+    rings = []
+    tau = 2.0 * math.pi
+    for first in range(len(starts)):
+        if used[first]:
+            continue
+        ring = []
+        i = first
+        while True:
+            used[i] = True
+            ring.append(starts[i])
+            start = starts[i]
+            end = ends[i]
+            candidates = [j for j in outgoing[tuple(end)]
+                if not used[j] or j == first]
+            if not candidates:
+                ring = None
+                break
+            if len(candidates) > 1:
+                back = math.atan2(start[1] - end[1], start[0] - end[0])
+                def turn(j):
+                    angle = (back - math.atan2(ends[j][1] - end[1],
+                        ends[j][0] - end[0])) % tau
+                    return angle if angle > 0.0 else tau
+                i = min(candidates, key=turn)
+            else:
+                i = candidates[0]
+            if i == first:
+                break
+        if ring is not None:
+            rings.extend(np.array(loop, dtype=float)
+                for loop in _split_loops(ring))
+    return rings
+
+
+def _split_loops(ring):
+    """Split a ring that visits a vertex more than once into simple
+    loops, cutting off each loop when the ring returns to a vertex
+    already on it.
+    """
+    loops = []
+    stack = []
+    positions = {}
+    for point in ring:
+        key = tuple(point)
+        if key in positions:
+            position = positions[key]
+            loop = stack[position:]
+            del stack[position + 1:]
+            for other in loop[1:]:
+                del positions[tuple(other)]
+            loops.append(loop)
+        else:
+            positions[key] = len(stack)
+            stack.append(point)
+    loops.append(stack)
+    return loops
+
+
+def _assemble(rings):
+    """Assemble rings into polygons with holes. Collinear vertices are
+    removed and rings without area are dropped. Counter-clockwise rings
+    are shells, and each clockwise ring is a hole in the smallest shell
+    containing it.
+    """
+    epsilon = planar.EPSILON
+    shells = []
+    holes = []
+    for ring in rings:
+        previous = np.roll(ring, 1, axis=0)
+        following = np.roll(ring, -1, axis=0)
+        incoming = ring - previous
+        outgoing = following - ring
+        straight = (np.abs(incoming[:, 0] * outgoing[:, 1]
+            - incoming[:, 1] * outgoing[:, 0]) <= epsilon * np.hypot(
+                incoming[:, 0], incoming[:, 1]) * np.hypot(
+                outgoing[:, 0], outgoing[:, 1])) & (
+            np.einsum('ij,ij->i', incoming, outgoing) > 0.0)
+        ring = ring[~straight]
+        if len(ring) < 3:
+            continue
+        area = _signed_area(ring)
+        if area > epsilon:
+            shells.append((area, ring))
+        elif area < -epsilon:
+            holes.append(ring)
+    result = [(planar.Polygon(ring.tolist()), []) for area, ring in shells]
+    for ring in holes:
+        point = (ring[0] + ring[1]) * 0.5
+        containing = [(area, i) for i, (area, shell) in enumerate(shells)
+            if _points_in_ring(point, shell)[0]]
+        # Holes are always inside of a shell for simple input polygons
+        if containing:
+            area, i = min(containing)
+            result[i][1].append(planar.Polygon(ring.tolist()))
+    return result
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
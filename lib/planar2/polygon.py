@@ -33,6 +33,7 @@ import sys
 import math
 import itertools
 import bisect
+import numpy as np
 import planar2 as planar
 from planar2.util import cached_property, assert_unorderable, cos_sin_deg
 
@@ -73,7 +74,9 @@ class Polygon(planar.Seq2):
 
     .. note::
         If the polygon is mutated, the cached values of ``is_convex`` and 
-        ``is_simple`` will be invalidated.
+        ``is_simple`` will be invalidated. Multiplying the polygon by a
+        non-degenerate :class:`~planar.Affine` transform preserves them,
+        since affine transforms do not change these properties.
     """
 
     def __init__(self, vertices, is_convex=None, is_simple=None):
@@ -109,13 +112,10 @@ class Polygon(planar.Seq2):
         :param angle: The starting angle for the vertices, in degrees.
         :type angle: float
         """
-        cx, cy = center
         angle_step = 360.0 / vertex_count
-        verts = []
-        for i in range(vertex_count):
-            x, y = cos_sin_deg(angle)
-            verts.append((x * radius + cx, y * radius + cy))
-            angle += angle_step
+        verts = planar.Vec2Array.from_polar(
+            _accumulate_angles(angle, angle_step, vertex_count), radius)
+        verts += center
         poly = cls(vertices=verts, is_convex=True)
         poly._centroid = planar.Vec2(*center)
         poly._max_r = radius
@@ -147,16 +147,13 @@ class Polygon(planar.Seq2):
         if peak_count < 2:
             raise ValueError(
                 "star polygon must have a minimum of 2 peaks")
-        cx, cy = center
         angle_step = 180.0 / peak_count
-        verts = []
-        for i in range(peak_count):
-            x, y = cos_sin_deg(angle)
-            verts.append((x * radius1 + cx, y * radius1 + cy))
-            angle += angle_step
-            x, y = cos_sin_deg(angle)
-            verts.append((x * radius2 + cx, y * radius2 + cy))
-            angle += angle_step
+        radii = np.empty(peak_count * 2)
+        radii[0::2] = radius1
+        radii[1::2] = radius2
+        verts = planar.Vec2Array.from_polar(
+            _accumulate_angles(angle, angle_step, peak_count * 2), radii)
+        verts += center
         is_simple = (radius1 > 0.0) == (radius2 > 0.0)
         poly = cls(verts, is_convex=(radius1 == radius2), 
             is_simple=is_simple or None)
@@ -200,14 +197,28 @@ class Polygon(planar.Seq2):
         self._centroid = _unknown
         self._max_r = self._max_r2 = None
         self._min_r = self._min_r2 = None
+        self._edge_index = None
+        self._triangles = None
 
     @property
     def bounding_box(self):
         """The bounding box of the polygon"""
         if self._bbox is None:
-            self._bbox = planar.BoundingBox(self)
+            self._bbox = planar.BoundingBox(self._vectors)
         return self._bbox
 
+    @property
+    def edge_index(self):
+        """A :class:`~planar.SegmentIndex` over the edges of the polygon,
+        for nearest edge queries and ray casting. Edge ``i`` runs from 
+        vertex ``i - 1`` to vertex ``i``. The index is built on first 
+        access and cached until the polygon is mutated.
+        """
+        if self._edge_index is None:
+            self._edge_index = planar.SegmentIndex(
+                planar.LineSegmentArray.from_polygon(self))
+        return self._edge_index
+
     @property
     def is_convex(self):
         """True if the polygon is convex.
@@ -533,12 +544,81 @@ class Polygon(planar.Seq2):
 
     def __imul__(self, other):
         try:
-           other.itransform(self)
-           self._clear_cached_properties()
-           return self
+            itransform = other.itransform
         except AttributeError:
             raise TypeError("Cannot multiply %s with %s"
                 % (type(self).__name__, type(other).__name__))
+        # Transform the vertex list directly, the cached 
+        # properties are updated all at once afterward
+        itransform(self._vectors)
+        if isinstance(other, planar.Affine) and not other.is_degenerate:
+            self._transform_cached_properties(other)
+        else:
+            self._clear_cached_properties()
+        return self
+
+    def __mul__(self, other):
+        if not hasattr(other, 'itransform'):
+            return NotImplemented
+        copy = self.__copy__()
+        copy *= other
+        return copy
+
+    __rmul__ = __mul__
+
+    def _transform_cached_properties(self, transform):
+        """Update the cached properties after the vertices have been
+        mapped by a non-degenerate affine transform. Convexity, simplicity,
+        degeneracy and duplicate vertices are invariant, the centroid maps to
+        the transformed centroid, and the winding is reversed only by
+        reflecting transforms. The remaining properties are transformed
+        cheaply where possible, or recomputed or cleared otherwise.
+        """
+        sa, sb, sc, sd, se, sf, _, _, _ = transform
+        det = transform.determinant
+        if '_winding' in self.__dict__ and det < 0.0:
+            self._winding = -self._winding
+        if '_pnp_triangle_test' in self.__dict__:
+            # The closure depends on the vertex order by y, so
+            # it is cheaper to rebuild it on demand
+            del self.__dict__['_pnp_triangle_test']
+        if self._centroid is not _unknown and self._centroid is not None:
+            self._centroid = transform * self._centroid
+        self._edge_index = None
+        if self._bbox is not None:
+            if (sb == 0.0 and sd == 0.0) or (sa == 0.0 and se == 0.0):
+                self._bbox = transform.transform_bbox(self._bbox)
+            else:
+                self._bbox = None
+        if self._max_r is not None or self._min_r is not None:
+            if (transform.is_conformal 
+                and abs(sa*sa + sd*sd - sb*sb - se*se) < planar.EPSILON):
+                # Similarity transform, radii scale uniformly
+                scale = math.sqrt(abs(det))
+                if self._max_r is not None:
+                    self._max_r *= scale
+                    self._max_r2 = self._max_r * self._max_r
+                if self._min_r is not None:
+                    self._min_r *= scale
+                    self._min_r2 = self._min_r * self._min_r
+            else:
+                self._max_r = self._max_r2 = None
+                self._min_r = self._min_r2 = None
+        if self._y_polylines is not None:
+            if sb == 0.0:
+                # Vertical order is preserved, or reversed by a flip,
+                # so the polylines can be transformed directly
+                lpline, rpline = [
+                    [(y*se + sf, x*sa + y*sd + sc) for y, x in pline] 
+                    for pline in self._y_polylines]
+                if se < 0.0:
+                    lpline.reverse()
+                    rpline.reverse()
+                if sa < 0.0:
+                    lpline, rpline = rpline, lpline
+                self._y_polylines = lpline, rpline
+            else:
+                self._split_y_polylines()
 
     def __copy__(self):
         copy = self.from_points(self)
@@ -553,12 +633,15 @@ class Polygon(planar.Seq2):
         copy._max_r2 = self._max_r2
         copy._min_r = self._min_r
         copy._min_r2 = self._min_r2
+        copy._edge_index = self._edge_index
+        copy._triangles = self._triangles
         return copy
 
     def __deepcopy__(self, memo):
         copy = self.__copy__()
         copy._y_polylines = None
         copy._bbox = None
+        copy._edge_index = None
         return copy
 
     ## Point in poly methods ##
@@ -835,6 +918,333 @@ class Polygon(planar.Seq2):
         else:
             return self._pt_tangents(point)
 
+    ## Triangulation ##
+
+    def triangulate(self):
+        """Triangulate the polygon, returning the vertex indices of its
+        triangles. The triangles have the same winding as the polygon.
+
+        Convex polygons are triangulated as a fan from the first vertex.
+        Other polygons are split into y-monotone pieces with a plane sweep 
+        that adds diagonals at their split and merge vertices, and each 
+        piece is then triangulated in linear time. The polygon must be 
+        simple, or the results are undefined. The triangulation is cached
+        until the polygon is mutated.
+
+        Runtime complexity: O(n) convex, O(n log n) non-convex
+
+        :return: Read-only integer array of shape ``(n - 2, 3)``.
+        :raises ValueError: If the polygon is known not to be simple.
+        """
+        if self._triangles is None:
+            if self._simple is False:
+                raise ValueError(
+                    "Polygon.triangulate(): polygon is not simple")
+            count = len(self)
+            if self.is_convex:
+                fan = np.arange(1, count - 1)
+                triangles = np.column_stack(
+                    (np.zeros_like(fan), fan, fan + 1))
+            else:
+                points = [tuple(v) for v in self._vectors]
+                indices = np.arange(count)
+                clockwise = _ring_area(points) < 0.0
+                if clockwise:
+                    points.reverse()
+                    indices = indices[::-1]
+                triangles = []
+                for piece in _monotone_pieces(
+                    points, _monotone_diagonals(points)):
+                    triangles.extend(_triangulate_monotone(points, piece))
+                triangles = indices[np.array(triangles, dtype=np.intp)]
+                # Give the triangles the winding of the polygon
+                verts = np.array(self._vectors, dtype=float)[triangles]
+                ab = verts[:, 1] - verts[:, 0]
+                ac = verts[:, 2] - verts[:, 0]
+                reverse = (
+                    (ab[:, 0] * ac[:, 1] - ab[:, 1] * ac[:, 0] < 0.0) 
+                    != clockwise)
+                triangles[reverse] = triangles[reverse][:, ::-1]
+            triangles.setflags(write=False)
+            self._triangles = triangles
+        return self._triangles
+
+    def sample_points(self, count, rng=None):
+        """Generate points uniformly distributed inside of the polygon.
+
+        Each point is placed in a triangle of :meth:`triangulate`, chosen 
+        with probability proportional to its area, at uniformly random
+        barycentric coordinates. All of the points are generated at once,
+        and no points are rejected, regardless of the shape of the polygon.
+        The polygon must be simple.
+
+        :param count: The number of points to generate.
+        :param rng: A :class:`numpy.random.Generator` or
+            :class:`numpy.random.RandomState` for the random numbers. If
+            omitted, a new generator is created with a random seed.
+        :return: Array of shape ``(count, 2)`` holding the points.
+        :raises ValueError: If the polygon has no area.
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+        verts = np.array(self._vectors, dtype=float)[self.triangulate()]
+        a = verts[:, 0]
+        ab = verts[:, 1] - a
+        ac = verts[:, 2] - a
+        areas = np.abs(ab[:, 0] * ac[:, 1] - ab[:, 1] * ac[:, 0])
+        cumulative = np.cumsum(areas)
+        if not len(cumulative) or cumulative[-1] <= 0.0:
+            raise ValueError("Polygon.sample_points(): polygon has no area")
+        random = rng.random((count, 3))
+        triangles = np.searchsorted(
+            cumulative, random[:, 0] * cumulative[-1], side='right')
+        # Guard against rounding up past the last triangle
+        triangles = np.minimum(triangles, len(cumulative) - 1)
+        # Reflect points in the far half of the parallelogram spanned by
+        # the triangle's edges back into the triangle
+        u = random[:, 1:2]
+        v = random[:, 2:3]
+        outside = (u + v > 1.0)
+        u = np.where(outside, 1.0 - u, u)
+        v = np.where(outside, 1.0 - v, v)
+        return a[triangles] + u * ab[triangles] + v * ac[triangles]
+
+    ## Clipping ##
+
+    def clip_to_box(self, box):
+        """Clip the polygon to a box, using the Sutherland-Hodgman 
+        algorithm against each side of the box in turn. 
+
+        If the box contains the polygon's bounding box, a copy of the 
+        polygon is returned without clipping, and if the bounding boxes 
+        are disjoint, None is returned without clipping. Clipping a convex 
+        polygon results in a convex polygon. Clipping a concave polygon
+        that crosses the box more than once results in a single polygon 
+        with coincident edges along the sides of the box, joining the 
+        parts inside of the box.
+
+        Runtime complexity: O(n)
+
+        :param box: The box to clip to, or a shape with a bounding box.
+        :type box: :class:`~planar.BoundingBox`
+        :return: The clipped polygon, or None if nothing of the polygon 
+            with a non-zero area is inside of the box.
+        :rtype: Polygon
+        """
+        box = box.bounding_box
+        bbox = self.bounding_box
+        if not box.intersects(bbox):
+            return None
+        min_x, min_y = box.min_point
+        max_x, max_y = box.max_point
+        if (min_x <= bbox.min_point.x and min_y <= bbox.min_point.y
+            and bbox.max_point.x <= max_x and bbox.max_point.y <= max_y):
+            return self.__copy__()
+        points = [tuple(v) for v in self._vectors]
+        for axis, bound, sign in ((0, min_x, 1.0), (0, max_x, -1.0), 
+            (1, min_y, 1.0), (1, max_y, -1.0)):
+            points = _clip_to_bound(points, axis, bound, sign)
+            if not points:
+                return None
+        vertices = []
+        last = points[-1]
+        for point in points:
+            if point != last:
+                vertices.append(point)
+                last = point
+        if len(vertices) < 3 or abs(_ring_area(vertices)) <= planar.EPSILON:
+            # Only edges along the sides of the box remain
+            return None
+        convex = self._convex is True or None
+        return type(self)(vertices, is_convex=convex)
+
+    @classmethod
+    def clip_polygons_to_box(cls, polygons, box):
+        """Clip many polygons to the same box, with the same results as
+        :meth:`clip_to_box` for each polygon. The polygons that the box
+        contains or that are outside of the box are found from their 
+        bounding boxes, and the remaining polygons are clipped all at once
+        with vectorized Sutherland-Hodgman clipping.
+
+        :param polygons: Sequence of polygons.
+        :param box: The box to clip to, or a shape with a bounding box.
+        :type box: :class:`~planar.BoundingBox`
+        :return: List with the clipped polygon, or None, for each polygon.
+        """
+        polygons = list(polygons)
+        box = box.bounding_box
+        bounds = planar.BoundingBoxArray.from_shapes(polygons).bounds
+        clip = np.array(tuple(box.min_point) + tuple(box.max_point))
+        inside = np.all((bounds[:, :2] >= clip[:2]) 
+            & (bounds[:, 2:] <= clip[2:]), axis=1)
+        outside = np.any((bounds[:, :2] > clip[2:]) 
+            | (bounds[:, 2:] < clip[:2]), axis=1)
+        results = [poly.__copy__() if is_inside else None 
+            for poly, is_inside in zip(polygons, inside.tolist())]
+        crossing = np.nonzero(~inside & ~outside)[0].tolist()
+        if not crossing:
+            return results
+        counts = np.array([len(polygons[i]) for i in crossing])
+        verts = np.array([tuple(v) for i in crossing 
+            for v in polygons[i]], dtype=float)
+        for axis, bound, sign in ((0, clip[0], 1.0), (0, clip[2], -1.0), 
+            (1, clip[1], 1.0), (1, clip[3], -1.0)):
+            verts, counts = _clip_columns_to_bound(
+                verts, counts, axis, bound, sign)
+        # Drop vertices coincident with the previous vertex
+        if len(verts):
+            keep = np.any(verts != verts[_previous_vertices(counts)], axis=1)
+            verts = verts[keep]
+            counts = np.bincount(np.repeat(np.arange(len(counts)), counts), 
+                weights=keep, minlength=len(counts)).astype(np.intp)
+        # Signed area of each clipped polygon
+        starts = verts[_previous_vertices(counts)]
+        areas = 0.5 * np.bincount(np.repeat(np.arange(len(counts)), counts),
+            weights=starts[:, 0] * verts[:, 1] - verts[:, 0] * starts[:, 1],
+            minlength=len(counts))
+        nonzero = (np.abs(areas) > planar.EPSILON).tolist()
+        stops = np.cumsum(counts).tolist()
+        verts = verts.tolist()
+        start = 0
+        for i, stop, is_nonzero in zip(crossing, stops, nonzero):
+            if stop - start >= 3 and is_nonzero:
+                convex = polygons[i]._convex is True or None
+                results[i] = cls(verts[start:stop], is_convex=convex)
+            start = stop
+        return results
+
+    ## Simplification ##
+
+    def simplified(self, tolerance, method='douglas_peucker', 
+        preserve_topology=False):
+        """Return a simplified copy of the polygon, with the vertices that
+        contribute least to its shape removed. See 
+        :func:`planar.simplify.simplify` for the methods. The first vertex
+        is always kept, as well as at least two others. Simplifying a 
+        convex polygon results in a convex polygon.
+
+        :param tolerance: For the ``'douglas_peucker'`` method, the 
+            maximum distance of a removed vertex from the simplified edges.
+            For the ``'visvalingam_whyatt'`` method, the maximum area of 
+            the triangle formed by a removed vertex and its neighbors.
+        :param method: ``'douglas_peucker'`` or ``'visvalingam_whyatt'``.
+        :param preserve_topology: If true, the edges of the simplified 
+            polygon do not cross, so that a simple polygon stays simple.
+        :rtype: Polygon
+        """
+        return self.simplify_polygons(
+            [self], tolerance, method, preserve_topology)[0]
+
+    @classmethod
+    def simplify_polygons(cls, polygons, tolerance, method='douglas_peucker',
+        preserve_topology=False):
+        """Simplify many polygons, with the same results as 
+        :meth:`simplified` for each polygon. With the ``'douglas_peucker'``
+        method, all of the polygons are simplified at once.
+
+        :param polygons: Sequence of polygons.
+        :return: List of the simplified polygons.
+        """
+        polygons = list(polygons)
+        rings = [[tuple(v) for v in poly._vectors] for poly in polygons]
+        kept = planar.simplify.simplify(rings, tolerance, method, 
+            closed=True, preserve_topology=preserve_topology)
+        results = []
+        for poly, ring, indices in zip(polygons, rings, kept):
+            convex = poly._convex is True or None
+            results.append(cls([ring[i] for i in indices.tolist()], 
+                is_convex=convex))
+        return results
+
+    ## Intersection Tests ##
+
+    def intersects(self, other):
+        """Return True if this polygon and another simple polygon share 
+        any point, including points on their boundaries, so that polygons
+        that only touch intersect.
+
+        Polygons with disjoint bounding boxes are rejected without further
+        calculation. If both polygons are convex, they are tested with the 
+        separating axis theorem, in O((n + m) log(n + m)) time. Otherwise
+        the edges of the polygons are tested for intersection.
+
+        :param other: The polygon to test.
+        :type other: Polygon
+        :rtype: bool
+        """
+        return planar.overlay.intersects(self, other)
+
+    @classmethod
+    def polygons_intersect(cls, polygons, others):
+        """Test many pairs of polygons for intersection, with the same
+        results as :meth:`intersects` for each pair. Pairs with disjoint
+        bounding boxes are rejected, and pairs of convex polygons are 
+        tested all at once with vectorized separating axis tests.
+
+        :param polygons: Sequence of polygons.
+        :param others: Sequence of polygons of the same length, to test
+            against the polygons in the same position.
+        :return: Boolean array, flagging the pairs that intersect.
+        """
+        polygons = list(polygons)
+        others = list(others)
+        if len(polygons) != len(others):
+            raise ValueError("expected %d polygons, got %d"
+                % (len(polygons), len(others)))
+        convex = np.array([poly.is_convex and other.is_convex 
+            for poly, other in zip(polygons, others)], dtype=bool)
+        result = np.zeros(len(polygons), dtype=bool)
+        pairs = np.nonzero(convex)[0].tolist()
+        result[pairs] = planar.overlay.convex_intersects(
+            [polygons[i] for i in pairs], [others[i] for i in pairs])
+        for i in np.nonzero(~convex)[0].tolist():
+            result[i] = planar.overlay.intersects(polygons[i], others[i])
+        return result
+
+    ## Boolean Operations ##
+
+    def union(self, other):
+        """Compute the union of this polygon and another simple polygon.
+
+        :param other: The polygon to combine with.
+        :type other: Polygon
+        :return: List of ``(shell, holes)`` pairs, each a polygon with
+            counter-clockwise winding, and a list of the polygons that are
+            holes in it, with clockwise winding.
+        """
+        return planar.overlay.overlay(self, other, 'union')
+
+    def intersection(self, other):
+        """Compute the intersection of this polygon and another simple
+        polygon. When both polygons are convex, the intersection is 
+        computed in O(n + m) time.
+
+        :param other: The polygon to intersect with.
+        :type other: Polygon
+        :return: List of ``(shell, holes)`` pairs, as for :meth:`union`.
+        """
+        return planar.overlay.overlay(self, other, 'intersection')
+
+    def difference(self, other):
+        """Compute the difference of this polygon minus another simple
+        polygon.
+
+        :param other: The polygon to subtract.
+        :type other: Polygon
+        :return: List of ``(shell, holes)`` pairs, as for :meth:`union`.
+        """
+        return planar.overlay.overlay(self, other, 'difference')
+
+    def symmetric_difference(self, other):
+        """Compute the symmetric difference (exclusive or) of this polygon
+        and another simple polygon.
+
+        :param other: The other polygon.
+        :type other: Polygon
+        :return: List of ``(shell, holes)`` pairs, as for :meth:`union`.
+        """
+        return planar.overlay.overlay(self, other, 'symmetric_difference')
+
     ## Convex Hull ##
 
     @classmethod
@@ -861,6 +1271,77 @@ class Polygon(planar.Seq2):
         return cls(_adaptive_quick_hull(points), is_convex=True)
 
 
+def _clip_to_bound(points, axis, bound, sign):
+    """Clip a closed sequence of points to the half-plane where
+    ``sign * (point[axis] - bound) >= 0``.
+    """
+    other = 1 - axis
+    clipped = []
+    last = points[-1]
+    last_inside = sign * (last[axis] - bound) >= 0.0
+    for point in points:
+        inside = sign * (point[axis] - bound) >= 0.0
+        if inside != last_inside:
+            t = (bound - last[axis]) / (point[axis] - last[axis])
+            cross = [0.0, 0.0]
+            cross[axis] = bound
+            cross[other] = last[other] + (point[other] - last[other]) * t
+            clipped.append(tuple(cross))
+        if inside:
+            clipped.append(point)
+        last = point
+        last_inside = inside
+    return clipped
+
+
+def _previous_vertices(counts):
+    """Return the index of the previous vertex of each vertex, for 
+    polygons with the given vertex counts stored consecutively.
+    """
+    previous = np.arange(-1, int(counts.sum()) - 1)
+    stops = np.cumsum(counts)
+    starts = stops - counts
+    nonempty = counts > 0
+    previous[starts[nonempty]] = stops[nonempty] - 1
+    return previous
+
+
+def _clip_columns_to_bound(verts, counts, axis, bound, sign):
+    """Clip polygons with the given vertex counts, stored consecutively
+    in an array of vertices, to the half-plane where 
+    ``sign * (vertex[axis] - bound) >= 0``. Return the clipped vertices 
+    and vertex counts.
+    """
+    if not len(verts):
+        return verts, counts
+    previous = _previous_vertices(counts)
+    inside = sign * (verts[:, axis] - bound) >= 0.0
+    crossing = inside != inside[previous]
+    # Each vertex emits the crossing point of the edge leading to it,
+    # then itself, if inside
+    emitted = crossing.astype(np.intp) + inside
+    offsets = np.cumsum(emitted) - emitted
+    clipped = np.empty((int(emitted.sum()), 2))
+    last = verts[previous[crossing]]
+    point = verts[crossing]
+    t = (bound - last[:, axis]) / (point[:, axis] - last[:, axis])
+    cross = last + (point - last) * t[:, np.newaxis]
+    cross[:, axis] = bound
+    clipped[offsets[crossing]] = cross
+    clipped[(offsets + crossing)[inside]] = verts[inside]
+    counts = np.bincount(np.repeat(np.arange(len(counts)), counts), 
+        weights=emitted, minlength=len(counts)).astype(np.intp)
+    return clipped, counts
+
+
+def _accumulate_angles(angle, angle_step, count):
+    """Return an array of count angles starting from angle and
+    successively incremented by angle_step
+    """
+    steps = np.full(count, angle_step * 1.0)
+    steps[0] = angle
+    return np.add.accumulate(steps)
+
 def _adaptive_quick_hull(points):
     """Compute the convex hull from an arbitrary collection of points
     using an adaptive quick hull algorithm. Return the points of the hull
@@ -1007,6 +1488,216 @@ def _ahull_sort_points(hull, points, p0, p1):
     hull.extend(stack)
 
 
+def _ring_area(points):
+    """Return the signed area of a ring of points, positive if 
+    counter-clockwise.
+    """
+    area = 0.0
+    x0, y0 = points[-1]
+    for x1, y1 in points:
+        area += x0 * y1 - x1 * y0
+        x0, y0 = x1, y1
+    return area * 0.5
+
+
+def _above(p, q):
+    """Return True if point p is above q in the sweep order, from top to
+    bottom, and from left to right for points at the same height.
+    """
+    return p[1] > q[1] or (p[1] == q[1] and p[0] < q[0])
+
+
+_START, _END, _SPLIT, _MERGE, _REGULAR = range(5)
+
+
+def _monotone_diagonals(points):
+    """Return the diagonals that split a simple counter-clockwise polygon 
+    into y-monotone pieces, as pairs of vertex indices. The polygon is 
+    swept from top to bottom, keeping the edges with the interior to their
+    right ordered from left to right across the sweep line, each with a
+    helper vertex. A diagonal is added upward from each split vertex, and 
+    downward from each merge vertex, to the helper of the edge to its left.
+    """
+    count = len(points)
+    kinds = []
+    for i in range(count):
+        px, py = p = points[i - 1]
+        vx, vy = v = points[i]
+        nx, ny = n = points[(i + 1) % count]
+        prev_below = _above(v, p)
+        next_below = _above(v, n)
+        convex = (vx - px) * (ny - vy) - (vy - py) * (nx - vx) > 0.0
+        if prev_below and next_below:
+            kinds.append(_START if convex else _SPLIT)
+        elif not prev_below and not next_below:
+            kinds.append(_END if convex else _MERGE)
+        else:
+            kinds.append(_REGULAR)
+
+    def x_at(edge, y):
+        ax, ay = points[edge]
+        bx, by = points[(edge + 1) % count]
+        if ay == by:
+            return max(ax, bx)
+        if y == by:
+            return bx
+        return ax + (y - ay) * (bx - ax) / (by - ay)
+
+    # Edges are identified by the index of their first vertex
+    status = []
+    helper = {}
+    diagonals = []
+
+    def left_of(v):
+        """Return the position in the status of the edge left of v"""
+        x, y = points[v]
+        lo = 0
+        hi = len(status)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if x_at(status[mid], y) < x:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo - 1
+
+    def remove_ending(v, edge):
+        """Remove an edge ending at v from the status"""
+        position = left_of(v) + 1
+        if position < len(status) and status[position] == edge:
+            del status[position]
+        else:
+            status.remove(edge)
+
+    def connect_merge_helper(v, edge):
+        if kinds[helper[edge]] == _MERGE:
+            diagonals.append((v, helper[edge]))
+
+    events = sorted(range(count), key=lambda i: (-points[i][1], points[i][0]))
+    for v in events:
+        kind = kinds[v]
+        prev_edge = (v - 1) % count
+        if kind == _REGULAR and _above(points[prev_edge], points[v]):
+            # On the left side of the interior
+            connect_merge_helper(v, prev_edge)
+            remove_ending(v, prev_edge)
+            status.insert(left_of(v) + 1, v)
+            helper[v] = v
+        elif kind == _REGULAR:
+            left = status[left_of(v)]
+            connect_merge_helper(v, left)
+            helper[left] = v
+        elif kind == _START:
+            status.insert(left_of(v) + 1, v)
+            helper[v] = v
+        elif kind == _SPLIT:
+            left = status[left_of(v)]
+            diagonals.append((v, helper[left]))
+            helper[left] = v
+            status.insert(left_of(v) + 1, v)
+            helper[v] = v
+        else:
+            connect_merge_helper(v, prev_edge)
+            remove_ending(v, prev_edge)
+            if kind == _MERGE:
+                left = status[left_of(v)]
+                connect_merge_helper(v, left)
+                helper[left] = v
+    return diagonals
+
+
+def _monotone_pieces(points, diagonals):
+    """Split a counter-clockwise polygon along non-crossing diagonals, 
+    returning the vertex indices of each piece in counter-clockwise order.
+    Each piece is traced by turning at every vertex to the next edge
+    clockwise from the edge arrived along.
+    """
+    count = len(points)
+    if not diagonals:
+        return [list(range(count))]
+    neighbors = {}
+    for a, b in diagonals:
+        for v, w in ((a, b), (b, a)):
+            if v not in neighbors:
+                neighbors[v] = [(v + 1) % count, (v - 1) % count]
+            neighbors[v].append(w)
+    for v, adjacent in neighbors.items():
+        vx, vy = points[v]
+        adjacent.sort(key=lambda w: 
+            math.atan2(points[w][1] - vy, points[w][0] - vx))
+    half_edges = [(i, (i + 1) % count) for i in range(count)]
+    half_edges.extend(diagonals)
+    half_edges.extend((b, a) for a, b in diagonals)
+    visited = set()
+    pieces = []
+    for half_edge in half_edges:
+        if half_edge in visited:
+            continue
+        piece = []
+        v, w = half_edge
+        while (v, w) not in visited:
+            visited.add((v, w))
+            piece.append(v)
+            if w in neighbors:
+                adjacent = neighbors[w]
+                v, w = w, adjacent[adjacent.index(v) - 1]
+            else:
+                v, w = w, (w + 1) % count
+        pieces.append(piece)
+    return pieces
+
+
+def _triangulate_monotone(points, piece):
+    """Triangulate a counter-clockwise y-monotone polygon, given as the 
+    vertex indices of its points, in linear time after sorting. The 
+    vertices are visited from top to bottom, keeping a stack of the 
+    vertices visited that still need triangles, and cutting off each 
+    triangle between the current vertex and the stack that is inside
+    of the polygon.
+    """
+    if len(piece) == 3:
+        return [tuple(piece)]
+    order = sorted(piece, key=lambda i: (-points[i][1], points[i][0]))
+    top = piece.index(order[0])
+    bottom = piece.index(order[-1])
+    # The vertices from the top to the bottom counter-clockwise are the
+    # left chain, and the rest are the right chain
+    left_chain = set()
+    i = top
+    while i != bottom:
+        left_chain.add(piece[i])
+        i = (i + 1) % len(piece)
+
+    def inside(v, last, prev):
+        ax, ay = points[v]
+        bx, by = points[last]
+        cx, cy = points[prev]
+        if v in left_chain:
+            return (bx - cx) * (ay - by) - (by - cy) * (ax - bx) > 0.0
+        return (bx - ax) * (cy - by) - (by - ay) * (cx - bx) > 0.0
+
+    triangles = []
+    stack = order[:2]
+    for j in range(2, len(order) - 1):
+        v = order[j]
+        if (v in left_chain) != (stack[-1] in left_chain):
+            while len(stack) > 1:
+                last = stack.pop()
+                triangles.append((v, last, stack[-1]))
+            stack = [order[j - 1], v]
+        else:
+            last = stack.pop()
+            while stack and inside(v, last, stack[-1]):
+                triangles.append((v, last, stack[-1]))
+                last = stack.pop()
+            stack.append(last)
+            stack.append(v)
+    v = order[-1]
+    for i in range(len(stack) - 1):
+        triangles.append((v, stack[i], stack[i + 1]))
+    return triangles
+
+
 _unknown = object()
 
 
@@ -32,11 +32,18 @@
 """Convenience namespace module for importing Python class implementations"""
 
 __all__ = ('Vec2', 'Point', 'Vec2Array', 'Seq2', 
-	'Affine', 'Line', 'Ray', 'LineSegment', 'BoundingBox', 'Polygon')
+	'Affine', 'AffineArray', 'Line', 'LineArray', 'Ray', 'LineSegment', 
+	'LineSegmentArray', 'BoundingBox', 'BoundingBoxArray', 'Polygon', 
+	'RTree', 'SegmentIndex', 'PolygonIndex', 'KDTree', 'HashGrid', 
+	'DynamicTree', 'SweepAndPrune')
 
 from planar2.vector import Vec2, Vec2Array, Seq2
 from planar2.vector import Vec2 as Point
-from planar2.transform import Affine
-from planar2.line import Line, Ray, LineSegment
-from planar2.box import BoundingBox
+from planar2.transform import Affine, AffineArray
+from planar2.line import Line, LineArray, Ray, LineSegment, \
+	LineSegmentArray
+from planar2.box import BoundingBox, BoundingBoxArray
 from planar2.polygon import Polygon
+from planar2.index import RTree, SegmentIndex, PolygonIndex, KDTree, \
+	HashGrid, DynamicTree
+from planar2.broadphase import SweepAndPrune
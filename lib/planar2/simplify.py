@@ -0,0 +1,293 @@
+#############################################################################
+# Copyright (c) 2020 by R. Patrick Xian
+# Distributed under the MIT License
+#############################################################################
+
+
+"""Simplification of polylines and polygons"""
+
+import heapq
+import numpy as np
+import planar2 as planar
+
+
+METHODS = ('douglas_peucker', 'visvalingam_whyatt')
+
+
+def simplify(sequences, tolerance, method='douglas_peucker', closed=False,
+    preserve_topology=False):
+    """Simplify many polylines or polygon rings at once, returning the
+    indices of the vertices kept in each.
+
+    With the Douglas-Peucker method, each span between kept vertices is
+    split at its vertex furthest from the segment joining its ends, while
+    that vertex is further than ``tolerance`` from it. The spans of all
+    of the sequences are split together, one level at a time, without
+    recursion. With the Visvalingam-Whyatt method, the vertex forming the
+    smallest triangle with its neighbors is removed in turn using a heap,
+    while the area of that triangle is less than ``tolerance``. Each
+    sequence is simplified separately with this method.
+
+    The ends of polylines are always kept. Polygon rings are simplified
+    as polylines starting and ending at their first vertex, keeping at
+    least three vertices. If ``preserve_topology`` is true, any simplified
+    edges of a sequence that cross each other are split again at their
+    furthest vertex until none cross, so that simple polylines and
+    polygons stay simple.
+
+    :param sequences: Sequence of arrays of points of shape ``(N, 2)``.
+    :param tolerance: The maximum distance of a removed vertex from the
+        simplified edges for Douglas-Peucker, or the maximum triangle area
+        of a removed vertex for Visvalingam-Whyatt.
+    :param method: ``'douglas_peucker'`` or ``'visvalingam_whyatt'``.
+    :param closed: True if the sequences are polygon rings, and False if
+        they are polylines.
+    :param preserve_topology: True to prevent the simplified edges from
+        crossing.
+    :return: List of integer arrays of the vertex indices kept, in
+        order, for each sequence.
+    """
+    if method not in METHODS:
+        raise ValueError("unknown method %r" % (method,))
+    if tolerance < 0.0:
+        raise ValueError("tolerance must not be negative")
+    sequences = [np.asarray(points, dtype=float).reshape((-1, 2))
+        for points in sequences]
+    if closed:
+        # Close each ring with a copy of its first vertex
+        sequences = [np.concatenate((points, points[:1]))
+            for points in sequences]
+    counts = np.array([len(points) for points in sequences], dtype=np.intp)
+    if not len(counts):
+        return []
+    points = np.concatenate(sequences)
+    stops = np.cumsum(counts)
+    starts = stops - counts
+    nonempty = counts > 0
+    kept = np.zeros(len(points), dtype=bool)
+    kept[starts[nonempty]] = True
+    kept[stops[nonempty] - 1] = True
+    minimum = 4 if closed else 2
+    if method == 'douglas_peucker':
+        _douglas_peucker(points, kept, starts[nonempty],
+            stops[nonempty] - 1, tolerance, closed)
+    else:
+        for start, stop in zip(starts.tolist(), stops.tolist()):
+            if stop - start > 2:
+                kept[start:stop] = _visvalingam_whyatt(
+                    points[start:stop], tolerance, minimum)
+    if preserve_topology:
+        _preserve_topology(points, kept, counts, closed)
+    result = []
+    for start, stop in zip(starts.tolist(), stops.tolist()):
+        indices = np.nonzero(kept[start:stop])[0]
+        if closed:
+            indices = indices[:-1]
+        result.append(indices)
+    return result
+
+
+def _douglas_peucker(points, kept, starts, ends, tolerance, closed):
+    """Mark the vertices kept by Douglas-Peucker simplification of the
+    spans of points from each start to each end. For closed rings, the
+    furthest vertex from the first vertex is always kept, and the furthest
+    vertex from the two resulting edges, so that at least three vertices
+    are kept.
+    """
+    tolerance2 = tolerance * tolerance
+    level = 0
+    while len(starts):
+        furthest, distances2 = _furthest_vertices(points, starts, ends)
+        split = distances2 > tolerance2
+        if closed and level == 0:
+            split[:] = True
+        elif closed and level == 1:
+            # Each ring has two spans on the second level, ordered by ring
+            larger = np.where(distances2[0::2] >= distances2[1::2],
+                np.arange(0, len(starts), 2), np.arange(1, len(starts), 2))
+            split[larger] = True
+        kept[furthest[split]] = True
+        starts = np.concatenate((starts[split], furthest[split]))
+        ends = np.concatenate((furthest[split], ends[split]))
+        if not (closed and level == 0):
+            # Spans without interior vertices are done
+            inner = ends - starts > 1
+            starts = starts[inner]
+            ends = ends[inner]
+        else:
+            # Keep the spans of each ring adjacent, for the next level
+            order = np.argsort(np.concatenate((
+                np.arange(len(starts) // 2) * 2,
+                np.arange(len(starts) // 2) * 2 + 1)), kind='stable')
+            starts = starts[order]
+            ends = ends[order]
+        level += 1
+
+
+def _furthest_vertices(points, starts, ends):
+    """Return the index of the interior vertex of each span of points
+    furthest from the segment joining the ends of the span, and its
+    squared distance. Spans without interior vertices return their start
+    with a distance of -1.
+    """
+    counts = np.maximum(ends - starts - 1, 0)
+    spans, indices = planar.index._expand_ranges(starts + 1, counts)
+    a = points[starts[spans]]
+    ab = points[ends[spans]] - a
+    ap = points[indices] - a
+    lengths2 = np.einsum('ij,ij->i', ab, ab)
+    along = np.clip(np.einsum('ij,ij->i', ap, ab)
+        / np.where(lengths2 > 0.0, lengths2, 1.0), 0.0, 1.0)
+    offsets = ap - ab * along[:, np.newaxis]
+    distances2 = np.einsum('ij,ij->i', offsets, offsets)
+    furthest = starts.copy()
+    max_distances2 = np.full(len(starts), -1.0)
+    inner = counts > 0
+    if not inner.any():
+        return furthest, max_distances2
+    # The first vertex of each span with the greatest distance
+    offsets = (np.cumsum(counts) - counts)[inner]
+    maxima = np.maximum.reduceat(distances2, offsets)
+    positions = np.where(distances2 == np.repeat(maxima, counts[inner]),
+        np.arange(len(indices)), len(indices))
+    furthest[inner] = indices[np.minimum.reduceat(positions, offsets)]
+    max_distances2[inner] = maxima
+    return furthest, max_distances2
+
+
+def _visvalingam_whyatt(points, tolerance, minimum):
+    """Return a boolean array of the vertices of a polyline kept by
+    Visvalingam-Whyatt simplification, keeping its ends and at least
+    ``minimum`` vertices. The effective area of a vertex is the area of
+    the triangle it forms with its neighbors, but not less than the area
+    of any vertex removed before it, so that vertices are removed in the
+    order of their significance.
+    """
+    count = len(points)
+    xs = points[:, 0].tolist()
+    ys = points[:, 1].tolist()
+    previous = list(range(-1, count - 1))
+    following = list(range(1, count + 1))
+    kept = [True] * count
+    remaining = count
+
+    def area(i):
+        a = previous[i]
+        b = following[i]
+        return 0.5 * abs((xs[i] - xs[a]) * (ys[b] - ys[a])
+            - (xs[b] - xs[a]) * (ys[i] - ys[a]))
+
+    areas = [0.0] + [area(i) for i in range(1, count - 1)] + [0.0]
+    heap = [(areas[i], i) for i in range(1, count - 1)]
+    heapq.heapify(heap)
+    largest = 0.0
+    while heap and remaining > minimum:
+        vertex_area, i = heapq.heappop(heap)
+        if not kept[i] or vertex_area != areas[i]:
+            # Stale entry for a removed vertex, or an updated area
+            continue
+        if vertex_area >= tolerance:
+            break
+        largest = max(largest, vertex_area)
+        kept[i] = False
+        remaining -= 1
+        a = previous[i]
+        b = following[i]
+        following[a] = b
+        previous[b] = a
+        for j in (a, b):
+            if 0 < j < count - 1:
+                areas[j] = max(area(j), largest)
+                heapq.heappush(heap, (areas[j], j))
+    return np.array(kept, dtype=bool)
+
+
+def _preserve_topology(points, kept, counts, closed):
+    """Split the simplified edges of each sequence that cross another of
+    its edges at their furthest vertex, until no edges cross, or the
+    crossing edges are edges of the original sequences.
+    """
+    owners = np.repeat(np.arange(len(counts)), counts)
+    while True:
+        indices = np.nonzero(kept)[0]
+        same = owners[indices[:-1]] == owners[indices[1:]]
+        starts = indices[:-1][same]
+        ends = indices[1:][same]
+        crossing = _crossing_edges(points, starts, ends, owners[starts],
+            closed)
+        crossing &= ends - starts > 1
+        if not crossing.any():
+            return
+        furthest, _ = _furthest_vertices(
+            points, starts[crossing], ends[crossing])
+        kept[furthest] = True
+
+
+def _crossing_edges(points, starts, ends, owners, closed):
+    """Return a boolean array flagging the edges, given by the indices of
+    their end points in order along each sequence, that intersect another
+    edge of the same sequence. Consecutive edges intersect only if they
+    fold back over each other.
+    """
+    epsilon = planar.EPSILON
+    crossing = np.zeros(len(starts), dtype=bool)
+    if not len(starts):
+        return crossing
+    a = points[starts]
+    b = points[ends]
+    vectors = b - a
+    lengths = np.hypot(vectors[:, 0], vectors[:, 1])
+    # Consecutive edges folding back over each other
+    following = np.arange(1, len(starts) + 1)
+    last = np.append(owners[1:] != owners[:-1], True)
+    if closed:
+        # The last edge of a ring is followed by its first edge
+        firsts = np.nonzero(np.append(True, owners[1:] != owners[:-1]))[0]
+        following[last] = firsts
+    else:
+        following[last] = -1
+    linked = np.nonzero(following >= 0)[0]
+    nexts = following[linked]
+    cross = (vectors[linked, 0] * vectors[nexts, 1]
+        - vectors[linked, 1] * vectors[nexts, 0])
+    dot = np.einsum('ij,ij->i', vectors[linked], vectors[nexts])
+    folded = (np.abs(cross) <= epsilon * lengths[linked] * lengths[nexts]) & (
+        dot < 0.0)
+    crossing[linked[folded]] = True
+    crossing[nexts[folded]] = True
+    # Other pairs of edges of the same sequence with overlapping boxes
+    bounds = np.hstack((np.minimum(a, b) - epsilon,
+        np.maximum(a, b) + epsilon))
+    all_edges = []
+    all_others = []
+    stops = np.nonzero(last)[0] + 1
+    for start, stop in zip(np.append(0, stops[:-1]).tolist(),
+        stops.tolist()):
+        edges, others = planar.index._PackedTree(
+            bounds[start:stop]).query_bounds(bounds[start:stop])
+        all_edges.append(edges + start)
+        all_others.append(others + start)
+    edges = np.concatenate(all_edges)
+    others = np.concatenate(all_others)
+    candidates = ((edges < others) & (others != following[edges])
+        & (edges != following[others]))
+    edges = edges[candidates]
+    others = others[candidates]
+
+    def side(start, end, point):
+        vector = end - start
+        offset = point - start
+        cross = vector[:, 0] * offset[:, 1] - vector[:, 1] * offset[:, 0]
+        length = np.hypot(vector[:, 0], vector[:, 1])
+        return np.where(np.abs(cross) <= epsilon * length, 0.0,
+            np.sign(cross))
+    c = a[others]
+    d = b[others]
+    intersect = ((side(a[edges], b[edges], c) * side(a[edges], b[edges], d)
+        <= 0.0) & (side(c, d, a[edges]) * side(c, d, b[edges]) <= 0.0))
+    crossing[edges[intersect]] = True
+    crossing[others[intersect]] = True
+    return crossing
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
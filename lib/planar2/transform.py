@@ -29,8 +29,11 @@
 
 
 import math
+import numpy as np
+from functools import lru_cache
 import planar2 as planar
-from planar2.util import cached_property, assert_unorderable, cos_sin_deg
+from planar2.util import cached_property, assert_unorderable, cos_sin_deg, \
+    cos_sin_deg_array
 
 
 class Affine(tuple):
@@ -126,19 +129,17 @@ class Affine(tuple):
             rotation is about the origin.
         :type pivot: :class:`~planar.Vec2`
         :rtype: Affine
+
+        Rotations are memoized by angle and pivot, so repeatedly
+        creating the same rotation returns the same transform instance.
         """
-        ca, sa = cos_sin_deg(angle)
-        if pivot is None:
-            return tuple.__new__(cls, 
-                (ca, sa, 0.0,
-                -sa, ca, 0.0,
-                 0.0, 0.0, 1.0))
-        else:
-            px, py = pivot
-            return tuple.__new__(cls,
-                (ca, sa, px - px*ca + py*sa,
-                -sa, ca, py - px*sa - py*ca,
-                 0.0, 0.0, 1.0))
+        if pivot is not None:
+            pivot = tuple(pivot)
+        try:
+            return _cached_rotation(cls, angle, pivot)
+        except TypeError:
+            # Unhashable angle or pivot values
+            return _rotation(cls, angle, pivot)
 
     def __str__(self):
         """Concise string representation."""
@@ -207,6 +208,48 @@ class Affine(tuple):
         """
         return abs(self.determinant) < planar.EPSILON
 
+    @cached_property
+    def _kind(self):
+        """Classification of the transform used to select a specialized
+        kernel when it is applied: ``'identity'``, ``'translation'``,
+        ``'scale'``, ``'rectilinear'`` or ``'general'``. Unlike
+        ``is_rectilinear``, only exact zero and unit members are considered,
+        so that the specialized kernels give results identical to the
+        general kernel.
+        """
+        a, b, c, d, e, f, g, h, i = self
+        if b == 0.0 and d == 0.0:
+            if a == 1.0 and e == 1.0:
+                if c == 0.0 and f == 0.0:
+                    return 'identity'
+                return 'translation'
+            if c == 0.0 and f == 0.0:
+                return 'scale'
+            return 'rectilinear'
+        if a == 0.0 and e == 0.0:
+            return 'rectilinear'
+        return 'general'
+
+    @cached_property
+    def _point_kernel(self):
+        """Function ``(x, y) -> (x, y)`` specialized for applying this
+        transform to a single point.
+        """
+        a, b, c, d, e, f, _, _, _ = self
+        kind = self._kind
+        if kind == 'identity':
+            return lambda x, y: (x, y)
+        elif kind == 'translation':
+            return lambda x, y: (x + c, y + f)
+        elif kind == 'scale':
+            return lambda x, y: (x*a, y*e)
+        elif kind == 'rectilinear':
+            if b == 0.0 and d == 0.0:
+                return lambda x, y: (x*a + c, y*e + f)
+            else:
+                return lambda x, y: (y*d + c, x*b + f)
+        return lambda x, y: (x*a + y*d + c, x*b + y*e + f)
+
     @property
     def column_vectors(self):
         """The values of the transform as three 2D column vectors"""
@@ -257,14 +300,26 @@ class Affine(tuple):
                 (sa*oa + sb*od, sa*ob + sb*oe, sa*oc + sb*of + sc,
                  sd*oa + se*od, sd*ob + se*oe, sd*oc + se*of + sf,
                  0.0, 0.0, 1.0))
+        elif isinstance(other, AffineArray):
+            return NotImplemented
+        elif isinstance(other, planar.Polygon):
+            # Let the polygon carry over its cached properties
+            return other.__mul__(self)
         elif hasattr(other, 'from_points'):
             # Point/vector array
             Point = planar.Point
             points = getattr(other, 'points', other)
-            try:
-                return other.from_points(
+            kind = self._kind
+            if kind == 'translation':
+                transformed = (Point(px + sc, py + sf) for px, py in points)
+            elif kind == 'scale':
+                transformed = (Point(px*sa, py*se) for px, py in points)
+            else:
+                transformed = (
                     Point(px*sa + py*sd + sc, px*sb + py*se + sf)
                     for px, py in points)
+            try:
+                return other.from_points(transformed)
             except TypeError:
                 return NotImplemented
         else:
@@ -294,12 +349,76 @@ class Affine(tuple):
             transformed.
         :returns: None, the input sequence is mutated in place.
         """
-        if self is not identity and self != identity:
-            sa, sb, sc, sd, se, sf, _, _, _ = self
-            Vec2 = planar.Vec2
+        kind = self._kind
+        if kind == 'identity':
+            return
+        sa, sb, sc, sd, se, sf, _, _, _ = self
+        Vec2 = planar.Vec2
+        if kind == 'translation':
+            for i, (x, y) in enumerate(seq):
+                seq[i] = Vec2(x + sc, y + sf)
+        elif kind == 'scale':
+            for i, (x, y) in enumerate(seq):
+                seq[i] = Vec2(x*sa, y*se)
+        elif kind == 'rectilinear' and sb == 0.0:
+            for i, (x, y) in enumerate(seq):
+                seq[i] = Vec2(x*sa + sc, y*se + sf)
+        elif kind == 'rectilinear':
+            for i, (x, y) in enumerate(seq):
+                seq[i] = Vec2(y*sd + sc, x*sb + sf)
+        else:
             for i, (x, y) in enumerate(seq):
                 seq[i] = Vec2(x*sa + y*sd + sc, x*sb + y*se + sf)
 
+    def transform_bbox(self, shape):
+        """Compute the bounding box of a shape after applying this
+        transform, without creating the transformed shape. This is
+        equivalent to ``(shape * transform).bounding_box``.
+
+        Shapes that are transformed without rotation or shear only require
+        their own bounding box corners to be transformed. Otherwise the
+        transformed vertices are reduced to their extents in a single pass.
+        A :class:`~planar.BoundingBox` is transformed via its corners.
+
+        :param shape: A shape or sequence of points to transform.
+        :rtype: :class:`~planar.BoundingBox`
+        """
+        sa, sb, sc, sd, se, sf, _, _, _ = self
+        if (sb == 0.0 and sd == 0.0) or (sa == 0.0 and se == 0.0):
+            # Axis-aligned boxes remain axis-aligned
+            bbox = getattr(shape, 'bounding_box', None)
+            if bbox is not None:
+                shape = bbox
+        if isinstance(shape, planar.BoundingBox):
+            x0, y0 = shape.min_point
+            x1, y1 = shape.max_point
+            if self.is_rectilinear:
+                points = ((x0, y0), (x1, y1))
+            else:
+                points = ((x0, y0), (x0, y1), (x1, y1), (x1, y0))
+        else:
+            points = getattr(shape, 'points', shape)
+        points = iter(points)
+        try:
+            x, y = next(points)
+        except StopIteration:
+            raise ValueError("transform_bbox() requires at least one point")
+        min_x = max_x = x*sa + y*sd + sc
+        min_y = max_y = x*sb + y*se + sf
+        for x, y in points:
+            tx = x*sa + y*sd + sc
+            ty = x*sb + y*se + sf
+            if tx < min_x:
+                min_x = tx
+            elif tx > max_x:
+                max_x = tx
+            if ty < min_y:
+                min_y = ty
+            elif ty > max_y:
+                max_y = ty
+        return planar.BoundingBox.from_points(
+            ((min_x, min_y), (max_x, max_y)))
+
     def __invert__(self):
         """Return the inverse transform.
         
@@ -326,6 +445,333 @@ class Affine(tuple):
 identity = Affine(1, 0, 0, 0, 1, 0)
 """The identity transform"""
 
+def _rotation(cls, angle, pivot):
+    ca, sa = cos_sin_deg(angle)
+    if pivot is None:
+        return tuple.__new__(cls, 
+            (ca, sa, 0.0,
+            -sa, ca, 0.0,
+             0.0, 0.0, 1.0))
+    else:
+        px, py = pivot
+        return tuple.__new__(cls,
+            (ca, sa, px - px*ca + py*sa,
+            -sa, ca, py - px*sa - py*ca,
+             0.0, 0.0, 1.0))
+
+_cached_rotation = lru_cache(maxsize=256)(_rotation)
+
+
+class AffineArray(object):
+    """Stack of two dimensional affine transforms for batch operations.
+
+    The transforms are stored together as an array of shape ``(N, 2, 3)``,
+    each entry holding the first two rows of an :class:`~planar.Affine`
+    matrix. Composition, inversion and application to points are performed
+    for all transforms at once, and give the same results as the
+    corresponding operations on the individual :class:`~planar.Affine`
+    transforms.
+
+    :param transforms: Iterable of :class:`~planar.Affine` transforms, or
+        an array of shape ``(N, 2, 3)`` or ``(N, 6)``.
+    """
+
+    def __init__(self, transforms=()):
+        if not isinstance(transforms, np.ndarray):
+            transforms = [tuple(t)[:6] for t in transforms]
+        mats = np.array(transforms, dtype=float)
+        if mats.size == 0:
+            mats = mats.reshape((0, 2, 3))
+        if mats.ndim == 2 and mats.shape[1] == 6:
+            mats = mats.reshape((-1, 2, 3))
+        if mats.ndim != 3 or mats.shape[1:] != (2, 3):
+            raise ValueError(
+                "AffineArray(): expected array of shape (N, 2, 3)")
+        self._mats = mats
+
+    @classmethod
+    def _from_matrices(cls, mats):
+        array = cls.__new__(cls)
+        array._mats = mats
+        return array
+
+    @classmethod
+    def identity(cls, count):
+        """Create an array of identity transforms.
+
+        :param count: The number of transforms in the array.
+        :type count: int
+        :rtype: AffineArray
+        """
+        mats = np.zeros((count, 2, 3))
+        mats[:, 0, 0] = mats[:, 1, 1] = 1.0
+        return cls._from_matrices(mats)
+
+    @classmethod
+    def translation(cls, offsets):
+        """Create an array of translation transforms from offset vectors.
+
+        :param offsets: Translation offsets, shape ``(N, 2)``.
+        :rtype: AffineArray
+        """
+        offsets = np.asarray(offsets, dtype=float).reshape((-1, 2))
+        mats = cls.identity(len(offsets))._mats
+        mats[:, :, 2] = offsets
+        return cls._from_matrices(mats)
+
+    @classmethod
+    def scale(cls, scalings):
+        """Create an array of scaling transforms.
+
+        :param scalings: The scaling factors, either shape ``(N,)`` to
+            scale both dimensions equally, or shape ``(N, 2)`` to scale
+            the dimensions independently.
+        :rtype: AffineArray
+        """
+        scalings = np.asarray(scalings, dtype=float)
+        if scalings.ndim < 2:
+            scalings = np.repeat(scalings.reshape((-1, 1)), 2, axis=1)
+        mats = np.zeros((len(scalings), 2, 3))
+        mats[:, 0, 0] = scalings[:, 0]
+        mats[:, 1, 1] = scalings[:, 1]
+        return cls._from_matrices(mats)
+
+    @classmethod
+    def shear(cls, x_angles=0, y_angles=0):
+        """Create an array of shear transforms along one or both axes.
+
+        :param x_angles: Angles in degrees to shear along the x-axis.
+        :param y_angles: Angles in degrees to shear along the y-axis.
+        :rtype: AffineArray
+        """
+        x_angles, y_angles = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(x_angles, dtype=float)), 
+            np.atleast_1d(np.asarray(y_angles, dtype=float)))
+        mats = cls.identity(len(x_angles))._mats
+        mats[:, 0, 1] = np.tan(np.radians(y_angles))
+        mats[:, 1, 0] = np.tan(np.radians(x_angles))
+        return cls._from_matrices(mats)
+
+    @classmethod
+    def rotation(cls, angles, pivots=None):
+        """Create an array of rotation transforms at the specified angles,
+        optionally about the specified pivot points.
+
+        :param angles: Rotation angles in degrees, shape ``(N,)``.
+        :param pivots: Points to rotate about, either a single point
+            or shape ``(N, 2)``. If omitted the rotations are about the
+            origin.
+        :rtype: AffineArray
+        """
+        ca, sa = cos_sin_deg_array(np.atleast_1d(angles))
+        mats = np.zeros((len(ca), 2, 3))
+        mats[:, 0, 0] = mats[:, 1, 1] = ca
+        mats[:, 0, 1] = sa
+        mats[:, 1, 0] = -sa
+        if pivots is not None:
+            pivots = np.asarray(pivots, dtype=float).reshape((-1, 2))
+            px = pivots[:, 0]
+            py = pivots[:, 1]
+            mats[:, 0, 2] = px - px*ca + py*sa
+            mats[:, 1, 2] = py - px*sa - py*ca
+        return cls._from_matrices(mats)
+
+    @property
+    def matrices(self):
+        """The transform values as an array of shape ``(N, 2, 3)``."""
+        return self._mats
+
+    @property
+    def determinant(self):
+        """Array of the determinants of each transform matrix."""
+        m = self._mats
+        return m[:, 0, 0] * m[:, 1, 1] - m[:, 0, 1] * m[:, 1, 0]
+
+    @property
+    def is_degenerate(self):
+        """Boolean array flagging the transforms that are degenerate,
+        see :attr:`Affine.is_degenerate`.
+        """
+        return np.abs(self.determinant) < planar.EPSILON
+
+    def __len__(self):
+        return len(self._mats)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return tuple.__new__(Affine, 
+                self._mats[index].ravel().tolist() + [0.0, 0.0, 1.0])
+        return self._from_matrices(self._mats[index])
+
+    def __iter__(self):
+        for i in range(len(self._mats)):
+            yield self[i]
+
+    def almost_equals(self, other):
+        """Compare transform arrays for approximate equality.
+
+        :param other: Transform array being compared.
+        :type other: AffineArray
+        :return: True if absolute difference between each element
+            of each respective transform matrix < ``EPSILON``.
+        """
+        return (len(self) == len(other) and bool(
+            np.all(np.abs(self._mats - other._mats) < planar.EPSILON)))
+
+    def __eq__(self, other):
+        return (self.__class__ is other.__class__
+            and self._mats.shape == other._mats.shape
+            and bool(np.all(self._mats == other._mats)))
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "%s([%s])" % (self.__class__.__name__, 
+            ', '.join("(%r, %r, %r, %r, %r, %r)" % tuple(m) 
+                for m in self._mats.reshape((-1, 6)).tolist()))
+
+    __str__ = __repr__
+
+    def __mul__(self, other):
+        """Compose this array of transforms with another array, or with a
+        single transform. Arrays of length 1 are broadcast against the
+        other operand.
+
+        :param other: The transforms to compose.
+        :type other: AffineArray or :class:`~planar.Affine`
+        :rtype: AffineArray
+        """
+        if isinstance(other, AffineArray):
+            omats = other._mats
+        elif isinstance(other, Affine):
+            omats = np.array(other[:6]).reshape((1, 2, 3))
+        else:
+            return NotImplemented
+        return self._from_matrices(_compose(self._mats, omats))
+
+    def __rmul__(self, other):
+        if isinstance(other, Affine):
+            omats = np.array(other[:6]).reshape((1, 2, 3))
+            return self._from_matrices(_compose(omats, self._mats))
+        return NotImplemented
+
+    def __invert__(self):
+        """Return the array of inverse transforms.
+
+        :raises: :except:`TransformNotInvertible` if any of the
+            transforms is degenerate.
+        """
+        det = self.determinant
+        if np.any(np.abs(det) < planar.EPSILON):
+            raise planar.TransformNotInvertibleError(
+                "Cannot invert degenerate transform")
+        idet = 1.0 / det
+        m = self._mats
+        inv = np.empty_like(m)
+        inv[:, 0, 0] = ra = m[:, 1, 1] * idet
+        inv[:, 0, 1] = rb = -m[:, 0, 1] * idet
+        inv[:, 1, 0] = rd = -m[:, 1, 0] * idet
+        inv[:, 1, 1] = re = m[:, 0, 0] * idet
+        inv[:, 0, 2] = -m[:, 0, 2] * ra - m[:, 1, 2] * rb
+        inv[:, 1, 2] = -m[:, 0, 2] * rd - m[:, 1, 2] * re
+        return self._from_matrices(inv)
+
+    def transform_points(self, points):
+        """Apply every transform in the array to one shared set of points.
+
+        :param points: Points to transform, shape ``(M, 2)``.
+        :return: Array of shape ``(N, M, 2)`` where entry ``[i, j]`` is
+            point ``j`` transformed by transform ``i``.
+        """
+        coords = np.asarray(points, dtype=float).reshape((1, -1, 2))
+        return _apply(self._mats[:, np.newaxis], coords)
+
+    def transform_shapes(self, shapes):
+        """Apply each transform in the array to the respective shape,
+        creating a list of new transformed shapes. The vertices of all the
+        shapes are transformed together in a single batch.
+
+        :param shapes: Sequence of ``N`` vectors, vector arrays or shapes,
+            one per transform. The vertices of vector arrays, polygons and
+            lines are batched, and other shapes, such as bounding boxes,
+            are transformed individually.
+        :return: List of transformed objects, each of the same type as
+            the respective input.
+        """
+        shapes = list(shapes)
+        if len(shapes) != len(self._mats):
+            raise ValueError(
+                "expected one shape per transform, got %d shapes for "
+                "%d transforms" % (len(shapes), len(self._mats)))
+        Vec2 = planar.Vec2
+        sequence_types = (planar.Seq2, planar.Line, planar.Ray, 
+            planar.LineSegment)
+        results = [None] * len(shapes)
+        batched = []
+        # The number of vertices of each batched shape, or None for vectors
+        counts = []
+        coords = []
+        for i, shape in enumerate(shapes):
+            if isinstance(shape, sequence_types):
+                points = list(getattr(shape, 'points', shape))
+                batched.append(i)
+                counts.append(len(points))
+                coords.extend(points)
+            elif isinstance(shape, tuple) and len(shape) == 2:
+                batched.append(i)
+                counts.append(None)
+                coords.append(shape)
+            else:
+                results[i] = shape * self[i]
+        transformed = []
+        if coords:
+            point_counts = [1 if count is None else count for count in counts]
+            mats = np.repeat(self._mats[batched], point_counts, axis=0)
+            transformed = _apply(mats, np.array(coords, dtype=float)).tolist()
+        start = 0
+        for i, count in zip(batched, counts):
+            if count is None:
+                results[i] = Vec2(*transformed[start])
+                start += 1
+            else:
+                points = transformed[start:start+count]
+                results[i] = shapes[i].from_points(
+                    [Vec2(x, y) for x, y in points])
+                start += count
+        return results
+
+
+def _compose(mats, other_mats):
+    """Compose two stacks of transform matrices, shape ``(N, 2, 3)``"""
+    composed = np.empty(np.broadcast_shapes(mats.shape, other_mats.shape))
+    composed[:, :, :2] = np.matmul(mats[:, :, :2], other_mats[:, :, :2])
+    composed[:, :, 2] = np.matmul(
+        mats[:, :, :2], other_mats[:, :, 2:])[:, :, 0] + mats[:, :, 2]
+    return composed
+
+def _apply(mats, coords):
+    """Apply the transform matrices to the coordinates of shape
+    ``(..., 2)``, broadcasting the leading dimensions of each. The kernel
+    is specialized once for the whole batch when every transform is a
+    translation or an axis-aligned scale.
+    """
+    if not np.any(mats[..., 0, 1]) and not np.any(mats[..., 1, 0]):
+        diagonal = mats[..., (0, 1), (0, 1)]
+        offsets = mats[..., :, 2]
+        if np.all(diagonal == 1.0):
+            return coords + offsets
+        elif not np.any(offsets):
+            return coords * diagonal
+        return coords * diagonal + offsets
+    x = coords[..., 0]
+    y = coords[..., 1]
+    return np.stack((
+        x*mats[..., 0, 0] + y*mats[..., 1, 0] + mats[..., 0, 2],
+        x*mats[..., 0, 1] + y*mats[..., 1, 1] + mats[..., 1, 2]), axis=-1)
+
 
 # vim: ai ts=4 sts=4 et sw=4 tw=78
 
@@ -13,6 +13,8 @@
 
 
 import math
+import numpy as np
+from functools import lru_cache
 
 # Define assert_unorderable() depending on the language 
 # implicit ordering rules. This keeps things consistent
@@ -52,8 +54,16 @@ def cached_property(func):
 def cos_sin_deg(deg):
     """Return the cosine and sin for the given angle
     in degrees, with special-case handling of multiples
-    of 90 for perfect right angles
+    of 90 for perfect right angles. The results for the
+    most recently used angles are memoized.
     """
+    try:
+        return _cached_cos_sin_deg(deg)
+    except TypeError:
+        # Unhashable angle value
+        return _cos_sin_deg(deg)
+
+def _cos_sin_deg(deg):
     deg = deg % 360.0
     if deg == 90.0:
         return 0.0, 1.0
@@ -64,6 +74,20 @@ def cos_sin_deg(deg):
     rad = math.radians(deg)
     return math.cos(rad), math.sin(rad)
 
+_cached_cos_sin_deg = lru_cache(maxsize=1024)(_cos_sin_deg)
+
+def cos_sin_deg_array(deg):
+    """Return arrays of the cosine and sin for the given array
+    of angles in degrees. Multiples of 90 are special-cased for
+    perfect right angles, as in :func:`cos_sin_deg`.
+    """
+    deg = np.remainder(np.asarray(deg, dtype=float), 360.0)
+    rad = np.radians(deg)
+    right_angles = (deg == 90.0, deg == 180.0, deg == 270.0)
+    cos = np.select(right_angles, (0.0, -1.0, 0.0), np.cos(rad))
+    sin = np.select(right_angles, (1.0, 0.0, -1.0), np.sin(rad))
+    return cos, sin
+
 
 # vim: ai ts=4 sts=4 et sw=4 tw=78
 
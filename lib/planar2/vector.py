@@ -31,8 +31,10 @@
 
 
 import math
+import numpy as np
 import planar2 as planar
-from planar2.util import cached_property, assert_unorderable, cos_sin_deg
+from planar2.util import cached_property, assert_unorderable, cos_sin_deg, \
+    cos_sin_deg_array
 
 
 class Vec2(tuple):
@@ -566,6 +568,22 @@ class Vec2Array(Seq2):
     def __init__(self, vectors=()):
         super(Vec2Array, self).__init__(vectors)
 
+    @classmethod
+    def from_polar(cls, angles, lengths=1.0):
+        """Create an array of vectors from polar coordinates. The
+        trigonometry for all of the vectors is computed in a single batch.
+
+        :param angles: Sequence of vector angles in degrees from the 
+            positive x-axis.
+        :param lengths: The length of the vectors, either a single
+            value or a sequence with one length per angle.
+        :rtype: Vec2Array
+        """
+        cos, sin = cos_sin_deg_array(np.atleast_1d(angles))
+        lengths = np.asarray(lengths, dtype=float)
+        return cls.from_points(map(Vec2, 
+            (cos * lengths).tolist(), (sin * lengths).tolist()))
+
     def __getitem__(self, index):
         if isinstance(index, slice):
             return self.from_points(self._vectors[index])
@@ -606,6 +624,28 @@ class Vec2Array(Seq2):
     def __delitem__(self, index):
         del self._vectors[index]
     
+    def simplified(self, tolerance, method='douglas_peucker', 
+        preserve_topology=False):
+        """Return a simplified copy of the array as a polyline, with the
+        vectors that contribute least to its shape removed, and the first 
+        and last vectors kept. See :func:`planar.simplify.simplify` for 
+        the methods.
+
+        :param tolerance: For the ``'douglas_peucker'`` method, the 
+            maximum distance of a removed vector from the simplified 
+            polyline. For the ``'visvalingam_whyatt'`` method, the maximum
+            area of the triangle formed by a removed vector and its 
+            neighbors.
+        :param method: ``'douglas_peucker'`` or ``'visvalingam_whyatt'``.
+        :param preserve_topology: If true, the edges of the simplified 
+            polyline do not cross each other, unless they already crossed.
+        :rtype: Vec2Array
+        """
+        indices, = planar.simplify.simplify([self._vectors], tolerance, 
+            method, closed=False, preserve_topology=preserve_topology)
+        vectors = self._vectors
+        return self.from_points([vectors[i] for i in indices.tolist()])
+
     def longest(self):
         """Return the vector in the array with the maximum length."""
         longest = None
@@ -121,6 +121,22 @@ class BoundingBoxBaseTestCase(object):
     def test_from_shapes_no_shapes(self):
         box = self.BoundingBox.from_shapes([])
     
+    def test_from_points_array(self):
+        import numpy
+        points = numpy.array([(1, -2), (0, 0), (1, 0), (3, 0), (4, -2)])
+        box = self.BoundingBox.from_points(points)
+        assert_equal(box, self.BoundingBox.from_points(points.tolist()))
+        assert_equal(box.min_point, (0, -2))
+        assert_equal(box.max_point, (4, 0))
+        box = self.BoundingBox(points[:1])
+        assert_equal(box.min_point, (1, -2))
+        assert_equal(box.max_point, (1, -2))
+
+    @raises(ValueError)
+    def test_from_points_empty_array(self):
+        import numpy
+        self.BoundingBox.from_points(numpy.zeros((0, 2)))
+
     def test_from_center(self):
         box = self.BoundingBox.from_center((2, 3), 14, 3)
         assert_equal(box.min_point, (-5, 1.5))
@@ -168,10 +184,25 @@ class BoundingBoxBaseTestCase(object):
         assert_equal(box2.height, 3)
         assert_equal(box2.center, box1.center)
     
+    def test_inflate_past_empty(self):
+        box = self.BoundingBox([(-2, 0), (2, 1)]).inflate((-6, -1))
+        assert_equal(box.min_point, (-1, 0.5))
+        assert_equal(box.max_point, (1, 0.5))
+
     @raises(TypeError)
     def test_inflate_bad_arg(self):
         self.BoundingBox([(3, 1), (5, 6)]).inflate('badbad')
         
+    def test_intersects(self):
+        box = self.BoundingBox([(-1, -2), (3, 0)])
+        assert box.intersects(box)
+        assert box.intersects(self.BoundingBox([(0, -1), (1, 5)]))
+        assert box.intersects(self.BoundingBox([(-5, -5), (5, 5)]))
+        assert box.intersects(self.BoundingBox([(3, 0), (4, 1)]))
+        assert not box.intersects(self.BoundingBox([(3.1, 0), (4, 1)]))
+        assert not box.intersects(self.BoundingBox([(-1, 0.1), (4, 1)]))
+        assert box.intersects(self.BoundingBox([(0, 0), (1, 1)]).to_polygon())
+
     def test_contains_point(self):
         box = self.BoundingBox([(-1, -2), (3, 0)])
         assert box.contains_point((-0.5, -1))
@@ -318,6 +349,97 @@ class CBoundingBoxTestCase(BoundingBoxBaseTestCase, unittest.TestCase):
     from planar.c import Vec2, Seq2, BoundingBox
 
 
+class BoundingBoxArrayTestCase(unittest.TestCase):
+    from planar.vector import Vec2
+    from planar.box import BoundingBox, BoundingBoxArray
+
+    def boxes(self):
+        BB = self.BoundingBox
+        return [BB([(-1, -2), (3, 0)]), BB([(0, -1), (1, 5)]), 
+            BB([(4, 4), (6, 5)]), BB([(3, 0), (4, 1)])]
+
+    def test_from_boxes(self):
+        boxes = self.boxes()
+        array = self.BoundingBoxArray(boxes)
+        assert_equal(len(array), 4)
+        assert_equal(array.bounds.shape, (4, 4))
+        assert_equal(array.to_boxes(), boxes)
+        assert_equal(list(array), boxes)
+        assert_equal(array[2], boxes[2])
+        assert_equal(array[1:3].to_boxes(), boxes[1:3])
+        assert_equal(array.min_points.tolist(), [list(b.min_point) 
+            for b in boxes])
+        assert_equal(array.max_points.tolist(), [list(b.max_point) 
+            for b in boxes])
+        assert_equal(array.widths.tolist(), [b.width for b in boxes])
+        assert_equal(array.heights.tolist(), [b.height for b in boxes])
+        assert_equal(array.centers.tolist(), [list(b.center) 
+            for b in boxes])
+        assert_equal(len(self.BoundingBoxArray()), 0)
+
+    def test_from_min_max(self):
+        array = self.BoundingBoxArray.from_min_max(
+            [(0, 0), (3, 1)], [(1, 2), (2, -1)])
+        assert_equal(array.to_boxes(), [self.BoundingBox([(0, 0), (1, 2)]),
+            self.BoundingBox([(2, -1), (3, 1)])])
+
+    def test_from_shapes(self):
+        import planar
+        shapes = [planar.Polygon([(0, 0), (1, 3), (2, 1)]), 
+            self.BoundingBox([(4, 4), (6, 5)])]
+        array = self.BoundingBoxArray.from_shapes(shapes)
+        assert_equal(array.to_boxes(), [s.bounding_box for s in shapes])
+        segments = planar.LineSegmentArray.from_points(
+            [(0, 0), (3, 1)], [(1, 2), (2, -1)])
+        array = self.BoundingBoxArray.from_shapes(segments)
+        assert_equal(array.to_boxes(), [self.BoundingBox(s.points) 
+            for s in segments])
+
+    def test_contains_point(self):
+        import numpy
+        boxes = self.boxes()
+        array = self.BoundingBoxArray(boxes)
+        points = [(-1, -2), (0, 0), (3, 0), (0.5, 4), (5, 4.5), (3.5, 1)]
+        for p in points:
+            assert_equal(array.contains_point(p).tolist(),
+                [b.contains_point(p) for b in boxes])
+        result = array.contains_point(numpy.array(points)[:, numpy.newaxis])
+        assert_equal(result.shape, (len(points), len(boxes)))
+
+    def test_intersects(self):
+        boxes = self.boxes()
+        array = self.BoundingBoxArray(boxes)
+        other = self.BoundingBox([(0.5, 0.5), (3.5, 4)])
+        assert_equal(array.intersects(other).tolist(),
+            [b.intersects(other) for b in boxes])
+
+    def test_intersects_pairs(self):
+        boxes = self.boxes()
+        array = self.BoundingBoxArray(boxes)
+        indices, other_indices = array.intersects_pairs()
+        assert_equal(list(zip(indices.tolist(), other_indices.tolist())),
+            [(0, 1), (0, 3)])
+        others = self.BoundingBoxArray(boxes[1:])
+        indices, other_indices = array.intersects_pairs(others)
+        expected = [(i, j) for i, a in enumerate(boxes) 
+            for j, b in enumerate(boxes[1:]) if a.intersects(b)]
+        assert_equal(list(zip(indices.tolist(), other_indices.tolist())),
+            expected)
+
+    def test_union_intersection(self):
+        boxes = self.boxes()
+        array = self.BoundingBoxArray(boxes)
+        assert_equal(array.union(), 
+            self.BoundingBox.from_shapes(boxes))
+        assert array.intersection() is None
+        assert_equal(array[:2].intersection(), 
+            self.BoundingBox([(0, -1), (1, 0)]))
+
+    @raises(ValueError)
+    def test_union_empty(self):
+        self.BoundingBoxArray().union()
+
+
 if __name__ == '__main__':
     unittest.main()
 
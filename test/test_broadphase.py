@@ -0,0 +1,81 @@
+"""Broad phase unit tests"""
+
+import unittest
+from nose.tools import assert_equal, raises
+
+
+class SweepAndPruneTestCase(unittest.TestCase):
+    from planar.box import BoundingBox, BoundingBoxArray
+    from planar.broadphase import SweepAndPrune
+
+    def boxes(self):
+        BB = self.BoundingBox
+        return [BB([(-1, -2), (3, 0)]), BB([(0, -1), (1, 5)]), 
+            BB([(4, 4), (6, 5)]), BB([(3, 0), (4, 1)]),
+            BB([(0.5, 3), (5, 4.5)])]
+
+    def brute_force_pairs(self, boxes):
+        return [(i, j) for i, a in enumerate(boxes) 
+            for j, b in enumerate(boxes) if i < j and a.intersects(b)]
+
+    def random_boxes(self, rng, count):
+        mins = rng.uniform(0, 100, (count, 2))
+        return self.BoundingBoxArray.from_min_max(
+            mins, mins + rng.uniform(0, 8, (count, 2)))
+
+    def pairs(self, broadphase):
+        indices, other_indices = broadphase.pairs()
+        return list(zip(indices.tolist(), other_indices.tolist()))
+
+    def test_pairs(self):
+        boxes = self.boxes()
+        broadphase = self.SweepAndPrune(boxes)
+        assert_equal(len(broadphase), 5)
+        assert_equal(self.pairs(broadphase), [(0, 1), (0, 3), (1, 4), 
+            (2, 4)])
+        assert_equal(self.pairs(broadphase), self.brute_force_pairs(boxes))
+
+    def test_pairs_shapes(self):
+        boxes = self.boxes()
+        broadphase = self.SweepAndPrune([box.to_polygon() for box in boxes])
+        assert_equal(self.pairs(broadphase), self.brute_force_pairs(boxes))
+
+    def test_empty(self):
+        broadphase = self.SweepAndPrune()
+        assert_equal(self.pairs(broadphase), [])
+        broadphase.add(self.BoundingBox([(0, 0), (1, 1)]))
+        assert_equal(self.pairs(broadphase), [])
+        assert_equal(broadphase.add(self.BoundingBox([(1, 1), (2, 2)])), 1)
+        assert_equal(self.pairs(broadphase), [(0, 1)])
+
+    def test_update(self):
+        boxes = self.boxes()
+        broadphase = self.SweepAndPrune(boxes)
+        boxes[2] = self.BoundingBox([(-3, -3), (-2, -1)])
+        broadphase.update(2, boxes[2])
+        assert_equal(self.pairs(broadphase), self.brute_force_pairs(boxes))
+
+    def test_update_all_matches_brute_force(self):
+        import numpy
+        rng = numpy.random.RandomState(5)
+        boxes = self.random_boxes(rng, 200)
+        broadphase = self.SweepAndPrune(boxes)
+        for frame in range(5):
+            assert_equal(self.pairs(broadphase), 
+                self.brute_force_pairs(boxes.to_boxes()))
+            boxes = self.BoundingBoxArray.from_min_max(
+                boxes.min_points + rng.uniform(-1, 1, (200, 2)),
+                boxes.max_points + rng.uniform(-1, 1, (200, 2)))
+            broadphase.update_all(boxes)
+
+    @raises(ValueError)
+    def test_update_all_wrong_count(self):
+        broadphase = self.SweepAndPrune(self.boxes())
+        broadphase.update_all(self.boxes()[1:])
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
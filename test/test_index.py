@@ -0,0 +1,536 @@
+"""Spatial index unit tests"""
+
+import unittest
+from nose.tools import assert_equal, assert_almost_equal, raises
+
+
+class SegmentIndexTestCase(unittest.TestCase):
+    from planar.vector import Vec2
+    from planar.line import Ray, LineSegment, LineSegmentArray
+    from planar.index import SegmentIndex
+
+    def random_segments(self, count, seed=0):
+        import numpy as np
+        rng = np.random.RandomState(seed)
+        starts = rng.uniform(-100, 100, (count, 2))
+        ends = starts + rng.uniform(-5, 5, (count, 2))
+        return self.LineSegmentArray.from_points(starts, ends)
+
+    def test_segments(self):
+        segs = [self.LineSegment((0, 0), (1, 0)), 
+            self.LineSegment((2, 2), (0, 3))]
+        index = self.SegmentIndex(segs)
+        assert_equal(len(index), 2)
+        assert isinstance(index.segments, self.LineSegmentArray)
+        assert_equal(index.segments.to_segments(), segs)
+
+    def test_nearest(self):
+        LS = self.LineSegment
+        segs = [LS((0, 0), (2, 0)), LS((0, 2), (2, 0)), LS((5, -1), (0, 2))]
+        index = self.SegmentIndex(segs)
+        (i, dist, proj), = index.nearest((1, -1))
+        assert_equal(i, 0)
+        assert_almost_equal(dist, 1)
+        assert isinstance(proj, self.Vec2)
+        assert_equal(proj, segs[0].project((1, -1)))
+        result = index.nearest((4, 0), k=2)
+        assert_equal([r[0] for r in result], [2, 0])
+        assert_almost_equal(result[0][1], 1)
+        assert_almost_equal(result[1][1], 2)
+        assert_equal(len(index.nearest((4, 0), k=5)), 3)
+
+    def test_nearest_empty(self):
+        index = self.SegmentIndex([])
+        assert_equal(index.nearest((1, 1)), [])
+        indices, distances, projections = index.nearest_points([(1, 1)], k=2)
+        assert_equal(indices.tolist(), [[-1, -1]])
+        assert_equal(projections.shape, (1, 2, 2))
+
+    def test_nearest_points_matches_brute_force(self):
+        import numpy as np
+        segments = self.random_segments(500)
+        index = self.SegmentIndex(segments, node_size=4)
+        rng = np.random.RandomState(1)
+        points = rng.uniform(-150, 150, (200, 2))
+        indices, distances, projections = index.nearest_points(points, k=3)
+        assert_equal(indices.shape, (200, 3))
+        assert_equal(projections.shape, (200, 3, 2))
+        for i, point in enumerate(points):
+            brute = np.sort(segments.distance_to(
+                np.broadcast_to(point, (len(segments), 2))))[:3]
+            assert np.allclose(distances[i], brute), (distances[i], brute)
+            for j in range(3):
+                seg = segments[int(indices[i, j])]
+                assert_almost_equal(seg.distance_to(point), distances[i, j])
+                assert seg.project(point).almost_equals(projections[i, j])
+
+    def test_nearest_points_fewer_segments_than_k(self):
+        import numpy as np
+        index = self.SegmentIndex(self.random_segments(2))
+        indices, distances, projections = index.nearest_points(
+            [(0, 0), (500, 500)], k=3)
+        assert_equal(sorted(indices[0, :2].tolist()), [0, 1])
+        assert_equal(indices[:, 2].tolist(), [-1, -1])
+        assert np.all(np.isinf(distances[:, 2]))
+        assert np.all(np.isnan(projections[:, 2]))
+
+    def test_not_finite(self):
+        import numpy as np
+        nan = float('nan')
+        inf = float('inf')
+        index = self.SegmentIndex(self.random_segments(20))
+        assert_equal(index.nearest((nan, 0.0)), [])
+        indices, distances, projections = index.nearest_points(
+            [(nan, 0.0), (0.0, inf), (0.0, 0.0)], k=2)
+        assert_equal(indices[:2].tolist(), [[-1, -1], [-1, -1]])
+        assert np.all(np.isinf(distances[:2]))
+        assert np.all(np.isnan(projections[:2]))
+        assert np.all(indices[2] >= 0)
+        indices, distances, points = index.cast_rays(
+            [(nan, 0.0), (-200.0, 0.0)], [(1.0, 0.0), (nan, 0.0)])
+        assert_equal(indices.tolist(), [-1, -1])
+
+    @raises(ValueError)
+    def test_bad_node_size(self):
+        self.SegmentIndex(self.random_segments(2), node_size=1)
+
+    def test_cast(self):
+        LS = self.LineSegment
+        segs = [LS((2, -1), (0, 2)), LS((5, -1), (0, 2)), LS((-2, -1), (0, 2))]
+        index = self.SegmentIndex(segs)
+        i, dist, point = index.cast(self.Ray((0, 0), (1, 0)))
+        assert_equal(i, 0)
+        assert_almost_equal(dist, 2)
+        assert point.almost_equals((2, 0))
+        i, dist, point = index.cast(self.Ray((3, 0), (1, 0)))
+        assert_equal(i, 1)
+        assert index.cast(self.Ray((6, 0), (1, 0))) is None
+        assert index.cast(self.Ray((0, 0), (0, 1))) is None
+        assert index.cast(self.Ray((0, 0), (1, 0)), max_distance=1.5) is None
+
+    def test_cast_all(self):
+        LS = self.LineSegment
+        segs = [LS((2, -1), (0, 2)), LS((5, -1), (0, 2)), LS((-2, -1), (0, 2))]
+        index = self.SegmentIndex(segs)
+        hits = index.cast_all(self.Ray((0, 0), (1, 0)))
+        assert_equal([h[0] for h in hits], [0, 1])
+        assert_almost_equal(hits[1][1], 5)
+        assert hits[1][2].almost_equals((5, 0))
+        hits = index.cast_all(self.Ray((0, 0), (1, 0)), max_distance=4)
+        assert_equal([h[0] for h in hits], [0])
+        assert_equal(index.cast_all(self.Ray((0, 0), (0, 1))), [])
+
+    def test_cast_collinear(self):
+        index = self.SegmentIndex([self.LineSegment((2, 0), (3, 0))])
+        i, dist, point = index.cast(self.Ray((0, 0), (1, 0)))
+        assert_almost_equal(dist, 2)
+        i, dist, point = index.cast(self.Ray((3, 0), (1, 0)))
+        assert_almost_equal(dist, 0)
+
+    def test_cast_rays_matches_scalar(self):
+        import numpy as np
+        segments = self.random_segments(300)
+        index = self.SegmentIndex(segments, node_size=4)
+        rng = np.random.RandomState(3)
+        anchors = rng.uniform(-120, 120, (100, 2))
+        directions = rng.uniform(-1, 1, (100, 2))
+        indices, distances, points = index.cast_rays(anchors, directions)
+        rays, all_indices, all_distances, all_points = index.cast_rays_all(
+            anchors, directions)
+        assert_equal(points.shape, (100, 2))
+        for r in range(100):
+            ray = self.Ray(anchors[r], directions[r])
+            hits = []
+            for j, seg in enumerate(segments):
+                point = ray.intersect(seg)
+                if point is not None:
+                    hits.append(((point - ray.anchor).length, j))
+            hits.sort()
+            assert_equal(sorted(all_indices[rays == r].tolist()), 
+                sorted(j for d, j in hits))
+            if hits:
+                assert_almost_equal(distances[r], hits[0][0])
+                assert segments[int(indices[r])].contains_point(points[r])
+                assert ray.contains_point(points[r])
+            else:
+                assert_equal(indices[r], -1)
+                assert np.isinf(distances[r])
+                assert np.all(np.isnan(points[r]))
+        assert np.all(np.diff(all_distances[rays == 0]) >= 0)
+
+    def test_cast_rays_max_distance(self):
+        index = self.SegmentIndex([self.LineSegment((2, -1), (0, 2))])
+        indices, distances, points = index.cast_rays(
+            [(0, 0), (0, 0)], [(1, 0), (1, 0)], [1, 3])
+        assert_equal(indices.tolist(), [-1, 0])
+
+    @raises(ValueError)
+    def test_cast_rays_null_direction(self):
+        index = self.SegmentIndex([self.LineSegment((2, -1), (0, 2))])
+        index.cast_rays([(0, 0)], [(0, 0)])
+
+
+class RTreeTestCase(unittest.TestCase):
+    from planar.box import BoundingBox, BoundingBoxArray
+    from planar.index import RTree
+
+    def random_boxes(self, count, seed=0):
+        import numpy as np
+        rng = np.random.RandomState(seed)
+        mins = rng.uniform(0, 100, (count, 2))
+        return self.BoundingBoxArray.from_min_max(
+            mins, mins + rng.uniform(0, 5, (count, 2)))
+
+    def test_boxes(self):
+        boxes = [self.BoundingBox([(0, 0), (1, 1)]), 
+            self.BoundingBox([(2, 2), (3, 4)])]
+        tree = self.RTree(boxes)
+        assert_equal(len(tree), 2)
+        assert_equal(tree.boxes.to_boxes(), boxes)
+        assert_equal(len(self.RTree([])), 0)
+        assert_equal(self.RTree([]).query_point((0, 0)), [])
+
+    def test_query_point(self):
+        boxes = [self.BoundingBox([(0, 0), (2, 2)]), 
+            self.BoundingBox([(1, 1), (3, 4)]),
+            self.BoundingBox([(5, 5), (6, 6)]).to_polygon()]
+        tree = self.RTree(boxes)
+        assert_equal(tree.query_point((1.5, 1.5)), [0, 1])
+        assert_equal(tree.query_point((2.5, 1.5)), [1])
+        assert_equal(tree.query_point((6, 6)), [2])
+        assert_equal(tree.query_point((4, 4.5)), [])
+
+    def test_query_box(self):
+        boxes = [self.BoundingBox([(0, 0), (2, 2)]), 
+            self.BoundingBox([(1, 1), (3, 4)]),
+            self.BoundingBox([(5, 5), (6, 6)])]
+        tree = self.RTree(boxes)
+        assert_equal(tree.query_box(self.BoundingBox([(2, 3), (5, 5)])), 
+            [1, 2])
+        assert_equal(tree.query_box(self.BoundingBox([(4, 0), (5, 1)])), [])
+
+    def test_batch_queries_match_brute_force(self):
+        import numpy as np
+        boxes = self.random_boxes(400)
+        tree = self.RTree(boxes, node_size=4)
+        rng = np.random.RandomState(1)
+        points = rng.uniform(0, 100, (300, 2))
+        point_indices, indices = tree.query_points(points)
+        b = boxes.bounds
+        expected = [(i, j) for i, (x, y) in enumerate(points) 
+            for j in range(len(b)) 
+            if b[j, 0] <= x <= b[j, 2] and b[j, 1] <= y <= b[j, 3]]
+        assert_equal(list(zip(point_indices.tolist(), indices.tolist())), 
+            expected)
+        queries = self.random_boxes(50, seed=2)
+        query_indices, indices = tree.query_boxes(queries)
+        expected = [(i, j) for i, q in enumerate(queries) 
+            for j, box in enumerate(boxes) if q.intersects(box)]
+        assert_equal(list(zip(query_indices.tolist(), indices.tolist())), 
+            expected)
+
+    def test_nearest(self):
+        import numpy as np
+        boxes = self.random_boxes(200)
+        tree = self.RTree(boxes, node_size=4)
+        rng = np.random.RandomState(3)
+        points = rng.uniform(-20, 120, (50, 2))
+        indices, distances = tree.nearest_points(points, k=4)
+        b = boxes.bounds
+        for p, d in zip(points, distances):
+            brute = np.hypot(
+                np.maximum(np.maximum(b[:, 0] - p[0], p[0] - b[:, 2]), 0),
+                np.maximum(np.maximum(b[:, 1] - p[1], p[1] - b[:, 3]), 0))
+            assert np.allclose(d, np.sort(brute)[:4])
+        box = self.BoundingBox([(0, 0), (1, 1)])
+        tree = self.RTree([box, self.BoundingBox([(3, 0), (4, 1)])])
+        assert_equal(tree.nearest((0.5, 0.5), k=3), [(0, 0.0), (1, 2.5)])
+        assert_equal(tree.nearest((float('nan'), 0.5)), [])
+        assert_equal(tree.nearest((float('-inf'), 0.5)), [])
+
+
+class PolygonIndexTestCase(unittest.TestCase):
+    from planar.polygon import Polygon
+    from planar.index import PolygonIndex
+
+    def polygons(self):
+        return [self.Polygon([(0, 0), (2, 0), (0, 2)]),
+            self.Polygon([(0.5, 0.5), (3, 0.5), (3, 3), (0.5, 3)]),
+            self.Polygon.regular(6, 2, center=(6, 6))]
+
+    def test_locate(self):
+        index = self.PolygonIndex(self.polygons())
+        assert_equal(len(index), 3)
+        points = [(0.2, 0.2), (1.9, 1.9), (0.8, 0.8), (6, 6), (0.2, 1.95), 
+            (10, 10)]
+        assert_equal(index.locate(points).tolist(), [0, 1, 0, 2, -1, -1])
+        point_indices, indices = index.locate_all(points)
+        assert_equal(list(zip(point_indices.tolist(), indices.tolist())),
+            [(0, 0), (1, 1), (2, 0), (2, 1), (3, 2)])
+
+    def test_locate_matches_brute_force(self):
+        import numpy as np
+        rng = np.random.RandomState(4)
+        polygons = [self.Polygon.star(5, 2, 1, center=c, angle=a) 
+            for c, a in zip(rng.uniform(0, 50, (100, 2)).tolist(), 
+                rng.uniform(0, 360, 100).tolist())]
+        index = self.PolygonIndex(polygons)
+        points = rng.uniform(0, 50, (500, 2))
+        located = index.locate(points)
+        for p, i in zip(points.tolist(), located.tolist()):
+            inside = [j for j, poly in enumerate(polygons) 
+                if poly.contains_point(p)]
+            assert_equal(i, inside[0] if inside else -1)
+
+
+class KDTreeTestCase(unittest.TestCase):
+    from planar.vector import Vec2, Vec2Array
+    from planar.box import BoundingBox
+    from planar.index import KDTree
+
+    def random_points(self, count, seed=0):
+        import numpy as np
+        return np.random.RandomState(seed).uniform(0, 100, (count, 2))
+
+    def test_points(self):
+        points = self.Vec2Array([(0, 0), (1, 2), (3, 1)])
+        tree = self.KDTree(points)
+        assert_equal(len(tree), 3)
+        assert_equal(tree.points.tolist(), [[0, 0], [1, 2], [3, 1]])
+        assert not tree.points.flags.writeable
+        assert_equal(len(self.KDTree([])), 0)
+
+    def test_nearest(self):
+        tree = self.KDTree([(0, 0), (1, 2), (3, 1), (5, 5)])
+        (i, dist), = tree.nearest(self.Vec2(2.5, 1))
+        assert_equal(i, 2)
+        assert_almost_equal(dist, 0.5)
+        result = tree.nearest((0, 1), k=2)
+        assert_equal([r[0] for r in result], [0, 1])
+        assert_almost_equal(result[1][1], 2 ** 0.5)
+        assert_equal(len(tree.nearest((0, 0), k=10)), 4)
+        assert_equal(self.KDTree([]).nearest((0, 0)), [])
+        assert_equal(tree.nearest((float('nan'), 0)), [])
+        assert_equal(tree.nearest((0, float('inf')), k=2), [])
+
+    def test_within_distance(self):
+        tree = self.KDTree([(0, 0), (1, 2), (3, 1), (5, 5)])
+        assert_equal(tree.within_distance((1, 1), 1), [1])
+        assert_equal(tree.within_distance((1, 1), 2 ** 0.5), [0, 1])
+        point_indices, indices = tree.within_distance_points(
+            [(0, 0), (5, 4)], [0, 1])
+        assert_equal(list(zip(point_indices.tolist(), indices.tolist())),
+            [(0, 0), (1, 3)])
+
+    def test_query_box(self):
+        tree = self.KDTree([(0, 0), (1, 2), (3, 1), (5, 5)])
+        assert_equal(tree.query_box(self.BoundingBox([(1, 1), (3, 2)])), 
+            [1, 2])
+        box_indices, indices = tree.query_boxes([
+            self.BoundingBox([(4, 4), (6, 6)]), 
+            self.BoundingBox([(-1, -1), (0, 0)])])
+        assert_equal(list(zip(box_indices.tolist(), indices.tolist())),
+            [(0, 3), (1, 0)])
+
+    def test_queries_match_brute_force(self):
+        import numpy as np
+        for count in (1, 9, 100, 1037):
+            points = self.random_points(count, count)
+            tree = self.KDTree(points)
+            queries = self.random_points(50, count + 1) * 1.2 - 10
+            distances = np.hypot(
+                points[np.newaxis, :, 0] - queries[:, np.newaxis, 0],
+                points[np.newaxis, :, 1] - queries[:, np.newaxis, 1])
+            indices, nearest = tree.nearest_points(queries, k=3)
+            k = min(3, count)
+            assert_equal(indices[:, k:].tolist(), [[-1] * (3 - k)] * 50)
+            assert np.allclose(nearest[:, :k], 
+                np.sort(distances, axis=1)[:, :k])
+            assert np.allclose(nearest[:, :k], np.take_along_axis(
+                distances, indices[:, :k], 1))
+            point_indices, indices = tree.within_distance_points(
+                queries, 12)
+            expected = np.nonzero(distances <= 12)
+            assert_equal(point_indices.tolist(), expected[0].tolist())
+            assert_equal(indices.tolist(), expected[1].tolist())
+
+    def test_kd_order_partitions_cells(self):
+        from planar.index import _kd_order
+        points = self.random_points(1000, 3)
+        order = _kd_order(points, 8)
+        assert_equal(sorted(order.tolist()), list(range(1000)))
+        for size in (512, 64, 16):
+            for start in range(0, 1000 - size + 1, size):
+                low = points[order[start:start + size // 2]]
+                high = points[order[start + size // 2:start + size]]
+                assert (low[:, 0].max() <= high[:, 0].min()
+                    or low[:, 1].max() <= high[:, 1].min())
+
+
+class HashGridTestCase(unittest.TestCase):
+    from planar.vector import Vec2Array
+    from planar.box import BoundingBox
+    from planar.index import HashGrid
+
+    def random_points(self, count, seed=0):
+        import numpy as np
+        return np.random.RandomState(seed).uniform(0, 100, (count, 2))
+
+    def test_grid(self):
+        points = self.Vec2Array([(0, 0), (1, 2), (3, 1)])
+        grid = self.HashGrid(points, 1.5)
+        assert_equal(len(grid), 3)
+        assert_equal(grid.cell_size, 1.5)
+        assert_equal(grid.points.tolist(), [[0, 0], [1, 2], [3, 1]])
+        assert_equal(grid.domain, self.BoundingBox([(0, 0), (3, 3)]))
+        domain = self.BoundingBox([(-10, -10), (10, 10)])
+        grid = self.HashGrid(points, 2, domain)
+        assert_equal(grid.domain, domain)
+        grid.update([(20, 20)])
+        assert_equal(len(grid), 1)
+        assert_equal(grid.domain, domain)
+        assert_equal(len(self.HashGrid([], 1)), 0)
+
+    @raises(ValueError)
+    def test_bad_cell_size(self):
+        self.HashGrid([(0, 0)], 0)
+
+    def test_within_distance(self):
+        grid = self.HashGrid([(0, 0), (1, 2), (3, 1), (5, 5)], 1)
+        assert_equal(grid.within_distance((1, 1), 1), [1])
+        assert_equal(grid.within_distance((1, 1), 2 ** 0.5), [0, 1])
+        assert_equal(grid.within_distance((-3, -4), 5), [0])
+        point_indices, indices = grid.within_distance_points(
+            [(0, 0), (5, 4)], 1)
+        assert_equal(list(zip(point_indices.tolist(), indices.tolist())),
+            [(0, 0), (1, 3)])
+
+    def test_pairs(self):
+        grid = self.HashGrid([(0, 0), (1, 2), (3, 1), (0.5, 0), (5, 5)], 1)
+        indices, other_indices = grid.pairs(1)
+        assert_equal(list(zip(indices.tolist(), other_indices.tolist())),
+            [(0, 3)])
+        indices, other_indices = grid.pairs(2.5)
+        assert_equal(list(zip(indices.tolist(), other_indices.tolist())),
+            [(0, 1), (0, 3), (1, 2), (1, 3)])
+
+    def test_queries_match_brute_force(self):
+        import numpy as np
+        points = self.random_points(300)
+        queries = self.random_points(50, 1) * 1.4 - 20
+        distances = np.hypot(
+            points[np.newaxis, :, 0] - points[:, np.newaxis, 0],
+            points[np.newaxis, :, 1] - points[:, np.newaxis, 1])
+        query_distances = np.hypot(
+            points[np.newaxis, :, 0] - queries[:, np.newaxis, 0],
+            points[np.newaxis, :, 1] - queries[:, np.newaxis, 1])
+        for domain in (None, self.BoundingBox([(20, 30), (60, 50)])):
+            for cell_size, distance in ((5, 5), (5, 12), (10, 3)):
+                grid = self.HashGrid(points, cell_size, domain)
+                indices, other_indices = grid.pairs(distance)
+                expected = np.nonzero(np.triu(distances <= distance, 1))
+                assert_equal(indices.tolist(), expected[0].tolist())
+                assert_equal(other_indices.tolist(), expected[1].tolist())
+                point_indices, indices = grid.within_distance_points(
+                    queries, distance)
+                expected = np.nonzero(query_distances <= distance)
+                assert_equal(point_indices.tolist(), expected[0].tolist())
+                assert_equal(indices.tolist(), expected[1].tolist())
+
+
+class DynamicTreeTestCase(unittest.TestCase):
+    from planar.box import BoundingBox
+    from planar.polygon import Polygon
+    from planar.transform import Affine
+    from planar.index import DynamicTree
+
+    def random_boxes(self, count, rng):
+        boxes = []
+        for i in range(count):
+            x, y = rng.uniform(0, 100), rng.uniform(0, 100)
+            boxes.append(self.BoundingBox(
+                [(x, y), (x + rng.uniform(0, 3), y + rng.uniform(0, 3))]))
+        return boxes
+
+    def test_insert_remove(self):
+        tree = self.DynamicTree(margin=0)
+        assert_equal(len(tree), 0)
+        assert_equal(tree.height, -1)
+        assert_equal(tree.query_point((0, 0)), [])
+        a = tree.insert(self.BoundingBox([(0, 0), (1, 1)]))
+        b = tree.insert(self.Polygon([(2, 2), (3, 2), (3, 4)]))
+        assert_equal((a, b), (0, 1))
+        assert_equal(len(tree), 2)
+        assert b in tree
+        assert_equal(tree.handles, [0, 1])
+        assert_equal(tree.fat_box(b), self.BoundingBox([(2, 2), (3, 4)]))
+        assert_equal(tree.query_point((1, 1)), [a])
+        assert_equal(tree.query_box(self.BoundingBox([(0.5, 0), (2, 2)])), 
+            [a, b])
+        tree.remove(a)
+        assert a not in tree
+        assert_equal(len(tree), 1)
+        assert_equal(tree.query_point((1, 1)), [])
+        assert_equal(tree.insert(self.BoundingBox([(5, 5), (6, 6)])), a)
+
+    @raises(KeyError)
+    def test_remove_missing(self):
+        tree = self.DynamicTree([self.BoundingBox([(0, 0), (1, 1)])])
+        tree.remove(0)
+        tree.remove(0)
+
+    @raises(ValueError)
+    def test_negative_margin(self):
+        self.DynamicTree(margin=-1)
+
+    def test_update_within_margin(self):
+        poly = self.Polygon.regular(4, 1)
+        tree = self.DynamicTree([poly], margin=0.5)
+        fat_box = tree.fat_box(0)
+        assert_equal(fat_box, poly.bounding_box.inflate(1))
+        poly *= self.Affine.translation((0.3, -0.2))
+        assert not tree.update(0, poly)
+        assert_equal(tree.fat_box(0), fat_box)
+        poly *= self.Affine.translation((0.3, 0))
+        assert tree.update(0, poly)
+        assert_equal(tree.fat_box(0), poly.bounding_box.inflate(1))
+
+    def test_random_operations_match_brute_force(self):
+        import random
+        rng = random.Random(2)
+        boxes = self.random_boxes(300, rng)
+        tree = self.DynamicTree(boxes, margin=0.25)
+        boxes = dict(enumerate(boxes))
+        for step in range(1000):
+            action = rng.random()
+            if action < 0.2:
+                handle = rng.choice(sorted(boxes))
+                tree.remove(handle)
+                del boxes[handle]
+            elif action < 0.4:
+                box, = self.random_boxes(1, rng)
+                boxes[tree.insert(box)] = box
+            else:
+                handle = rng.choice(sorted(boxes))
+                offset = (rng.uniform(-1, 1), rng.uniform(-1, 1))
+                box = boxes[handle] = self.BoundingBox([
+                    boxes[handle].min_point + offset,
+                    boxes[handle].max_point + offset])
+                tree.update(handle, box)
+                fat_box = tree.fat_box(handle)
+                assert fat_box.contains_point(box.min_point)
+                assert fat_box.contains_point(box.max_point)
+            if step % 50 == 0:
+                assert_equal(tree.handles, sorted(boxes))
+                query, = self.random_boxes(1, rng)
+                assert_equal(tree.query_box(query), [h for h in sorted(boxes)
+                    if tree.fat_box(h).intersects(query)])
+        # The tree stays balanced
+        assert tree.height <= 2 * len(tree).bit_length(), tree.height
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+
+# vim: ai ts=4 sts=4 et sw=4 tw=78
@@ -310,11 +310,84 @@ class LineBaseTestCase(LinearBaseTestCase):
             self.Vec2(1, 0.5).normalized()), (line.direction, self.Vec2(1, 0.5).normalized())
         assert line.contains_point((-1, 1))
 
+    def test_imul_translation(self):
+        line = self.Line((1, 1), (2, 1))
+        line *= self.Affine.translation((3, -2))
+        assert line.almost_equals(self.Line((4, -1), (2, 1)))
+        line *= self.Affine.identity()
+        assert line.almost_equals(self.Line((4, -1), (2, 1)))
+
     @raises(TypeError)
     def test_imul_incompatible(self):
         line = self.Line((0, 0), (1, 1))
         line *= 2
 
+    def test_intersect(self):
+        line = self.Line((0, 1), (1, 1))
+        assert line.intersect(self.Line((0, 0), (1, 0))).almost_equals(
+            self.Vec2(-1, 0))
+        assert line.intersect(self.Line((2, 0), (0, -1))).almost_equals(
+            self.Vec2(2, 3))
+        assert self.Line((0, 0), (1, 0)).intersect(line).almost_equals(
+            self.Vec2(-1, 0))
+
+    def test_fit_collinear(self):
+        line = self.Line.fit([(0, 1), (2, 3), (-1, 0), (5, 6)])
+        assert line.almost_equals(self.Line((0, 1), (1, 1)))
+        line = self.Line.fit([(5, 6), (0, 1), (2, 3)])
+        assert line.almost_equals(self.Line((0, 1), (-1, -1)))
+        line = self.Line.fit([(3, 0), (3, 4)])
+        assert line.almost_equals(self.Line((3, 0), (0, 1)))
+
+    def test_fit_noisy(self):
+        points = [(0, 0.1), (1, -0.1), (2, -0.1), (3, 0.1)]
+        line = self.Line.fit(points)
+        assert line.almost_equals(self.Line((0, 0), (1, 0)))
+        # Fitting is orthogonal, unlike ordinary least squares
+        points = [(0.1, 0), (-0.1, 1), (-0.1, 2), (0.1, 3)]
+        line = self.Line.fit(points)
+        assert line.almost_equals(self.Line((0, 0), (0, 1)))
+
+    @raises(ValueError)
+    def test_fit_too_few(self):
+        self.Line.fit([(1, 1)])
+
+    @raises(ValueError)
+    def test_fit_coincident(self):
+        self.Line.fit([(1, 1), (1, 1), (1, 1)])
+
+    def test_distances_to(self):
+        import numpy
+        line = self.Line((0, 1), (1, 1))
+        points = [(0, 0), (-5, 2), (3, 4), (1, 2)]
+        distances = line.distances_to(points)
+        assert isinstance(distances, numpy.ndarray)
+        for p, d in zip(points, distances):
+            assert_almost_equal(d, line.distance_to(p))
+        grid = numpy.zeros((3, 4, 2))
+        assert_equal(line.distances_to(grid).shape, (3, 4))
+
+    def test_classify_points(self):
+        line = self.Line((0, 1), (1, 1))
+        points = [(0, 0), (-5, 2), (3, 4), (1, 2), (0, 1.000001)]
+        assert_equal(line.classify_points(points).tolist(),
+            [1, -1, 0, 0, 0])
+        for p, c in zip(points, line.classify_points(points)):
+            assert_equal(c == -1, line.point_left(p))
+            assert_equal(c == 1, line.point_right(p))
+            assert_equal(c == 0, line.contains_point(p))
+
+    def test_intersect_parallel(self):
+        line = self.Line((0, 1), (1, 1))
+        assert line.intersect(self.Line((0, 0), (1, 1))) is None
+        assert line.intersect(self.Line((0, 0), (-2, -2))) is None
+
+    def test_intersect_collinear(self):
+        line = self.Line((0, 1), (1, 1))
+        overlap = line.intersect(self.Line((3, 4), (-1, -1)))
+        assert isinstance(overlap, self.Line)
+        assert overlap.almost_equals(line)
+
 
 class RayBaseTestCase(LinearBaseTestCase):
     
@@ -445,6 +518,12 @@ class RayBaseTestCase(LinearBaseTestCase):
             self.Vec2(1, 0.5).normalized())
         assert ray.contains_point((-1, 1))
 
+    def test_imul_translation(self):
+        ray = self.Ray((1, 1), (2, 1))
+        ray *= self.Affine.translation((3, -2))
+        assert_equal(ray.anchor, self.Vec2(4, -1))
+        assert ray.direction.almost_equals(self.Vec2(2, 1).normalized())
+
     @raises(TypeError)
     def test_imul_incompatible(self):
         ray = self.Ray((0, 0), (1, 1)) 
@@ -483,6 +562,38 @@ class RayBaseTestCase(LinearBaseTestCase):
         assert_equal(repr(ray), "Ray((0.37, 0.0), (0.0, 1.0))")
 
 
+    def test_intersect_line(self):
+        ray = self.Ray((0, 0), (1, 1))
+        assert ray.intersect(self.Line((0, 2), (1, 0))).almost_equals(
+            self.Vec2(2, 2))
+        assert ray.intersect(self.Line((0, -2), (1, 0))) is None
+        assert self.Line((0, -2), (1, 0)).intersect(ray) is None
+        assert ray.intersect(self.Line((5, 0), (1, 1))) is None
+
+    def test_intersect_ray(self):
+        ray = self.Ray((0, 0), (1, 0))
+        assert ray.intersect(self.Ray((2, -1), (0, 1))).almost_equals(
+            self.Vec2(2, 0))
+        assert ray.intersect(self.Ray((2, -1), (0, -1))) is None
+        assert ray.intersect(self.Ray((-2, -1), (0, 1))) is None
+        assert ray.intersect(self.Ray((0, 0), (0, 1))).almost_equals(
+            self.Vec2(0, 0))
+
+    def test_intersect_collinear(self):
+        ray = self.Ray((0, 0), (1, 0))
+        assert ray.intersect(self.Ray((-1, 0), (-1, 0))) is None
+        assert ray.intersect(self.Ray((0, 0), (-1, 0))).almost_equals(
+            self.Vec2(0, 0))
+        overlap = ray.intersect(self.Ray((3, 0), (-1, 0)))
+        assert overlap.almost_equals(self.LineSegment((0, 0), (3, 0)))
+        overlap = ray.intersect(self.Ray((-3, 0), (2, 0)))
+        assert overlap.almost_equals(ray)
+        overlap = ray.intersect(self.Line((5, 0), (-1, 0)))
+        assert overlap.almost_equals(ray)
+        overlap = self.Line((5, 0), (-1, 0)).intersect(ray)
+        assert overlap.almost_equals(ray)
+
+
 class BaseLineSegmentTestCase(LinearBaseTestCase):
 
     def test_null_direction(self):
@@ -734,6 +845,15 @@ class BaseLineSegmentTestCase(LinearBaseTestCase):
         assert line.start.almost_equals((-1, 1))
         assert line.end.almost_equals((0, 1.5)), line.end
 
+    def test_imul_translation(self):
+        seg = self.LineSegment((1, 1), (2, 1))
+        seg *= self.Affine.translation((3, -2))
+        assert_equal(seg.anchor, self.Vec2(4, -1))
+        assert seg.vector.almost_equals((2, 1))
+        seg *= self.Affine.scale((2, -1))
+        assert_equal(seg.anchor, self.Vec2(8, 1))
+        assert seg.vector.almost_equals((4, -1))
+
     @raises(TypeError)
     def test_imul_incompatible(self):
         line = self.LineSegment((0, 0), (1, 1)) 
@@ -765,6 +885,96 @@ class BaseLineSegmentTestCase(LinearBaseTestCase):
         assert not line.almost_equals(self.LineSegment((1,-1.99), (2, 5)))
 
 
+    def test_length2(self):
+        seg = self.LineSegment((1, 1), (3, 4))
+        assert_equal(seg.length2, 25)
+        seg.vector = (1, 1)
+        assert_almost_equal(seg.length2, 2)
+
+    def test_cached_end_mid(self):
+        seg = self.LineSegment((1, 1), (4, 2))
+        assert seg.end is seg.end
+        assert seg.mid is seg.mid
+        assert_equal(seg.points, ((1, 1), seg.end))
+        seg.anchor = (0, 0)
+        assert_equal(seg.end, (4, 2))
+        assert_equal(seg.mid, (2, 1))
+        seg.length = 10
+        assert seg.end.almost_equals(seg.direction * 10)
+        seg.vector = (0, 3)
+        assert_equal(seg.end, (0, 3))
+        assert_equal(seg.mid, (0, 1.5))
+        seg.direction = (1, 0)
+        assert_equal(seg.end, (3, 0))
+        seg.normal = (0, 1)
+        assert seg.end.almost_equals((-3, 0))
+        seg.end = (2, 2)
+        assert seg.mid.almost_equals((1, 1))
+        seg *= self.Affine.translation((1, -1))
+        assert seg.end.almost_equals((3, 1))
+        assert seg.mid.almost_equals((2, 0))
+        seg *= self.Affine.scale(2)
+        assert seg.end.almost_equals((6, 2))
+
+    def test_slots(self):
+        import copy
+        seg = self.LineSegment((1, 1), (4, 2))
+        assert not hasattr(seg, '__dict__')
+        seg2 = copy.copy(seg)
+        assert_equal(seg2, seg)
+        assert_equal(seg2.end, seg.end)
+
+    def test_intersect(self):
+        seg = self.LineSegment((0, 0), (4, 4))
+        assert seg.intersect(self.LineSegment((0, 4), (4, -4))).almost_equals(
+            self.Vec2(2, 2))
+        assert seg.intersect(self.LineSegment((0, 4), (1, -1))) is None
+        assert seg.intersect(self.LineSegment((4, 4), (1, -1))).almost_equals(
+            self.Vec2(4, 4))
+        assert seg.intersect(self.Line((0, 1), (1, 0))).almost_equals(
+            self.Vec2(1, 1))
+        assert seg.intersect(self.Line((0, 5), (1, 0))) is None
+
+    def test_intersect_parallel(self):
+        seg = self.LineSegment((0, 0), (4, 4))
+        assert seg.intersect(self.LineSegment((1, 0), (4, 4))) is None
+
+    def test_intersect_collinear(self):
+        seg = self.LineSegment((0, 0), (4, 0))
+        assert seg.intersect(self.LineSegment((5, 0), (2, 0))) is None
+        assert seg.intersect(self.LineSegment((6, 0), (-2, 0))).almost_equals(
+            self.Vec2(4, 0))
+        overlap = seg.intersect(self.LineSegment((6, 0), (-4, 0)))
+        assert overlap.almost_equals(self.LineSegment((2, 0), (2, 0)))
+        overlap = seg.intersect(self.LineSegment((1, 0), (2, 0)))
+        assert overlap.almost_equals(self.LineSegment((1, 0), (2, 0)))
+        overlap = seg.intersect(self.Line((-1, 0), (-1, 0)))
+        assert overlap.almost_equals(seg)
+
+    def test_bounding_box(self):
+        from planar import BoundingBox
+        seg = self.LineSegment((1, 4), (2, -3))
+        assert_equal(seg.bounding_box, BoundingBox([(1, 1), (3, 4)]))
+
+    def test_clip_to_box(self):
+        from planar import BoundingBox
+        box = BoundingBox([(0, 0), (10, 8)])
+        seg = self.LineSegment((-2, 4), (14, 0))
+        clipped = seg.clip_to_box(box)
+        assert clipped.almost_equals(self.LineSegment((0, 4), (10, 0)))
+        clipped = self.LineSegment((12, 9), (-14, -7)).clip_to_box(box)
+        assert clipped.almost_equals(self.LineSegment((10, 8), (-10, -5)))
+        assert clipped.direction.almost_equals(self.Vec2(-14, -7).normalized())
+        seg = self.LineSegment((2, 2), (1, 1))
+        assert_equal(seg.clip_to_box(box), seg)
+        assert self.LineSegment((0, -1), (5, 0)).clip_to_box(box) is None
+        assert self.LineSegment((12, 0), (1, 1)).clip_to_box(box) is None
+        assert self.LineSegment((9, 10), (3, -3)).clip_to_box(box) is None
+        clipped = self.LineSegment((-1, 7), (2, 2)).clip_to_box(box)
+        assert_almost_equal(clipped.length, 0)
+        assert clipped.anchor.almost_equals(self.Vec2(0, 8))
+
+
 class PyLineTestCase(LineBaseTestCase, unittest.TestCase):
     from planar.vector import Vec2
     from planar.line import Line
@@ -795,13 +1005,13 @@ class CLineTestCase(LineBaseTestCase, unittest.TestCase):
 
 class PyRayTestCase(RayBaseTestCase, unittest.TestCase):
     from planar.vector import Vec2
-    from planar.line import Ray, Line
+    from planar.line import Ray, Line, LineSegment
     from planar.transform import Affine
     LinearType = Ray
 
 
 class CRayTestCase(RayBaseTestCase, unittest.TestCase):
-    from planar.c import Vec2, Ray, Line, Affine
+    from planar.c import Vec2, Ray, Line, LineSegment, Affine
     LinearType = Ray
 
     def test_str(self):
@@ -840,6 +1050,271 @@ class CSegmentTestCase(BaseLineSegmentTestCase, unittest.TestCase):
         line = self.LineSegment((0.37, 0), (2, 23.5))
         assert_equal(repr(line), "LineSegment((0.37, 0), (2, 23.5))")
 
+class LineArrayTestCase(unittest.TestCase):
+    from planar.vector import Vec2
+    from planar.line import Line, LineArray
+
+    def lines(self):
+        return [self.Line((0, 0), (1, 0)), self.Line((0, 1), (1, 1)),
+            self.Line((3, -2), (0, -1))]
+
+    def points(self):
+        return [(0, 0), (1, 0), (3, 5), (-1, 0.5), (1, 2), (0.5, -3)]
+
+    def test_from_lines(self):
+        lines = self.lines()
+        array = self.LineArray(lines)
+        assert_equal(len(array), 3)
+        assert_equal(array.normals.shape, (3, 2))
+        assert_equal(array.offsets.shape, (3,))
+        for line, aline in zip(lines, array):
+            assert isinstance(aline, self.Line)
+            assert aline.almost_equals(line)
+        assert array[1].almost_equals(lines[1])
+        assert_equal(len(array[1:]), 2)
+        assert self.Vec2(*array.directions[1]).almost_equals(
+            lines[1].direction)
+        assert_equal(len(self.LineArray()), 0)
+
+    def test_from_normals(self):
+        array = self.LineArray.from_normals([(0, 2), (-3, 0)], [1, 2])
+        assert array[0].almost_equals(self.Line.from_normal((0, 1), 1))
+        assert array[1].almost_equals(self.Line.from_normal((-1, 0), 2))
+
+    @raises(ValueError)
+    def test_from_normals_null(self):
+        self.LineArray.from_normals([(0, 2), (0, 0)], [1, 2])
+
+    @raises(ValueError)
+    def test_from_normals_mismatched(self):
+        self.LineArray.from_normals([(0, 2), (1, 0)], [1])
+
+    def test_fit(self):
+        import numpy
+        rng = numpy.random.RandomState(4)
+        groups = []
+        for count in (2, 5, 3, 10):
+            angle = rng.uniform(0, 2 * numpy.pi)
+            t = rng.uniform(-5, 5, count)
+            base = rng.uniform(-10, 10, 2)
+            noise = rng.normal(0, 0.1, (count, 2))
+            groups.append(base + numpy.outer(t, 
+                (numpy.cos(angle), numpy.sin(angle))) + noise)
+        starts = numpy.cumsum([0] + [len(g) for g in groups[:-1]])
+        array = self.LineArray.fit(numpy.concatenate(groups), starts)
+        assert_equal(len(array), 4)
+        for group, line in zip(groups, array):
+            assert line.almost_equals(self.Line.fit(group.tolist()))
+        assert_equal(len(self.LineArray.fit(numpy.zeros((0, 2)), [])), 0)
+
+    @raises(ValueError)
+    def test_fit_small_group(self):
+        self.LineArray.fit([(0, 0), (1, 1), (2, 2)], [0, 2])
+
+    @raises(ValueError)
+    def test_fit_coincident(self):
+        self.LineArray.fit([(0, 0), (1, 1), (2, 2), (2, 2)], [0, 2])
+
+    def test_queries_single_point(self):
+        lines = self.lines()
+        array = self.LineArray(lines)
+        for p in self.points():
+            for name in ('contains_point', 'point_left', 'point_right'):
+                assert_equal(list(getattr(array, name)(p)), 
+                    [getattr(line, name)(p) for line in lines], (name, p))
+            for line, d in zip(lines, array.distance_to(p)):
+                assert_almost_equal(d, line.distance_to(p))
+            assert_equal(array.classify_points(p).tolist(),
+                [line.classify_points([p])[0] for line in lines])
+
+    def test_classify_all_pairs(self):
+        import numpy
+        lines = self.lines()
+        array = self.LineArray(lines)
+        points = numpy.array(self.points())
+        classes = array.classify_points(points[:, numpy.newaxis])
+        assert_equal(classes.shape, (len(points), len(lines)))
+        for j, line in enumerate(lines):
+            assert_equal(classes[:, j].tolist(), 
+                line.classify_points(points).tolist())
+
+
+class LineSegmentArrayTestCase(unittest.TestCase):
+    from planar.vector import Vec2
+    from planar.line import LineSegment, LineSegmentArray
+    from planar.polygon import Polygon
+
+    def segments(self):
+        LS = self.LineSegment
+        return [LS((0, 0), (2, 0)), LS((1, 1), (0, 3)), LS((-1, 2), (3, -4)),
+            LS((5, 5), (0, 0))]
+
+    def points(self):
+        return [(0, 0), (1, 0), (3, 0), (-1, 0.5), (1, 2), (0.5, -3), 
+            (5, 5), (6, 5)]
+
+    def test_from_segments(self):
+        segs = self.segments()
+        array = self.LineSegmentArray(segs)
+        assert_equal(len(array), 4)
+        assert_equal(array.anchors.shape, (4, 2))
+        assert_equal(array.lengths.shape, (4,))
+        for seg, aseg in zip(segs, array):
+            assert isinstance(aseg, self.LineSegment)
+            assert_equal(aseg, seg)
+            assert_equal(aseg.normal, seg.normal)
+        assert_equal(array[2], segs[2])
+        assert_equal(array.to_segments(), segs)
+        assert_equal(len(self.LineSegmentArray()), 0)
+
+    def test_from_points(self):
+        segs = self.segments()
+        array = self.LineSegmentArray.from_points(
+            [s.start for s in segs], [s.end for s in segs])
+        assert array.almost_equals(self.LineSegmentArray(segs))
+        for seg, aseg in zip(segs, array):
+            assert aseg.almost_equals(seg)
+            assert aseg.direction.almost_equals(seg.direction)
+            assert aseg.end.almost_equals(seg.end)
+            assert aseg.mid.almost_equals(seg.mid)
+
+    def test_columns(self):
+        array = self.LineSegmentArray(self.segments())
+        for seg, end, mid, vector in zip(
+            self.segments(), array.ends, array.mids, array.vectors):
+            assert seg.end.almost_equals(end)
+            assert seg.mid.almost_equals(mid)
+            assert seg.vector.almost_equals(vector)
+
+    def test_slice(self):
+        array = self.LineSegmentArray(self.segments())
+        sub = array[1:3]
+        assert isinstance(sub, self.LineSegmentArray)
+        assert_equal(sub.to_segments(), self.segments()[1:3])
+        sub = array[[3, 0]]
+        segs = self.segments()
+        assert_equal(sub.to_segments(), [segs[3], segs[0]])
+
+    def test_polygon_edges(self):
+        poly = self.Polygon([(0, 0), (2, 0), (2, 1), (0, 1)])
+        edges = self.LineSegmentArray.from_polygon(poly)
+        assert_equal(len(edges), 4)
+        assert edges[0].almost_equals(self.LineSegment((0, 1), (0, -1)))
+        assert edges[1].almost_equals(self.LineSegment((0, 0), (2, 0)))
+        assert_equal(edges.to_polygon(), poly)
+
+    def test_queries_match_segments(self):
+        segs = self.segments()
+        array = self.LineSegmentArray(segs)
+        for p in self.points():
+            for name in ('contains_point', 'point_ahead', 'point_behind',
+                'point_left', 'point_right'):
+                assert_equal(list(getattr(array, name)(p)), 
+                    [getattr(s, name)(p) for s in segs], (name, p))
+            for seg, d in zip(segs, array.distance_to(p)):
+                assert_almost_equal(d, seg.distance_to(p))
+            for seg, proj in zip(segs, array.project(p)):
+                assert seg.project(p).almost_equals(proj), (seg, p, proj)
+
+    def test_queries_all_pairs(self):
+        import numpy
+        segs = self.segments()
+        array = self.LineSegmentArray(segs)
+        points = numpy.array(self.points())
+        distances = array.distance_to(points[:, numpy.newaxis])
+        projections = array.project(points[:, numpy.newaxis])
+        assert_equal(distances.shape, (len(points), len(segs)))
+        assert_equal(projections.shape, (len(points), len(segs), 2))
+        for i, p in enumerate(self.points()):
+            for j, seg in enumerate(segs):
+                assert_almost_equal(distances[i, j], seg.distance_to(p))
+                assert seg.project(p).almost_equals(projections[i, j])
+
+    def test_queries_paired(self):
+        segs = self.segments()
+        array = self.LineSegmentArray(segs)
+        points = self.points()[:len(segs)]
+        for seg, p, d in zip(segs, points, array.distance_to(points)):
+            assert_almost_equal(d, seg.distance_to(p))
+
+    def test_bounds(self):
+        array = self.LineSegmentArray(self.segments())
+        assert_equal(array.bounds.tolist(), [[0, 0, 2, 0], [1, 1, 1, 4],
+            [-1, -2, 2, 2], [5, 5, 5, 5]])
+
+    def test_intersections(self):
+        LS = self.LineSegment
+        segs = [LS((0, 0), (4, 4)), LS((0, 4), (4, -4)), LS((5, 0), (0, 1))]
+        others = [LS((0, 1), (10, 0)), LS((2, 2), (4, 4)), LS((9, 9), (1, 0))]
+        array = self.LineSegmentArray(segs)
+        indices, other_indices, points = array.intersections(
+            self.LineSegmentArray(others))
+        assert_equal(list(zip(indices.tolist(), other_indices.tolist())),
+            [(0, 0), (0, 1), (1, 0), (1, 1), (2, 0)])
+        assert_equal(points.shape, (5, 2))
+        for i, j, point in zip(indices, other_indices, points):
+            assert segs[i].contains_point(point)
+            assert others[j].contains_point(point)
+        assert self.Vec2(*points[1]).almost_equals((2, 2))
+
+    def test_clip_to_box(self):
+        from planar import BoundingBox
+        LS = self.LineSegment
+        segs = [LS((-2, 4), (14, 0)), LS((0, -1), (5, 0)), LS((2, 2), (1, 1)),
+            LS((12, 9), (-14, -7))]
+        clipped, indices = self.LineSegmentArray(segs).clip_to_box(
+            BoundingBox([(0, 0), (10, 8)]))
+        assert isinstance(clipped, self.LineSegmentArray)
+        assert_equal(indices.tolist(), [0, 2, 3])
+        assert clipped.almost_equals(self.LineSegmentArray([
+            LS((0, 4), (10, 0)), LS((2, 2), (1, 1)), 
+            LS((10, 8), (-10, -5))]))
+
+    def test_clip_to_box_matches_scalar(self):
+        import numpy
+        from planar import BoundingBox
+        rng = numpy.random.RandomState(5)
+        array = self.LineSegmentArray.from_points(
+            rng.uniform(-5, 15, (200, 2)), rng.uniform(-5, 15, (200, 2)))
+        box = BoundingBox([(0, 0), (10, 8)])
+        clipped, indices = array.clip_to_box(box)
+        expected = [(i, seg.clip_to_box(box)) for i, seg in enumerate(array)]
+        expected = [(i, seg) for i, seg in expected if seg is not None]
+        assert_equal(indices.tolist(), [i for i, seg in expected])
+        for seg, (i, expected_seg) in zip(clipped, expected):
+            assert seg.almost_equals(expected_seg)
+
+    def test_intersections_self(self):
+        LS = self.LineSegment
+        segs = [LS((0, 0), (4, 4)), LS((0, 4), (4, -4)), LS((5, 0), (0, 1))]
+        indices, other_indices, points = self.LineSegmentArray(
+            segs).intersections()
+        assert_equal(indices.tolist(), [0])
+        assert_equal(other_indices.tolist(), [1])
+        assert self.Vec2(*points[0]).almost_equals((2, 2))
+
+    def test_intersections_match_scalar(self):
+        import numpy
+        rng = numpy.random.RandomState(2)
+        def random_array(count):
+            starts = rng.uniform(0, 20, (count, 2)).round()
+            ends = starts + rng.uniform(-4, 4, (count, 2)).round()
+            return self.LineSegmentArray.from_points(starts, ends)
+        array = random_array(60)
+        others = random_array(50)
+        indices, other_indices, points = array.intersections(others)
+        expected = set()
+        for i, seg in enumerate(array):
+            for j, other in enumerate(others):
+                if seg.intersect(other) is not None:
+                    expected.add((i, j))
+        assert_equal(set(zip(indices.tolist(), other_indices.tolist())), 
+            expected)
+        for i, j, point in zip(indices, other_indices, points):
+            assert array[int(i)].contains_point(point)
+            assert others[int(j)].contains_point(point)
+
+
 if __name__ == '__main__':
     unittest.main()
 
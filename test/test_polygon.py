@@ -209,6 +209,14 @@ class PolygonBaseTestCase(object):
             assert_equal(self.Vec2.polar(angle, 2) + (-3, 1), poly[i])
             angle += 120
 
+    def test_regular_many_vertices(self):
+        poly = self.Polygon.regular(1000, 2.5, center=(1, -1), angle=10)
+        assert_equal(len(poly), 1000)
+        angle = 10
+        for i in range(1000):
+            assert_equal(self.Vec2.polar(angle, 2.5) + (1, -1), poly[i])
+            angle += 0.36
+
     @raises(ValueError)
     def test_regular_too_few_sides(self):
         self.Polygon.regular(2, 1)
@@ -314,6 +322,27 @@ class PolygonBaseTestCase(object):
         assert_equal(bbox.min_point, (0, -2))
         assert_equal(bbox.max_point, (4, 0))
 
+    def test_edge_index(self):
+        import planar
+        poly = self.Polygon([(0, 0), (0, 2), (2, 2), (2, 0)])
+        index = poly.edge_index
+        assert isinstance(index, planar.SegmentIndex)
+        assert poly.edge_index is index
+        assert_equal(len(index), 4)
+        i, dist, point = index.cast(planar.Ray((1, 1), (1, 0)))
+        assert_equal(i, 3)
+        assert_almost_equal(dist, 1)
+        assert point.almost_equals((2, 1))
+        hits = index.cast_all(planar.Ray((-1, 1), (1, 0)))
+        assert_equal([h[0] for h in hits], [1, 3])
+        poly[2] = (4, 2)
+        assert poly.edge_index is not index
+        i, dist, point = poly.edge_index.cast(planar.Ray((1, 1.5), (1, 0)))
+        assert point.almost_equals((3.5, 1.5))
+        poly *= self.Affine.translation((1, 0))
+        i, dist, point = poly.edge_index.cast(planar.Ray((2, 1.5), (1, 0)))
+        assert point.almost_equals((4.5, 1.5))
+
     def test_eq_identical(self):
         poly1 = self.Polygon([(0,0), (1,0), (1,1), (-1, 1)])
         poly2 = self.Polygon([(0,0), (1,0), (1,1), (-1, 1)])
@@ -886,6 +915,62 @@ class PolygonBaseTestCase(object):
         V = self.Vec2
         assert_equal(tuple(a), (V(6, -2), V(8, 0), V(10, 2)))
 
+    def test_imul_preserves_cached_properties(self):
+        poly = self.Polygon([(0,0), (2,0), (3,2), (1,3), (-1,1)])
+        assert poly.is_convex
+        centroid = poly.centroid
+        t = self.Affine.rotation(30, (1, 1)) * self.Affine.scale((2, 3))
+        poly *= t
+        assert poly.is_convex_known and poly.is_convex
+        assert poly.is_simple_known and poly.is_simple
+        assert poly.is_centroid_known
+        assert poly.centroid.almost_equals(centroid * t)
+        assert poly._y_polylines is not None
+        fresh = self.Polygon(list(poly))
+        assert fresh.centroid.almost_equals(poly.centroid)
+        for x in range(-6, 12):
+            for y in range(-6, 12):
+                pt = (x * 0.7, y * 0.7)
+                assert_equal(poly.contains_point(pt), 
+                    fresh.contains_point(pt), pt)
+
+    def test_imul_transforms_y_polylines(self):
+        for t in [self.Affine.translation((3, -2)), 
+            self.Affine.scale((-2, 1)), self.Affine.scale((1, -3)),
+            self.Affine.scale(-1) * self.Affine.shear(20, 0)]:
+            poly = self.Polygon([(0,0), (2,0), (3,2), (1,3), (-1,1)], 
+                is_convex=True)
+            poly *= t
+            fresh = self.Polygon(list(poly), is_convex=True)
+            for x in range(-12, 12):
+                for y in range(-12, 12):
+                    pt = (x * 0.6, y * 0.6)
+                    assert_equal(poly.contains_point(pt), 
+                        fresh.contains_point(pt), (t, pt))
+
+    def test_imul_preserves_non_convex(self):
+        poly = self.Polygon([(0,0), (2,0), (1,1), (2,2), (0,2)])
+        assert not poly.is_convex
+        assert poly.is_simple
+        poly *= self.Affine.scale((-1, 2))
+        assert poly.is_convex_known and not poly.is_convex
+        assert poly.is_simple_known and poly.is_simple
+        poly *= self.Affine.scale((0, 1))
+        assert not poly.is_convex_known
+
+    def test_mul_preserves_cached_properties(self):
+        poly = self.Polygon.regular(7, 2)
+        t = self.Affine.translation((1, 1))
+        for moved in (poly * t, t * poly):
+            assert moved is not poly
+            assert moved.is_convex_known and moved.is_convex
+            assert moved.is_centroid_known
+            assert moved.centroid.almost_equals((1, 1))
+            assert moved.contains_point((1, 1))
+            assert not moved.contains_point((-1.5, 1))
+        assert poly.centroid.almost_equals((0, 0))
+        assert poly.contains_point((0, 0.5))
+
     @raises(TypeError)
     def test_imul_incompatible(self):
         a = self.Polygon([(1,2), (3,4), (5,6)])
@@ -903,6 +988,431 @@ class PolygonBaseTestCase(object):
     def test_mul_incompatible(self):
         a = self.Polygon([(1,2), (3,4), (5,6)]) * 2
 
+    def assert_triangulation(self, poly):
+        triangles = poly.triangulate()
+        assert_equal(triangles.shape, (len(poly) - 2, 3))
+        assert_equal(sorted(set(triangles.ravel().tolist())), 
+            list(range(len(poly))))
+        def area(verts):
+            return sum(a.cross(b) 
+                for a, b in zip(verts, verts[1:] + verts[:1]))
+        poly_area = area(list(poly))
+        total = 0.0
+        for triangle in triangles.tolist():
+            triangle_area = area([poly[i] for i in triangle])
+            # Triangles have the winding of the polygon
+            assert triangle_area * poly_area > 0
+            total += triangle_area
+        assert_almost_equal(total, poly_area)
+
+    def test_triangulate_convex(self):
+        poly = self.Polygon.regular(6, 2)
+        assert_equal(poly.triangulate().tolist(), 
+            [[0, 1, 2], [0, 2, 3], [0, 3, 4], [0, 4, 5]])
+        self.assert_triangulation(poly)
+        triangle = self.Polygon([(0, 0), (1, 0), (0, 1)])
+        assert_equal(triangle.triangulate().tolist(), [[0, 1, 2]])
+
+    def test_triangulate_concave(self):
+        star = self.Polygon.star(7, 1, 3)
+        self.assert_triangulation(star)
+        self.assert_triangulation(self.Polygon(list(star)[::-1]))
+        # A comb, with split and merge vertices at equal heights
+        comb = [(0, 0), (9, 0)]
+        for x in range(8, 0, -2):
+            comb.extend([(x + 1, 3), (x, 3), (x, 1)])
+        comb.extend([(1, 3), (0, 3)])
+        self.assert_triangulation(self.Polygon(comb))
+        self.assert_triangulation(self.Polygon([(y, x) for x, y in comb]))
+        self.assert_triangulation(self.Polygon(
+            [(x, -y) for x, y in comb]))
+
+    def test_triangulate_spiral(self):
+        import random
+        rng = random.Random(2)
+        for i in range(20):
+            count = rng.randint(4, 80)
+            angles = sorted(rng.uniform(0, 2 * math.pi) 
+                for j in range(count))
+            radii = [rng.uniform(0.2, 3) for j in range(count)]
+            self.assert_triangulation(self.Polygon([
+                (math.cos(a) * r, math.sin(a) * r) 
+                for a, r in zip(angles, radii)]))
+
+    def test_triangulate_cached(self):
+        poly = self.Polygon.star(5, 1, 2)
+        triangles = poly.triangulate()
+        assert poly.triangulate() is triangles
+        assert not triangles.flags.writeable
+        moved = poly * self.Affine.translation((2, 3))
+        assert moved.triangulate() is triangles
+        poly[0] = (0.5, 0)
+        assert poly.triangulate() is not triangles
+        self.assert_triangulation(poly)
+
+    @raises(ValueError)
+    def test_triangulate_not_simple(self):
+        self.Polygon([(0, 0), (1, 1), (1, 0), (0, 1)], 
+            is_simple=False).triangulate()
+
+    def test_sample_points(self):
+        import numpy
+        from planar.overlay import _points_in_ring
+        star = self.Polygon.star(5, 1, 4)
+        points = star.sample_points(5000, numpy.random.RandomState(1))
+        assert_equal(points.shape, (5000, 2))
+        ring = numpy.array([tuple(v) for v in star])
+        assert _points_in_ring(points, ring).all()
+        assert_equal(points.tolist(), 
+            star.sample_points(5000, numpy.random.RandomState(1)).tolist())
+        assert_equal(star.sample_points(0).shape, (0, 2))
+
+    def test_sample_points_uniform(self):
+        import numpy
+        # An L shape, with an area of 3 in the bottom row and 1 above
+        poly = self.Polygon([(0, 0), (3, 0), (3, 1), (1, 1), (1, 2), (0, 2)])
+        points = poly.sample_points(40000, numpy.random.default_rng(4))
+        assert abs((points[:, 1] < 1).mean() - 0.75) < 0.01
+        assert abs((points[:, 0] < 1).mean() - 0.5) < 0.01
+
+    @raises(ValueError)
+    def test_sample_points_no_area(self):
+        self.Polygon([(0, 0), (1, 1), (2, 2)]).sample_points(10)
+
+    def test_simplified(self):
+        # A square with small bumps along its bottom edge
+        poly = self.Polygon([(0, 0), (1, 0.1), (2, 0), (3, 0.1), (4, 0),
+            (4, 4), (0, 4)])
+        assert_equal(list(poly.simplified(0.5)), 
+            [(0, 0), (4, 0), (4, 4), (0, 4)])
+        assert_equal(list(poly.simplified(0.05)), list(poly))
+        assert_equal(list(poly.simplified(0.5, 'visvalingam_whyatt')), 
+            [(0, 0), (4, 0), (4, 4), (0, 4)])
+        # At least three vertices are kept
+        assert_equal(len(poly.simplified(100)), 3)
+        assert_equal(len(poly.simplified(100, 'visvalingam_whyatt')), 3)
+
+    def test_simplified_convex(self):
+        from planar import LineSegment
+        circle = self.Polygon.regular(64, 10)
+        simple = circle.simplified(0.5)
+        assert 3 < len(simple) < 64
+        assert simple.is_convex_known and simple.is_convex
+        for vert in circle:
+            assert min(LineSegment.from_points(pair).distance_to(vert)
+                for pair in zip(simple, list(simple[1:]) + [simple[0]])
+                ) <= 0.5 + 1e-9
+
+    def test_simplified_preserve_topology(self):
+        # Removing the dip at (5, -0.8) moves the bottom edge above the
+        # tip of the spike at (5, -0.4)
+        poly = self.Polygon([(0, 0), (4, 0), (5, -0.8), (6, 0), (10, 0),
+            (10, 10), (5.1, 10), (5, -0.4), (4.9, 10), (0, 10)])
+        for method in ('douglas_peucker', 'visvalingam_whyatt'):
+            simple = poly.simplified(1, method)
+            assert not self.Polygon(list(simple)).is_simple
+            simple = poly.simplified(1, method, preserve_topology=True)
+            assert self.Polygon(list(simple)).is_simple
+            assert (5, -0.8) in list(simple)
+
+    def test_simplify_polygons(self):
+        import random
+        rng = random.Random(4)
+        polygons = []
+        for i in range(30):
+            count = rng.randint(3, 60)
+            angles = sorted(rng.uniform(0, 2 * math.pi) 
+                for j in range(count))
+            polygons.append(self.Polygon([
+                (math.cos(a) * r, math.sin(a) * r) for a, r in zip(angles, 
+                    [rng.uniform(1, 3) for j in range(count)])]))
+        for method in ('douglas_peucker', 'visvalingam_whyatt'):
+            for preserve in (False, True):
+                results = self.Polygon.simplify_polygons(
+                    polygons, 0.3, method, preserve)
+                assert_equal([list(poly) for poly in results],
+                    [list(poly.simplified(0.3, method, preserve))
+                        for poly in polygons])
+
+    @raises(ValueError)
+    def test_simplified_negative_tolerance(self):
+        self.square(0, 0, 1).simplified(-1)
+
+    def test_clip_to_box(self):
+        box = self.BoundingBox([(0, 0), (4, 4)])
+        poly = self.Polygon([(-2, 2), (2, -2), (6, 2), (2, 6)])
+        clipped = poly.clip_to_box(box)
+        assert isinstance(clipped, self.Polygon)
+        assert_equal(clipped, self.Polygon([(0, 0), (0, 4), (4, 4), (4, 0)]))
+        assert clipped.is_convex
+        tri = self.Polygon([(1, 1), (3, 1), (2, 5)])
+        clipped = tri.clip_to_box(box)
+        assert_equal(clipped, 
+            self.Polygon([(1, 1), (3, 1), (2.25, 4), (1.75, 4)]))
+
+    def test_clip_to_box_inside_or_outside(self):
+        box = self.BoundingBox([(0, 0), (4, 4)])
+        poly = self.Polygon([(1, 1), (1, 2), (2, 2), (2, 1)], is_convex=True)
+        clipped = poly.clip_to_box(box)
+        assert clipped is not poly
+        assert_equal(clipped, poly)
+        assert clipped.is_convex_known
+        assert self.Polygon([(5, 5), (6, 5), (6, 6)]).clip_to_box(box) is None
+        # Touching the box is not enough to have an area inside of it
+        assert self.Polygon([(4, 1), (6, 1), (6, 3)]).clip_to_box(box) is None
+
+    def test_clip_to_box_concave(self):
+        box = self.BoundingBox([(-1, 2), (5, 5)])
+        poly = self.Polygon([(0, 0), (4, 0), (4, 4), (2, 1), (0, 4)])
+        clipped = poly.clip_to_box(box)
+        assert clipped.almost_equals(self.Polygon([(0, 2), (4, 2), (4, 4),
+            (8.0 / 3, 2), (4.0 / 3, 2), (0, 4)]))
+
+    def test_clip_to_box_zero_area(self):
+        # Touching the box along its side, with a vertex in the box
+        box = self.BoundingBox([(0, 0), (1, 1)])
+        poly = self.Polygon([(1, 0), (2, 0), (2, 1), (1, 1), (1, 0.5)])
+        assert poly.clip_to_box(box) is None
+        inside = self.Polygon([(0.5, 0.5), (1, 0.5), (1, 1)])
+        assert_equal(self.Polygon.clip_polygons_to_box([poly, inside, poly],
+            box), [None, inside, None])
+
+    def square(self, x, y, size):
+        return self.Polygon([(x, y), (x + size, y), (x + size, y + size), 
+            (x, y + size)])
+
+    def assert_overlay_equal(self, result, expected):
+        # The order of the resulting polygons is unspecified
+        assert_equal(len(result), len(expected))
+        result = sorted(result, 
+            key=lambda r: tuple(r[0].bounding_box.min_point))
+        expected = sorted(expected, 
+            key=lambda e: tuple(self.Polygon(e[0]).bounding_box.min_point))
+        for (shell, holes), (expected_shell, expected_holes) in zip(
+            result, expected):
+            assert_equal(shell, self.Polygon(expected_shell))
+            assert_equal(holes, [self.Polygon(h) for h in expected_holes])
+
+    def test_union(self):
+        self.assert_overlay_equal(
+            self.square(0, 0, 1).union(self.square(1, 0, 1)),
+            [([(0, 0), (2, 0), (2, 1), (0, 1)], [])])
+        # Squares touching at a corner remain separate
+        self.assert_overlay_equal(
+            self.square(0, 0, 1).union(self.square(1, 1, 1)),
+            [([(0, 0), (1, 0), (1, 1), (0, 1)], []),
+             ([(1, 1), (2, 1), (2, 2), (1, 2)], [])])
+        cw_square = self.Polygon([(0, 0), (0, 2), (2, 2), (2, 0)])
+        self.assert_overlay_equal(
+            cw_square.union(self.square(1, 1, 2)),
+            [([(0, 0), (2, 0), (2, 1), (3, 1), (3, 3), (1, 3), (1, 2), 
+                (0, 2)], [])])
+
+    def test_intersection(self):
+        self.assert_overlay_equal(
+            self.square(0, 0, 2).intersection(self.square(1, 1, 2)),
+            [([(1, 1), (2, 1), (2, 2), (1, 2)], [])])
+        assert_equal(self.square(0, 0, 2).intersection(
+            self.square(2, 0, 2)), [])
+        assert_equal(self.square(0, 0, 2).intersection(
+            self.square(3, 0, 2)), [])
+        concave = self.Polygon([(0, 0), (4, 0), (4, 4), (3, 4), (3, 1), 
+            (1, 1), (1, 4), (0, 4)])
+        self.assert_overlay_equal(
+            concave.intersection(self.Polygon([(-1, 2), (5, 2), (5, 3), 
+                (-1, 3)])),
+            [([(0, 2), (1, 2), (1, 3), (0, 3)], []),
+             ([(3, 2), (4, 2), (4, 3), (3, 3)], [])])
+
+    def test_convex_intersection(self):
+        a = self.Polygon.regular(6, 2)
+        b = self.Polygon.regular(5, 2, center=(1, 0.5), angle=17)
+        (shell, holes), = a.intersection(b)
+        assert shell.is_convex_known and shell.is_convex
+        # Matches the general algorithm
+        a._convex = False
+        (expected, holes), = a.intersection(b)
+        assert_equal(len(shell), len(expected))
+        for v in expected:
+            assert min((v - w).length for w in shell) < 1e-7
+
+    def test_difference(self):
+        self.assert_overlay_equal(
+            self.square(0, 0, 4).difference(self.square(1, 1, 2)),
+            [([(0, 0), (4, 0), (4, 4), (0, 4)], 
+                [[(3, 1), (1, 1), (1, 3), (3, 3)]])])
+        self.assert_overlay_equal(
+            self.square(0, 0, 4).difference(self.square(0, 1, 2)),
+            [([(0, 0), (4, 0), (4, 4), (0, 4), (0, 3), (2, 3), (2, 1), 
+                (0, 1)], [])])
+        assert_equal(self.square(1, 1, 2).difference(self.square(0, 0, 4)),
+            [])
+        self.assert_overlay_equal(
+            self.square(0, 0, 1).difference(self.square(5, 5, 1)),
+            [([(0, 0), (1, 0), (1, 1), (0, 1)], [])])
+
+    def test_symmetric_difference(self):
+        self.assert_overlay_equal(
+            self.square(0, 0, 2).symmetric_difference(self.square(1, 1, 2)),
+            [([(0, 0), (2, 0), (2, 1), (1, 1), (1, 2), (0, 2)], []),
+             ([(2, 2), (2, 1), (3, 1), (3, 3), (1, 3), (1, 2)], [])])
+        assert_equal(self.square(0, 0, 2).symmetric_difference(
+            self.square(0, 0, 2)), [])
+
+    def test_overlay_touching_hole(self):
+        # The triangle removed touches the corner of the square, leaving
+        # a hole touching the outside at a vertex
+        result = self.square(0, 0, 4).difference(
+            self.Polygon([(0, 0), (2, 1), (1, 2)]))
+        assert_equal(len(result), 1)
+        shell, holes = result[0]
+        assert shell.is_simple
+        assert_equal(sorted(map(tuple, shell)), 
+            [(0, 0), (0, 4), (4, 0), (4, 4)])
+        assert_equal(len(holes), 1)
+        assert holes[0].is_simple
+        assert_equal(sorted(map(tuple, holes[0])), [(0, 0), (1, 2), (2, 1)])
+
+    @raises(ValueError)
+    def test_overlay_bad_operation(self):
+        import planar
+        planar.overlay.overlay(
+            self.square(0, 0, 1), self.square(0, 0, 1), 'merge')
+
+    def test_overlay_matches_point_sampling(self):
+        import random
+        import numpy
+        from planar.overlay import _points_in_ring
+        rng = random.Random(7)
+        points = numpy.random.RandomState(7).uniform(-6, 16, (4000, 2))
+        def inside(polygon):
+            ring = numpy.array([tuple(v) for v in polygon])
+            return _points_in_ring(points, ring)
+        def random_polygon():
+            center = (rng.uniform(0, 10), rng.uniform(0, 10))
+            if rng.random() < 0.5:
+                return self.Polygon.star(rng.randint(2, 7), 
+                    rng.uniform(1, 6), rng.uniform(1, 6), center,
+                    rng.uniform(0, 360))
+            return self.square(rng.randint(0, 6), rng.randint(0, 6), 
+                rng.randint(1, 5))
+        operations = {
+            'union': lambda a, b: a | b,
+            'intersection': lambda a, b: a & b,
+            'difference': lambda a, b: a & ~b,
+            'symmetric_difference': lambda a, b: a ^ b}
+        for i in range(40):
+            a = random_polygon()
+            b = random_polygon()
+            a_inside = inside(a)
+            b_inside = inside(b)
+            for name, operation in operations.items():
+                result_inside = numpy.zeros(len(points), dtype=bool)
+                for shell, holes in getattr(a, name)(b):
+                    for ring in [shell] + holes:
+                        assert self.Polygon(list(ring)).is_simple
+                    shell_inside = inside(shell)
+                    for hole in holes:
+                        shell_inside &= ~inside(hole)
+                    result_inside |= shell_inside
+                assert_equal(result_inside.tolist(), 
+                    operation(a_inside, b_inside).tolist())
+
+    def test_intersects(self):
+        square = self.square(0, 0, 2)
+        assert square.intersects(self.square(1, 1, 2))
+        assert square.intersects(self.square(0.5, 0.5, 1))
+        assert self.square(0.5, 0.5, 1).intersects(square)
+        assert not square.intersects(self.square(3, 0, 1))
+        # Touching along an edge or at a vertex
+        assert square.intersects(self.square(2, 0.5, 1))
+        assert square.intersects(self.square(2, 2, 1))
+        # Overlapping bounding boxes, separated along a diagonal
+        triangle = self.Polygon([(3, 0), (3, 3), (0, 3)])
+        assert not self.Polygon([(0, 0), (2, 0), (0, 2)]).intersects(triangle)
+        assert self.Polygon([(0, 0), (4, 0), (0, 4)]).intersects(triangle)
+        assert self.Polygon([(0, 0), (3, 0), (0, 3)]).intersects(triangle)
+        # Clockwise winding
+        assert triangle.intersects(self.Polygon([(0, 0), (0, 4), (4, 0)]))
+
+    def test_intersects_concave(self):
+        star = self.Polygon.star(4, 1, 4)
+        assert star.intersects(self.square(-0.5, -0.5, 1))
+        assert star.intersects(self.square(2.5, 2.5, 1))
+        assert not star.intersects(self.square(2, -0.5, 1))
+        assert not self.square(2, -0.5, 1).intersects(star)
+        assert star.intersects(self.Polygon.star(4, 1, 4, (5.5, 0)))
+        assert not star.intersects(self.Polygon.star(4, 1, 4, (6, 0)))
+        # Touching at the tips of two peaks
+        assert star.intersects(
+            self.Polygon.star(4, 1, 4, (4 * math.sqrt(2), 0)))
+
+    def test_intersects_clockwise_collinear(self):
+        # Clockwise, with a straight vertex at (2, 1)
+        poly = self.Polygon([(0,0), (0,2), (2,2), (2,1), (2,0)])
+        tri = self.Polygon([(1.5,0.5), (3,0.5), (3,1.5)])
+        assert poly.intersects(tri)
+        assert tri.intersects(poly)
+        assert list(self.Polygon.polygons_intersect([poly], [tri])) == [True]
+        assert not poly.intersects(self.Polygon([(2.5,0.5), (3,0.5), (3,1.5)]))
+        # Collinear runs wrapping around the first vertex
+        poly = self.Polygon([(0,1), (0,2), (1,2), (2,2), (2,0), (0,0)])
+        assert poly.intersects(self.Polygon([(-1,1), (0.5,1.5), (-1,2)]))
+        assert not poly.intersects(
+            self.Polygon([(-1,1), (-0.5,1.5), (-1,2)]))
+
+    def test_polygons_intersect(self):
+        import random
+        rng = random.Random(11)
+        polygons = []
+        others = []
+        for i in range(200):
+            polygons.append(self.Polygon.regular(rng.randint(3, 8), 
+                rng.uniform(0.5, 2), (rng.uniform(0, 6), rng.uniform(0, 6)),
+                rng.uniform(0, 360)))
+            if rng.random() < 0.2:
+                others.append(self.Polygon.star(rng.randint(3, 6), 
+                    rng.uniform(0.5, 2), rng.uniform(0.5, 2), 
+                    (rng.uniform(0, 6), rng.uniform(0, 6))))
+            else:
+                others.append(self.square(rng.uniform(0, 6), 
+                    rng.uniform(0, 6), rng.uniform(0.1, 2)))
+        result = self.Polygon.polygons_intersect(polygons, others)
+        assert_equal(result.tolist(), 
+            [a.intersects(b) for a, b in zip(polygons, others)])
+        assert 0 < result.sum() < len(result)
+        assert_equal(
+            self.Polygon.polygons_intersect([], []).tolist(), [])
+
+    @raises(ValueError)
+    def test_polygons_intersect_mismatched(self):
+        self.Polygon.polygons_intersect([self.square(0, 0, 1)], [])
+
+    def test_clip_polygons_to_box(self):
+        import random
+        rng = random.Random(3)
+        box = self.BoundingBox([(0, 0), (10, 8)])
+        polys = []
+        for i in range(100):
+            center = (rng.uniform(-5, 15), rng.uniform(-5, 13))
+            if i % 2:
+                polys.append(self.Polygon.regular(rng.randint(3, 9), 
+                    rng.uniform(0.5, 6), center, rng.uniform(0, 360)))
+            else:
+                polys.append(self.Polygon.star(rng.randint(2, 7), 
+                    rng.uniform(1, 6), rng.uniform(1, 6), center, 
+                    rng.uniform(0, 360)))
+        clipped = self.Polygon.clip_polygons_to_box(polys, box)
+        assert_equal(len(clipped), len(polys))
+        for poly, result in zip(polys, clipped):
+            expected = poly.clip_to_box(box)
+            if expected is None:
+                assert result is None
+            else:
+                assert expected.almost_equals(result), (expected, result)
+                assert_equal(result.is_convex, expected.is_convex)
+        assert_equal(self.Polygon.clip_polygons_to_box([], box), [])
+
 
 class PyPolygonTestCase(PolygonBaseTestCase, unittest.TestCase):
     from planar.vector import Vec2, Seq2
@@ -328,6 +328,73 @@ class AffineBaseTestCase(object):
         t = self.Affine(1,2,3,4,5,6)
         seq_almost_equal(~t * t,  self.Affine.identity())
     
+    def test_rotation_memoized(self):
+        r = self.Affine.rotation(33.5)
+        assert self.Affine.rotation(33.5) is r
+        r = self.Affine.rotation(12, (1, 2))
+        assert self.Affine.rotation(12, self.Vec2(1, 2)) is r
+        assert self.Affine.rotation(12, [1, 2]) is r
+        assert self.Affine.rotation(12, (2, 1)) is not r
+        assert (self.Vec2(2, 1) * self.Affine.rotation(12, (2, 1))
+            ).almost_equals((2, 1))
+
+    def test_kind(self):
+        A = self.Affine
+        assert_equal(A.identity()._kind, 'identity')
+        assert_equal(A.translation((1, 0))._kind, 'translation')
+        assert_equal(A.scale((2, -1))._kind, 'scale')
+        assert_equal((A.translation((1, 2)) * A.scale(3))._kind, 
+            'rectilinear')
+        assert_equal(A.rotation(90)._kind, 'rectilinear')
+        assert_equal(A.rotation(1)._kind, 'general')
+        assert_equal(A.shear(10)._kind, 'general')
+
+    def test_itransform_kernels_match_general(self):
+        from planar import Vec2Array
+        A = self.Affine
+        V = self.Vec2
+        pts = [V(4,1), V(-1,0), V(3,2.5)]
+        for t in [A.identity(), A.translation((2, -3)), A.scale((2, -0.5)),
+            A.translation((1, 2)) * A.scale(3), 
+            A.translation((1, 2)) * A.rotation(270), A.rotation(12)]:
+            a, b, c, d, e, f, _, _, _ = t
+            expected = [V(x*a + y*d + c, x*b + y*e + f) for x, y in pts]
+            seq = list(pts)
+            t.itransform(seq)
+            assert_equal(seq, expected)
+            assert_equal([V(*t._point_kernel(*p)) for p in pts], expected)
+            assert_equal(list(Vec2Array(pts) * t), expected)
+
+    def test_transform_bbox_polygon(self):
+        from planar import Polygon
+        poly = Polygon([(0, 0), (3, 1), (2, 4), (-1, 2)])
+        for t in (self.Affine.identity(), self.Affine.translation((2, -1)),
+            self.Affine.scale((-2, 3)), self.Affine.rotation(90),
+            self.Affine.rotation(33, (1, 1)), self.Affine.shear(10, 20)):
+            bbox = t.transform_bbox(poly)
+            assert bbox.almost_equals((poly * t).bounding_box), (t, bbox)
+
+    def test_transform_bbox_points(self):
+        V = self.Vec2
+        t = self.Affine.rotation(45)
+        pts = [V(1, 0), V(0, 1), V(-1, 0)]
+        bbox = t.transform_bbox(pts)
+        assert bbox.min_point.almost_equals(
+            (-math.sqrt(0.5), -math.sqrt(0.5)))
+        assert bbox.max_point.almost_equals((math.sqrt(0.5), math.sqrt(0.5)))
+
+    def test_transform_bbox_box(self):
+        from planar import BoundingBox
+        box = BoundingBox([(0, 0), (2, 1)])
+        t = self.Affine.scale((2, -1))
+        assert_equal(t.transform_bbox(box), box * t)
+        t = self.Affine.rotation(30)
+        assert t.transform_bbox(box).almost_equals((box * t).bounding_box)
+
+    @raises(ValueError)
+    def test_transform_bbox_no_points(self):
+        self.Affine.rotation(30).transform_bbox([])
+
     def test_cant_invert_degenerate(self):
         from planar import TransformNotInvertibleError
         t = self.Affine.scale(0)
@@ -359,6 +426,148 @@ class CAffineTestCase(AffineBaseTestCase, unittest.TestCase):
     from planar.c import Affine, Vec2
 
 
+class AffineArrayTestCase(unittest.TestCase):
+    from planar.transform import Affine, AffineArray
+    from planar.vector import Vec2, Vec2Array
+    from planar.polygon import Polygon
+
+    def transforms(self):
+        A = self.Affine
+        return [A.translation((2, -3)), A.rotation(33.3, (1, 2)), 
+            A.scale((2, 0.5)), A.shear(10, -20), A(1, 2, 3, 4, 5, 6)]
+
+    def test_from_transforms(self):
+        ts = self.transforms()
+        a = self.AffineArray(ts)
+        assert_equal(len(a), 5)
+        assert_equal(a.matrices.shape, (5, 2, 3))
+        for t, at in zip(ts, a):
+            assert isinstance(at, self.Affine)
+            assert_equal(at, t)
+            assert all(type(member) is float for member in at)
+        assert_equal(a[1], ts[1])
+        assert_equal(repr(a[1]), repr(ts[1]))
+
+    @raises(ValueError)
+    def test_wrong_shape(self):
+        self.AffineArray([(1, 2, 3)])
+
+    def test_constructors_match_affine(self):
+        A = self.Affine
+        AA = self.AffineArray
+        for t, at in zip([A.translation((1, 2)), A.translation((-3, 4))],
+            AA.translation([(1, 2), (-3, 4)])):
+            assert_equal(at, t)
+        for t, at in zip([A.scale(2), A.scale((3, -1))], 
+            AA.scale([(2, 2), (3, -1)])):
+            assert_equal(at, t)
+        for t, at in zip([A.scale(2), A.scale(0.5)], AA.scale([2, 0.5])):
+            assert_equal(at, t)
+        for t, at in zip([A.shear(10, -20), A.shear(0, 5)], 
+            AA.shear([10, 0], [-20, 5])):
+            seq_almost_equal(at, t)
+        for t, at in zip([A.rotation(90), A.rotation(-26, (2, 1))],
+            AA.rotation([90, -26], [(0, 0), (2, 1)])):
+            seq_almost_equal(at, t)
+        assert_equal(AA.rotation([90, 180])[0], A.rotation(90))
+        assert_equal(list(AA.identity(2)), [A.identity()] * 2)
+
+    def test_compose(self):
+        ts = self.transforms()
+        rs = list(reversed(ts))
+        composed = self.AffineArray(ts) * self.AffineArray(rs)
+        assert isinstance(composed, self.AffineArray)
+        for t, r, c in zip(ts, rs, composed):
+            seq_almost_equal(c, t * r)
+
+    def test_compose_broadcast(self):
+        ts = self.transforms()
+        r = self.Affine.rotation(17)
+        for t, c in zip(ts, self.AffineArray(ts) * r):
+            seq_almost_equal(c, t * r)
+        for t, c in zip(ts, r * self.AffineArray(ts)):
+            seq_almost_equal(c, r * t)
+        for t, c in zip(ts, self.AffineArray([r]) * self.AffineArray(ts)):
+            seq_almost_equal(c, r * t)
+
+    def test_transform_points_kernels(self):
+        AA = self.AffineArray
+        pts = [(0, 0), (1, 2), (-3, 0.5)]
+        for a in (AA.translation([(1, 2), (-3, 4)]), AA.scale([2, -1]),
+            AA.translation([(1, 2)]) * AA.scale([(2, 3), (-1, 1)])):
+            result = a.transform_points(pts)
+            for i, t in enumerate(a):
+                for j, p in enumerate(pts):
+                    assert_equal(tuple(result[i, j]), self.Vec2(*p) * t)
+
+    def test_invert(self):
+        ts = self.transforms()
+        inverted = ~self.AffineArray(ts)
+        for t, inv in zip(ts, inverted):
+            seq_almost_equal(inv, ~t)
+        assert (inverted * self.AffineArray(ts)).almost_equals(
+            self.AffineArray.identity(len(ts)))
+
+    def test_cant_invert_degenerate(self):
+        from planar import TransformNotInvertibleError
+        a = self.AffineArray([self.Affine.identity(), self.Affine.scale(0)])
+        assert_equal(list(a.is_degenerate), [False, True])
+        self.assertRaises(TransformNotInvertibleError, lambda: ~a)
+
+    def test_transform_points(self):
+        ts = self.transforms()
+        pts = [(0, 0), (1, 2), (-3, 0.5)]
+        result = self.AffineArray(ts).transform_points(pts)
+        assert_equal(result.shape, (5, 3, 2))
+        for i, t in enumerate(ts):
+            for j, p in enumerate(pts):
+                seq_almost_equal(result[i, j], self.Vec2(*p) * t)
+
+    def test_transform_shapes(self):
+        ts = self.transforms()
+        shapes = [self.Vec2(1, 2), self.Vec2Array([(0, 0), (1, 1)]),
+            self.Polygon([(0, 0), (2, 0), (1, 1)]), self.Vec2(-1, 3),
+            self.Polygon.regular(5, 2)]
+        results = self.AffineArray(ts).transform_shapes(shapes)
+        for shape, t, result in zip(shapes, ts, results):
+            assert_equal(type(result), type(shape))
+            expected = shape * t
+            if isinstance(shape, self.Vec2):
+                assert result.almost_equals(expected)
+            else:
+                for v, ev in zip(result, expected):
+                    assert v.almost_equals(ev)
+
+    def test_transform_shapes_empty_array(self):
+        t = self.Affine.translation((1, 1))
+        results = self.AffineArray([t, t, t]).transform_shapes(
+            [self.Vec2Array([]), self.Vec2(1, 1), self.Vec2Array([(0, 2)])])
+        assert_equal(type(results[0]), self.Vec2Array)
+        assert_equal(len(results[0]), 0)
+        assert_equal(results[1], self.Vec2(2, 2))
+        assert_equal(tuple(results[2]), (self.Vec2(1, 3),))
+        results = self.AffineArray([t]).transform_shapes([self.Vec2Array([])])
+        assert_equal(len(results[0]), 0)
+
+    def test_transform_shapes_bbox(self):
+        from planar import BoundingBox
+        box = BoundingBox([(0, 0), (2, 1)])
+        ts = [self.Affine.rotation(30), self.Affine.translation((1, 2))]
+        results = self.AffineArray(ts).transform_shapes(
+            [box, self.Vec2(1, 0)])
+        # A rotated box is a polygon, not the box around two corners
+        expected = box * ts[0]
+        assert_equal(type(results[0]), type(expected))
+        for v, ev in zip(results[0], expected):
+            assert v.almost_equals(ev)
+        assert results[1].almost_equals(self.Vec2(2, 2))
+
+    @raises(ValueError)
+    def test_transform_shapes_wrong_count(self):
+        self.AffineArray(self.transforms()).transform_shapes(
+            [self.Vec2(0, 0)])
+
+
 if __name__ == '__main__':
     unittest.main()
 
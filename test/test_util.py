@@ -1,4 +1,6 @@
 
+import math
+
 def test_cached_property():
     from planar.util import cached_property
 
@@ -42,5 +44,28 @@ def test_cached_property():
     assert cached_value == thing.cached
     assert thing.cached_calls == 1
 
+def test_cos_sin_deg():
+    from planar.util import cos_sin_deg
+    assert cos_sin_deg(90) == (0.0, 1.0)
+    assert cos_sin_deg(-90) == (0, -1.0)
+    assert cos_sin_deg(540) == (-1.0, 0)
+    c, s = cos_sin_deg(30)
+    assert abs(c - math.cos(math.radians(30))) < 1e-15
+    assert abs(s - 0.5) < 1e-15
+    # memoized results are the same
+    assert cos_sin_deg(30) == (c, s)
+
+def test_cos_sin_deg_unhashable():
+    import numpy
+    from planar.util import cos_sin_deg
+    assert cos_sin_deg(numpy.array(90.0)) == (0.0, 1.0)
+
+def test_cos_sin_deg_array():
+    from planar.util import cos_sin_deg, cos_sin_deg_array
+    angles = [0, 30, 90, 180, 270, -45.5, 400]
+    cos, sin = cos_sin_deg_array(angles)
+    for angle, c, s in zip(angles, cos, sin):
+        assert (c, s) == cos_sin_deg(angle)
+
 # vim: ai ts=4 sts=4 et sw=4 tw=78
 
@@ -627,6 +627,20 @@ class Vec2ArrayBaseTestCase(object):
         for i in range(10000):
             assert_equal(va[i], self.Vec2(-i, i))
 
+    def test_from_polar(self):
+        angles = [0, 30, 90, 180, 270, -45.5, 400]
+        va = self.Vec2Array.from_polar(angles, 2)
+        assert isinstance(va, self.Vec2Array)
+        assert_equal(len(va), len(angles))
+        for angle, v in zip(angles, va):
+            assert isinstance(v, self.Vec2)
+            assert_equal(v, self.Vec2.polar(angle, 2))
+
+    def test_from_polar_lengths(self):
+        va = self.Vec2Array.from_polar([0, 90, 225], [1, 2, 3])
+        for v, (angle, length) in zip(va, [(0, 1), (90, 2), (225, 3)]):
+            assert_equal(v, self.Vec2.polar(angle, length))
+
     def test_extend(self):
         va = self.Vec2Array()
         assert_equal(tuple(va), ())
@@ -816,6 +830,32 @@ class Vec2ArrayBaseTestCase(object):
             (self.Vec2(0,0), self.Vec2(2,1), 
              self.Vec2(-1,0), self.Vec2(4,4)))
 
+    def test_simplified(self):
+        va = self.Vec2Array([(0,0), (1,0.05), (2,0), (3,0.05), (4,0), (4,3)])
+        assert_equal(tuple(va.simplified(0.1)), 
+            (self.Vec2(0,0), self.Vec2(4,0), self.Vec2(4,3)))
+        assert_equal(tuple(va.simplified(0.01)), tuple(va))
+        assert_equal(tuple(va.simplified(0.5, 'visvalingam_whyatt')), 
+            (self.Vec2(0,0), self.Vec2(4,0), self.Vec2(4,3)))
+        assert_equal(tuple(va.simplified(100)), 
+            (self.Vec2(0,0), self.Vec2(4,3)))
+        assert_equal(tuple(self.Vec2Array().simplified(1)), ())
+        assert_equal(tuple(self.Vec2Array([(1,2)]).simplified(1)), 
+            (self.Vec2(1,2),))
+
+    def test_simplified_preserve_topology(self):
+        # Removing the dip at (5,-0.8) moves the first edge above the
+        # tip of the spike at (5,-0.4)
+        va = self.Vec2Array([(0,0), (4,0), (5,-0.8), (6,0), (10,0), 
+            (10,10), (5.1,10), (5,-0.4), (4.9,10)])
+        assert self.Vec2(5,-0.8) not in tuple(va.simplified(1))
+        assert self.Vec2(5,-0.8) in tuple(
+            va.simplified(1, preserve_topology=True))
+
+    @raises(ValueError)
+    def test_simplified_bad_method(self):
+        self.Vec2Array([(0,0), (1,1), (2,0)]).simplified(1, 'bezier')
+
     def test_longest(self):
         va = self.Vec2Array()
         assert_equal(va.longest(), None)